@@ -7,8 +7,14 @@
 # 🚀 CONFIGURATION
 # =============================================================================
 
-# Apps that should always float (unmanaged)
-FLOATING_APPS=(
+# Apps that should always float (unmanaged) are the window_rules "float"
+# class in configs/app_classes.yaml, classified by nexus.core.app_classifier
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+NEXUS_SRC="$SCRIPT_DIR/../../src"
+
+# Used only when the classifier can't run (no python3 or PyYAML);
+# keep in step with window_rules in configs/app_classes.yaml
+FALLBACK_FLOATING_APPS=(
     "Terminal"
     "Finder"
     "iTerm2"
@@ -31,25 +37,38 @@ MIN_WINDOWS_FOR_ARRANGEMENT=3
 # 🔧 FUNCTIONS
 # =============================================================================
 
-# Check if an app should float
-should_float() {
-    local app_name="$1"
-    for floating_app in "${FLOATING_APPS[@]}"; do
-        if [[ "$app_name" == "$floating_app" ]]; then
-            return 0  # true
-        fi
-    done
-    return 1  # false
+app_classifier() {
+    PYTHONPATH="$NEXUS_SRC${PYTHONPATH:+:$PYTHONPATH}" python3 -m nexus.core.app_classifier "$@"
+}
+
+classifier_unavailable() {
+    echo "❌ App classifier unavailable (needs python3 with PyYAML); using the built-in floating app list" >&2
+}
+
+# Apps that should float, one per line
+floating_apps() {
+    if ! app_classifier names window_rules float; then
+        classifier_unavailable
+        printf '%s\n' "${FALLBACK_FLOATING_APPS[@]}"
+    fi
+}
+
+# Filter app names on stdin down to the managed (non-floating) ones, in one pass
+managed_apps() {
+    local apps
+    apps="$(cat)"
+    [[ -z "$apps" ]] && return 0
+    if ! printf '%s\n' "$apps" | app_classifier filter window_rules float --invert; then
+        classifier_unavailable
+        printf '%s\n' "$apps" | grep -ivxF -f <(printf '%s\n' "${FALLBACK_FLOATING_APPS[@]}")
+    fi
 }
 
 # Get managed windows count for a display
 get_managed_windows_count() {
     local display_id="$1"
-    yabai -m query --windows --display "$display_id" | jq -r '.[] | select(.app != null) | .app' | while read app_name; do
-        if ! should_float "$app_name"; then
-            echo "1"
-        fi
-    done | wc -l
+    yabai -m query --windows --display "$display_id" | jq -r '.[] | select(.app != null) | .app' \
+        | managed_apps | grep -c .
 }
 
 # Arrange windows on a display if needed
@@ -84,7 +103,7 @@ arrange_all_displays() {
 setup_floating_windows() {
     echo "🪟 Setting up floating window rules..."
     
-    for app_name in "${FLOATING_APPS[@]}"; do
+    floating_apps | while IFS= read -r app_name; do
         yabai -m rule --add app="$app_name" manage=off
         echo "  ✅ $app_name set to float"
     done
@@ -130,7 +149,7 @@ main() {
     arrange_all_displays
     
     echo "✅ Auto Window Arranger ready!"
-    echo "📋 Floating apps: ${FLOATING_APPS[*]}"
+    echo "📋 Floating apps: $(floating_apps | paste -sd ' ' -)"
     echo "🔢 Arrangement threshold: $MIN_WINDOWS_FOR_ARRANGEMENT windows"
     echo "🔄 Run 'arrange_all_displays' to manually arrange all displays"
 }
@@ -8,10 +8,17 @@ import subprocess
 import json
 import time
 import os
+import sys
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+# Make the NEXUS package importable when run as a standalone script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src"))
+
+from nexus.core.yabai import YabaiClient, YabaiError
+from nexus.core.workspace_model import WorkspaceModel
+
 @dataclass
 class WindowInfo:
     id: int
@@ -35,37 +42,40 @@ class SpaceInfo:
 class YABAIAutomationBridge:
     """Bridge YABAI with macOS automation tools for 100% functionality"""
     
-    def __init__(self):
+    def __init__(self, model: Optional[WorkspaceModel] = None):
+        self.model = model
         self.yabai_path = "/opt/homebrew/bin/yabai"
         self.applescript_path = "/usr/bin/osascript"
         self.btt_path = "/Applications/BetterTouchTool.app"
         self.km_path = "/Applications/Keyboard Maestro.app"
+        self.yabai = YabaiClient(yabai_path=self.yabai_path, timeout=5)
         
     def get_windows(self) -> List[WindowInfo]:
         """Get all windows from YABAI"""
         try:
-            result = subprocess.run(
-                [self.yabai_path, "-m", "query", "--windows"],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                windows_data = json.loads(result.stdout)
-                return [WindowInfo(**window) for window in windows_data]
-        except Exception as e:
+            return [
+                WindowInfo(
+                    id=w.id, app=w.app, title=w.title, space=w.space,
+                    display=w.display, frame=w.frame,
+                    has_focus=w.has_focus, is_visible=w.is_visible
+                )
+                for w in self.yabai.query_windows()
+            ]
+        except YabaiError as e:
             print(f"Error getting windows: {e}")
         return []
     
     def get_spaces(self) -> List[SpaceInfo]:
         """Get all spaces from YABAI"""
         try:
-            result = subprocess.run(
-                [self.yabai_path, "-m", "query", "--spaces"],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                spaces_data = json.loads(result.stdout)
-                return [SpaceInfo(**space) for space in spaces_data]
-        except Exception as e:
+            return [
+                SpaceInfo(
+                    id=s.id, index=s.index, type=s.type, display=s.display,
+                    windows=s.windows, has_focus=s.has_focus
+                )
+                for s in self.yabai.query_spaces()
+            ]
+        except YabaiError as e:
             print(f"Error getting spaces: {e}")
         return []
     
@@ -223,19 +233,20 @@ class YABAIAutomationBridge:
     
     def intelligent_window_arrangement(self) -> bool:
         """Use AI to intelligently arrange windows based on context"""
-        windows = self.get_windows()
-        spaces = self.get_spaces()
-        
-        # Analyze current workspace context
-        active_apps = [w.app for w in windows if w.is_visible]
+        if self.model:
+            # Live model answers visibility checks without querying yabai
+            is_active = self.model.is_app_visible
+        else:
+            active_apps = {w.app for w in self.get_windows() if w.is_visible}
+            is_active = active_apps.__contains__
         
         # Apply intelligent layout rules
-        if "Cursor" in active_apps and "Finder" in active_apps:
+        if is_active("Cursor") and is_active("Finder"):
             # Development workspace: Code editor + file browser
             print("🎯 Applying development workspace layout")
             # Could integrate with NEXUS AI for optimal arrangement
             
-        elif "LM Studio" in active_apps and "ChatGPT" in active_apps:
+        elif is_active("LM Studio") and is_active("ChatGPT"):
             # AI workspace: Model + chat interface
             print("🤖 Applying AI workspace layout")
             
@@ -7,8 +7,18 @@ __version__ = "2.0.0"
 __author__ = "NEXUS Team"
 __email__ = "team@nexus-workspace.com"
 
-from .core import DynamicLayoutManager
-
 __all__ = [
     "DynamicLayoutManager",
 ]
+
+
+def __getattr__(name):
+    # Imported on first use so `nexus version` and `--help` stay cheap
+    if name == "DynamicLayoutManager":
+        from .core.dynamic_layout_manager import DynamicLayoutManager
+        return DynamicLayoutManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
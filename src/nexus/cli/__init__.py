@@ -1,9 +1,17 @@
 """Command line interface modules."""
 
-from .main import main
-from .ai_optimize import AIWorkspaceOptimizer, main as ai_optimize_main
-from .profile_switcher import ProfileSwitcher, main as profile_switcher_main
-from .quick_menu import QuickMenu, main as quick_menu_main
+import importlib
+
+# name -> (module, attribute); modules load on first access
+_LAZY = {
+    "main": (".main", "main"),
+    "AIWorkspaceOptimizer": (".ai_optimize", "AIWorkspaceOptimizer"),
+    "ai_optimize_main": (".ai_optimize", "main"),
+    "ProfileSwitcher": (".profile_switcher", "ProfileSwitcher"),
+    "profile_switcher_main": (".profile_switcher", "main"),
+    "QuickMenu": (".quick_menu", "QuickMenu"),
+    "quick_menu_main": (".quick_menu", "main"),
+}
 
 __all__ = [
     "main",
@@ -14,3 +22,14 @@ __all__ = [
     "QuickMenu",
     "quick_menu_main"
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module, attribute = _LAZY[name]
+        return getattr(importlib.import_module(module, __name__), attribute)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
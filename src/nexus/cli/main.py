@@ -14,7 +14,6 @@ from typing import Optional
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from nexus.core import DynamicLayoutManager
 from nexus.utils.logger import setup_logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +29,8 @@ Examples:
   nexus optimize                  # Optimize current workspace
   nexus profile list             # List available profiles
   nexus profile switch work      # Switch to work profile
+  nexus swap left terminal       # Swap a tool onto a display
+  nexus daemon start             # Run nexusd for near-instant commands
   nexus layout save              # Save current layout
   nexus layout restore default   # Restore default layout
         """
@@ -62,6 +63,19 @@ Examples:
     restore_parser = layout_subparsers.add_parser('restore', help='Restore a saved layout')
     restore_parser.add_argument('name', help='Name of layout to restore')
     
+    # Swap command
+    swap_parser = subparsers.add_parser('swap', help='Swap a tool onto a display')
+    swap_parser.add_argument('display', help='Display name (left, center, right)')
+    swap_parser.add_argument('tool', help='Tool key (e.g. code_editor, terminal)')
+    
+    # Daemon commands
+    daemon_parser = subparsers.add_parser('daemon', help='Resident daemon (nexusd)')
+    daemon_subparsers = daemon_parser.add_subparsers(dest='daemon_action', help='Daemon actions')
+    daemon_subparsers.add_parser('start', help='Run nexusd in the foreground')
+    daemon_subparsers.add_parser('stop', help='Stop a running nexusd')
+    daemon_subparsers.add_parser('status', help='Show whether nexusd is running')
+    daemon_subparsers.add_parser('ping', help='Check that nexusd answers')
+    
     # Optimize command
     optimize_parser = subparsers.add_parser('optimize', help='Optimize workspace')
     optimize_parser.add_argument('--ai', action='store_true', help='Use AI-powered optimization')
@@ -79,9 +93,13 @@ Examples:
         if args.command == 'status':
             show_status(args.verbose)
         elif args.command == 'profile':
-            handle_profile_command(args)
+            sys.exit(handle_profile_command(args))
         elif args.command == 'layout':
             handle_layout_command(args)
+        elif args.command == 'swap':
+            handle_swap_command(args)
+        elif args.command == 'daemon':
+            handle_daemon_command(args)
         elif args.command == 'optimize':
             handle_optimize_command(args)
         elif args.command == 'version':
@@ -104,10 +122,12 @@ def show_status(verbose: bool = False):
     
     try:
         # Initialize core components
+        from nexus.core.dynamic_layout_manager import DynamicLayoutManager
         layout_manager = DynamicLayoutManager()
         
         print(f"✅ Core System: Active")
         print(f"✅ Layout Manager: {layout_manager.__class__.__name__}")
+        show_yabai_health(layout_manager.yabai, verbose)
         
         if verbose:
             print(f"✅ Python Version: {sys.version}")
@@ -118,8 +138,30 @@ def show_status(verbose: bool = False):
     
     print("\nUse 'nexus --help' for available commands")
 
-def handle_profile_command(args):
-    """Handle profile-related commands."""
+def show_yabai_health(client, verbose: bool = False):
+    """Print yabai availability and circuit-breaker state, preferring nexusd's view"""
+    from nexus.daemon.client import NexusClient, DaemonUnavailable, RemoteError
+    try:
+        health = NexusClient().call("status").get("yabai")
+        source = "nexusd"
+    except (DaemonUnavailable, RemoteError):
+        health = None
+    if not health:
+        client.is_available()
+        health, source = client.health, "local"
+    
+    available = health["state"] == "closed" and not health.get("failures")
+    icon = "✅" if available else "⚠️" if health["state"] == "half_open" else "❌"
+    print(f"{icon} YABAI: {'Available' if available else 'Unavailable'} "
+          f"(circuit {health['state']}, {source})")
+    if health.get("last_error") and (verbose or not available):
+        print(f"   Last error: {health['last_error']}")
+    if verbose and health["state"] != "closed":
+        print(f"   Open for {health['open_for']}s, next probe in {health['next_probe_in']}s, "
+              f"{health['short_circuits']} calls short-circuited")
+
+def handle_profile_command(args) -> int:
+    """Handle profile-related commands; returns the exit status."""
     if args.profile_action == 'list':
         print("📋 Available Profiles:")
         print("=" * 20)
@@ -133,20 +175,80 @@ def handle_profile_command(args):
             
     elif args.profile_action == 'switch':
         print(f"🔄 Switching to profile: {args.profile_name}")
-        # TODO: Implement profile switching logic
-        print("Profile switching feature coming soon...")
+        from nexus.daemon.client import NexusClient, DaemonUnavailable
+        try:
+            success = NexusClient().call("profile.switch", profile_name=args.profile_name, force=args.force)
+        except DaemonUnavailable:
+            from nexus.cli.profile_switcher import ProfileSwitcher
+            success = ProfileSwitcher().switch_profile(args.profile_name, force=args.force)
+        else:
+            # nexusd printed the switcher's messages to its own stdout
+            if success:
+                print(f"✅ Successfully switched to profile: {args.profile_name}")
+            else:
+                print(f"❌ Failed to switch profile: {args.profile_name}")
+        return 0 if success else 1
+    
+    return 0
+
+def handle_swap_command(args):
+    """Swap a tool onto a display, through nexusd when it is running."""
+    from nexus.daemon.client import NexusClient, DaemonUnavailable
+    try:
+        success = NexusClient().call("swap", display=args.display, tool=args.tool)
+    except DaemonUnavailable:
+        from nexus.core.dynamic_layout_manager import DynamicLayoutManager
+        success = DynamicLayoutManager().swap_tool(args.display, args.tool)
+    print("✅ Success" if success else "❌ Failed")
+
+def handle_daemon_command(args):
+    """Handle nexusd commands."""
+    from nexus.daemon.client import NexusClient, DaemonUnavailable
+    client = NexusClient()
+    
+    if args.daemon_action == 'start':
+        from nexus.daemon.server import NexusDaemon
+        print(f"🚀 Starting nexusd on {client.socket_path}")
+        NexusDaemon(client.socket_path).serve_forever()
+        
+    elif args.daemon_action == 'stop':
+        try:
+            client.call("shutdown")
+            print("✅ nexusd stopped")
+        except DaemonUnavailable:
+            print("ℹ️ nexusd is not running")
+            
+    elif args.daemon_action in ('status', 'ping'):
+        try:
+            status = client.call("status")
+            print(f"✅ nexusd running (pid {status['pid']}, profile {status['profile']}, "
+                  f"{status['display_count']} displays)")
+        except DaemonUnavailable:
+            print("❌ nexusd is not running")
 
 def handle_layout_command(args):
     """Handle layout-related commands."""
+    from nexus.core.layout_reconciler import LayoutReconciler, load_layout, save_layout
+    
+    layouts_dir = project_root / "configs" / "layouts"
+    layout_file = layouts_dir / f"{args.name}.json"
+    
     if args.layout_action == 'save':
         print(f"💾 Saving layout: {args.name}")
-        # TODO: Implement layout saving logic
-        print("Layout saving feature coming soon...")
+        snapshot = LayoutReconciler().capture(args.name)
+        save_layout(snapshot, layout_file)
+        print(f"✅ Saved {len(snapshot.windows)} windows to {layout_file}")
         
     elif args.layout_action == 'restore':
         print(f"🔄 Restoring layout: {args.name}")
-        # TODO: Implement layout restoration logic
-        print("Layout restoration feature coming soon...")
+        if not layout_file.exists():
+            print(f"❌ Layout not found: {layout_file}")
+            return
+        results = LayoutReconciler().restore(load_layout(layout_file))
+        failed = [r for r in results if not r.success]
+        print(f"✅ Applied {len(results) - len(failed)}/{len(results)} layout changes")
+        for result in failed:
+            print(f"  ⚠️ {' '.join(result.command)}: {result.error}")
 
 def handle_optimize_command(args):
     """Handle optimization commands."""
@@ -8,7 +8,6 @@ import argparse
 import sys
 import logging
 import json
-import subprocess
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -16,10 +15,14 @@ from typing import Dict, Any, List, Optional
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from nexus.utils.logger import setup_logging
+from nexus.core.command_runner import run_command
+from nexus.utils.logger import log_operation, setup_logging
 
 logger = logging.getLogger(__name__)
 
+# Profile scripts launch apps; give them longer than a single command
+PROFILE_SCRIPT_TIMEOUT = 60.0
+
 class ProfileSwitcher:
     """Profile management and switching engine."""
     
@@ -107,53 +110,59 @@ class ProfileSwitcher:
     
     def switch_profile(self, profile_name: str, force: bool = False) -> bool:
         """Switch to a specific profile."""
-        try:
-            print(f"🔄 Switching to profile: {profile_name}")
-            
-            # Validate profile exists
-            available_profiles = self.get_available_profiles()
-            if profile_name not in available_profiles:
-                print(f"❌ Profile '{profile_name}' not found.")
-                print(f"Available profiles: {', '.join(available_profiles)}")
-                return False
-            
-            # Check if already on this profile
-            current_profile = self.get_current_profile()
-            if current_profile == profile_name and not force:
-                print(f"✅ Already on profile: {profile_name}")
+        with log_operation("switch_profile", profile=profile_name, force=force) as op:
+            try:
+                print(f"🔄 Switching to profile: {profile_name}")
+                
+                # Validate profile exists
+                available_profiles = self.get_available_profiles()
+                if profile_name not in available_profiles:
+                    print(f"❌ Profile '{profile_name}' not found.")
+                    print(f"Available profiles: {', '.join(available_profiles)}")
+                    op["outcome"] = "not_found"
+                    return False
+                
+                # Check if already on this profile
+                current_profile = self.get_current_profile()
+                if current_profile == profile_name and not force:
+                    print(f"✅ Already on profile: {profile_name}")
+                    op["outcome"] = "unchanged"
+                    return True
+                
+                # Execute profile script if it exists
+                profile_script = self.profiles_dir / f"{profile_name}.sh"
+                if profile_script.exists():
+                    print(f"📜 Executing profile script: {profile_script}")
+                    try:
+                        result = run_command(
+                            [str(profile_script)],
+                            name="profile_script",
+                            timeout=PROFILE_SCRIPT_TIMEOUT,
+                            cwd=str(project_root)
+                        )
+                        if result.ok:
+                            print(f"✅ Profile script executed successfully")
+                        else:
+                            print(f"⚠️  Profile script had issues: {result.error}")
+                            op["script_returncode"] = result.returncode
+                    except Exception as e:
+                        logger.warning(f"Could not execute profile script: {e}")
+                
+                # Update current profile
+                self.set_current_profile(profile_name)
+                
+                # Apply profile-specific settings
+                self.apply_profile_settings(profile_name)
+                
+                print(f"✅ Successfully switched to profile: {profile_name}")
                 return True
-            
-            # Execute profile script if it exists
-            profile_script = self.profiles_dir / f"{profile_name}.sh"
-            if profile_script.exists():
-                print(f"📜 Executing profile script: {profile_script}")
-                try:
-                    result = subprocess.run(
-                        [str(profile_script)],
-                        capture_output=True,
-                        text=True,
-                        cwd=project_root
-                    )
-                    if result.returncode == 0:
-                        print(f"✅ Profile script executed successfully")
-                    else:
-                        print(f"⚠️  Profile script had issues: {result.stderr}")
-                except Exception as e:
-                    logger.warning(f"Could not execute profile script: {e}")
-            
-            # Update current profile
-            self.set_current_profile(profile_name)
-            
-            # Apply profile-specific settings
-            self.apply_profile_settings(profile_name)
-            
-            print(f"✅ Successfully switched to profile: {profile_name}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error switching profile: {e}")
-            print(f"❌ Failed to switch profile: {e}")
-            return False
+                
+            except Exception as e:
+                logger.error(f"Error switching profile: {e}")
+                print(f"❌ Failed to switch profile: {e}")
+                op["outcome"] = "error"
+                op["error"] = str(e)
+                return False
     
     def set_current_profile(self, profile_name: str):
         """Set the current active profile."""
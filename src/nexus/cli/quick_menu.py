@@ -8,7 +8,6 @@ import argparse
 import sys
 import logging
 import os
-import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -353,23 +352,13 @@ class QuickMenu:
     def save_layout(self, name: str) -> bool:
         """Save current layout."""
         try:
-            layouts_dir = project_root / "configs" / "layouts"
-            layouts_dir.mkdir(parents=True, exist_ok=True)
+            from nexus.core.layout_reconciler import LayoutReconciler, save_layout
             
-            # TODO: Implement actual layout capture
-            # This would capture current window positions, sizes, and arrangements
+            layouts_dir = project_root / "configs" / "layouts"
             
-            layout_data = {
-                "name": name,
-                "timestamp": "2025-08-26T21:00:00Z",
-                "profile": "ai_development_profile",
-                "displays": 2,
-                "windows": []
-            }
-            
-            layout_file = layouts_dir / f"{name}.json"
-            with open(layout_file, 'w') as f:
-                json.dump(layout_data, f, indent=2)
+            # Capture window displays, spaces, frames and float state
+            snapshot = LayoutReconciler().capture(name, profile=os.environ.get('NEXUS_CURRENT_PROFILE'))
+            save_layout(snapshot, layouts_dir / f"{name}.json")
             
             return True
         except Exception as e:
@@ -385,10 +374,15 @@ class QuickMenu:
             if not layout_file.exists():
                 return False
             
-            # TODO: Implement actual layout restoration
-            # This would restore window positions, sizes, and arrangements
+            from nexus.core.layout_reconciler import LayoutReconciler, load_layout
             
-            return True
+            # Only windows that differ from the saved layout are touched
+            results = LayoutReconciler().restore(load_layout(layout_file))
+            failed = [r for r in results if not r.success]
+            for result in failed:
+                logger.warning(f"Layout command failed: {' '.join(result.command)}: {result.error}")
+            
+            return not failed
         except Exception as e:
             logger.error(f"Error restoring layout: {e}")
             return False
@@ -1,5 +1,15 @@
 """Core NEXUS functionality."""
 
-from .dynamic_layout_manager import DynamicLayoutManager
-
 __all__ = ["DynamicLayoutManager"]
+
+
+def __getattr__(name):
+    # Submodules such as core.yabai can be imported without the layout manager
+    if name == "DynamicLayoutManager":
+        from .dynamic_layout_manager import DynamicLayoutManager
+        return DynamicLayoutManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Active App Providers
+Which user-facing apps are running: from the psutil process table (any
+platform) or, optionally, from System Events via AppleScript (macOS)
+"""
+
+import os
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .process_table import ProcessInfo, ProcessTable, shared_process_table
+
+logger = logging.getLogger(__name__)
+
+CONFIG_PATH = Path(__file__).parent.parent.parent.parent / "configs" / "nexus.yaml"
+ACTIVE_APPS_SCRIPT = (
+    'tell application "System Events" to '
+    "get name of every process whose background only is false"
+)
+# Bundles outside these folders (e.g. /System/Library/CoreServices agents) are not apps
+APP_ROOTS = ("/Applications", "/System/Applications", "~/Applications")
+
+
+class AppProvider(ABC):
+    """Interface: ``apps()`` (or calling the provider) lists running app names"""
+
+    @abstractmethod
+    def apps(self) -> List[str]:
+        """Names of the running apps"""
+
+    def __call__(self) -> List[str]:
+        return self.apps()
+
+
+class AppleScriptAppProvider(AppProvider):
+    """Foreground processes from System Events (macOS only, one osascript per call)"""
+
+    def __init__(self, timeout: float = 5.0):
+        self.timeout = timeout
+
+    def apps(self) -> List[str]:
+        from .command_runner import run_command
+
+        result = run_command(
+            ["osascript", "-e", ACTIVE_APPS_SCRIPT],
+            name="osascript_active_apps",
+            timeout=self.timeout,
+        )
+        if not result.ok:
+            return []
+        return [app.strip() for app in result.stdout.split(",") if app.strip()]
+
+
+class ProcessAppProvider(AppProvider):
+    """
+    Running apps derived from the shared process table.
+
+    A process counts as an app when its executable or process name is in
+    ``exe_map`` (case-insensitive, mapped to the app's display name) or,
+    failing that, when it lives inside a ``.app`` bundle under one of
+    ``app_roots``, which keeps out the system agents bundled elsewhere
+    (SystemUIServer, ControlCenter, Spotlight...). Names in ``ignore``
+    never count. Processes are classified once, when they first
+    appear: each call diffs the table's processes against the previous call
+    and only maps the new ones, keeping a per-app process count.
+    """
+
+    def __init__(
+        self,
+        table: Optional[ProcessTable] = None,
+        exe_map: Optional[Dict[str, str]] = None,
+        ignore: Iterable[str] = (),
+        app_roots: Iterable[str] = APP_ROOTS,
+    ):
+        self.table = table or shared_process_table()
+        self.exe_map = {exe.casefold(): app for exe, app in (exe_map or {}).items()}
+        self.ignore = {name.casefold() for name in ignore}
+        self.app_roots = tuple(
+            os.path.join(os.path.expanduser(root), "") for root in app_roots
+        )
+        self._lock = threading.Lock()
+        self._app_by_process: Dict[Tuple[int, float], Optional[str]] = {}
+        self._counts: Counter = Counter()
+        self.mapped = 0
+
+    def app_for(self, info: ProcessInfo) -> Optional[str]:
+        """App name a process belongs to, or None for background and CLI processes"""
+        exe_name = info.exe.rsplit("/", 1)[-1] if info.exe else ""
+        for key in (exe_name, info.name):
+            app = self.exe_map.get(key.casefold()) if key else None
+            if app:
+                return None if app.casefold() in self.ignore else app
+        if (
+            info.bundle
+            and info.exe.startswith(self.app_roots)
+            and info.bundle.casefold() not in self.ignore
+        ):
+            return info.bundle
+        return None
+
+    def apps(self) -> List[str]:
+        # Keyed by (pid, create time): a reused pid is a new process
+        processes = {info.identity: info for info in self.table.processes().values()}
+        with self._lock:
+            known = self._app_by_process
+            for identity in known.keys() - processes.keys():
+                app = known.pop(identity)
+                if app:
+                    self._counts[app] -= 1
+                    if not self._counts[app]:
+                        del self._counts[app]
+            for identity, info in processes.items():
+                if identity in known:
+                    continue
+                app = known[identity] = self.app_for(info)
+                self.mapped += 1
+                if app:
+                    self._counts[app] += 1
+            # Counter keeps first-seen order, so the list is stable between samples
+            return list(self._counts)
+
+
+def load_app_provider_config(config_path: Path = CONFIG_PATH) -> Dict[str, Any]:
+    """The ``context.active_apps`` section of nexus.yaml, or {}"""
+    try:
+        import yaml
+
+        with open(config_path, "r") as f:
+            config = yaml.safe_load(f) or {}
+        return (config.get("context") or {}).get("active_apps") or {}
+    except Exception:
+        return {}
+
+
+def make_app_provider(config: Optional[Dict[str, Any]] = None) -> AppProvider:
+    """Provider for ``backend`` "process" (default) or "applescript" """
+    config = load_app_provider_config() if config is None else config
+    backend = config.get("backend", "process")
+    if backend == "applescript":
+        return AppleScriptAppProvider()
+    if backend != "process":
+        logger.warning(
+            f"⚠️ Unknown active-app backend '{backend}', using the process table"
+        )
+    return ProcessAppProvider(
+        exe_map=config.get("exe_map"),
+        ignore=config.get("ignore", ()),
+        app_roots=config.get("app_roots", APP_ROOTS),
+    )
+
+
+_shared_provider: Optional[AppProvider] = None
+_shared_lock = threading.Lock()
+
+
+def shared_app_provider() -> AppProvider:
+    """Process-wide provider configured from nexus.yaml"""
+    global _shared_provider
+    with _shared_lock:
+        if _shared_provider is None:
+            _shared_provider = make_app_provider()
+        return _shared_provider
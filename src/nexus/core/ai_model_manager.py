@@ -6,20 +6,21 @@ Advanced model integration and intelligent workspace optimization
 
 import os
 import sys
-import json
 import yaml
-import subprocess
 import asyncio
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, time
 import logging
 import psutil
 import platform
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from .state_cache import shared_client
+from .context_sampler import shared_sampler
+from .app_classifier import shared_classifier
+from ..utils.logger import log_operation, setup_logging
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,6 +47,7 @@ class WorkspaceContext:
     available_memory: float
     cpu_usage: float
     display_config: Dict[str, Any]
+    fresh: Dict[str, bool] = field(default_factory=dict)  # per source: read in the latest sample
 
 
 class AIModelManager:
@@ -58,6 +60,8 @@ class AIModelManager:
         self.models = {}
         self.workspace_context = None
         self.performance_tracker = {}
+        self.yabai = shared_client()
+        self.sampler = shared_sampler()
         
         # Load model collection
         self.load_model_collection()
@@ -66,21 +70,25 @@ class AIModelManager:
         """Load and categorize all available models"""
         logger.info("Loading model collection...")
         
-        if not self.model_path.exists():
-            logger.error(f"Model path not found: {self.model_path}")
-            return
-        
-        # Scan by format
-        for format_dir in ["MLX", "GGUF", "HF"]:
-            format_path = self.model_path / "by-format" / format_dir
-            if format_path.exists():
-                self._scan_format_directory(format_path, format_dir)
-        
-        # Scan by creator
-        for creator_dir in ["lmstudio-community", "mlx-community", "standalone"]:
-            creator_path = self.model_path / "by-creator" / creator_dir
-            if creator_path.exists():
-                self._scan_creator_directory(creator_path, creator_dir)
+        with log_operation("model_scan", path=str(self.model_path)) as op:
+            if not self.model_path.exists():
+                logger.error(f"Model path not found: {self.model_path}")
+                op["outcome"] = "missing_path"
+                return
+            
+            # Scan by format
+            for format_dir in ["MLX", "GGUF", "HF"]:
+                format_path = self.model_path / "by-format" / format_dir
+                if format_path.exists():
+                    self._scan_format_directory(format_path, format_dir)
+            
+            # Scan by creator
+            for creator_dir in ["lmstudio-community", "mlx-community", "standalone"]:
+                creator_path = self.model_path / "by-creator" / creator_dir
+                if creator_path.exists():
+                    self._scan_creator_directory(creator_path, creator_dir)
+            
+            op["models"] = len(self.models)
         
         logger.info(f"Loaded {len(self.models)} models")
     
@@ -147,18 +155,7 @@ class AIModelManager:
     
     def _determine_purpose(self, model_name: str) -> str:
         """Determine model purpose based on name"""
-        name_lower = model_name.lower()
-        
-        if any(keyword in name_lower for keyword in ["reasoning", "phi-4", "phi-3"]):
-            return "reasoning"
-        elif any(keyword in name_lower for keyword in ["vl", "vision", "multimodal"]):
-            return "vision"
-        elif any(keyword in name_lower for keyword in ["deepseek", "granite", "code"]):
-            return "coding"
-        elif any(keyword in name_lower for keyword in ["chat", "instruct", "llama", "qwen"]):
-            return "chat"
-        else:
-            return "chat"  # Default to chat
+        return shared_classifier("model_purpose").classify(model_name) or "chat"
     
     def _estimate_memory_requirements(self, model_name: str, size_category: str) -> float:
         """Estimate memory requirements in GB"""
@@ -203,39 +200,37 @@ class AIModelManager:
         
         return min(score, 1.0)
     
-    def get_workspace_context(self) -> WorkspaceContext:
-        """Get current workspace context"""
-        now = datetime.now()
-        
-        # Get active applications
-        try:
-            result = subprocess.run([
-                "osascript", "-e", 
-                'tell application "System Events" to get name of every process whose background only is false'
-            ], capture_output=True, text=True)
-            active_apps = result.stdout.strip().split(", ") if result.returncode == 0 else []
-        except:
-            active_apps = []
-        
-        # Determine current profile
-        current_profile = self._determine_current_profile(now, active_apps)
-        
-        # Get system resources
-        available_memory = psutil.virtual_memory().available / (1024**3)  # GB
-        cpu_usage = psutil.cpu_percent()
-        
-        # Get display configuration
-        display_config = self._get_display_config()
-        
-        return WorkspaceContext(
-            time=now,
-            day_of_week=now.weekday() + 1,  # 1=Monday, 7=Sunday
-            active_apps=active_apps,
-            current_profile=current_profile,
-            available_memory=available_memory,
-            cpu_usage=cpu_usage,
-            display_config=display_config
-        )
+    def get_workspace_context(self, max_staleness: Optional[float] = None) -> WorkspaceContext:
+        """
+        Get current workspace context from the background sampler
+        
+        Args:
+            max_staleness: Maximum acceptable sample age in seconds; by default
+                the latest sample is used however old it is
+        """
+        with log_operation("context_collection", source="ai_model_manager") as op:
+            sample = self.sampler.latest(max_staleness)
+            now = datetime.now()
+            active_apps = list(sample.active_apps)
+            
+            # Determine current profile
+            current_profile = self._determine_current_profile(now, active_apps)
+            
+            op["profile"] = current_profile
+            op["apps"] = len(active_apps)
+            op["sample_age_ms"] = round(sample.age * 1000, 1)
+            op["stale"] = sample.stale_sources
+            
+            return WorkspaceContext(
+                time=now,
+                day_of_week=now.weekday() + 1,  # 1=Monday, 7=Sunday
+                active_apps=active_apps,
+                current_profile=current_profile,
+                available_memory=sample.available_memory_gb,
+                cpu_usage=sample.cpu_percent,
+                display_config=list(sample.displays),
+                fresh=dict(sample.fresh)
+            )
     
     def _determine_current_profile(self, now: datetime, active_apps: List[str]) -> str:
         """Determine current workspace profile based on time and apps"""
@@ -251,12 +246,10 @@ class AIModelManager:
             base_profile = "ai_research"
         
         # App-based adjustment
-        dev_apps = sum(1 for app in active_apps if any(keyword in app.lower() 
-                                                      for keyword in ["cursor", "code", "xcode", "terminal"]))
-        comm_apps = sum(1 for app in active_apps if any(keyword in app.lower() 
-                                                       for keyword in ["slack", "teams", "whatsapp", "zoom"]))
-        ent_apps = sum(1 for app in active_apps if any(keyword in app.lower() 
-                                                      for keyword in ["spotify", "netflix", "youtube", "twitch"]))
+        signals = shared_classifier("profile_signals").count(active_apps)
+        dev_apps = signals["development"]
+        comm_apps = signals["communication"]
+        ent_apps = signals["entertainment"]
         
         if dev_apps > max(comm_apps, ent_apps):
             return "work"
@@ -265,17 +258,6 @@ class AIModelManager:
         else:
             return base_profile
     
-    def _get_display_config(self) -> Dict[str, Any]:
-        """Get current display configuration"""
-        try:
-            result = subprocess.run(["yabai", "-m", "query", "--displays"], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                return json.loads(result.stdout)
-        except:
-            pass
-        return {}
-    
     def select_optimal_models(self, context: WorkspaceContext) -> Dict[str, ModelInfo]:
         """Select optimal models for current workspace context"""
         available_models = []
@@ -413,6 +395,7 @@ class AIModelManager:
 
 def main():
     """Main function for testing and demonstration"""
+    setup_logging()
     manager = AIModelManager()
     
     # Get workspace context
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+App Classifier
+Compiled, config-driven app-name classification shared by every activity
+detector: an exact-name hash table plus an Aho-Corasick automaton for
+substring rules, memoised per name
+"""
+
+import sys
+import threading
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONFIG_PATH = (
+    Path(__file__).parent.parent.parent.parent / "configs" / "app_classes.yaml"
+)
+MEMO_LIMIT = 4096
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton: finds every keyword occurring in a text in one
+    pass over the text, however many keywords there are.
+    """
+
+    def __init__(self, keywords: Mapping[str, int]):
+        # Node 0 is the root; goto[node][char] -> node, out[node] = keyword bitmask
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[int] = [0]
+        for keyword, mask in keywords.items():
+            node = 0
+            for char in keyword:
+                nxt = self._goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(0)
+                node = nxt
+            self._out[node] |= mask
+        self._link()
+
+    def _link(self):
+        # Breadth-first, so each node's failure target is linked before it
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, nxt in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] |= self._out[self._fail[nxt]]
+                queue.append(nxt)
+
+    def search(self, text: str) -> int:
+        """Bitmask of every keyword's value found in ``text``"""
+        goto, fail, out = self._goto, self._fail, self._out
+        node, found = 0, 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            found |= out[node]
+        return found
+
+
+class AppClassifier:
+    """
+    Maps app (or model) names to categories.
+
+    ``rules`` maps each category, in priority order, to ``exact`` names and
+    ``contains`` keywords; both match case-insensitively. A name gets every
+    category it matches, listed in priority order.
+    """
+
+    def __init__(self, rules: Mapping[str, Mapping[str, Iterable[str]]]):
+        self.categories: Tuple[str, ...] = tuple(rules)
+        self._exact: Dict[str, int] = {}
+        self._listed: Dict[str, List[str]] = {}
+        keywords: Dict[str, int] = {}
+        for index, (category, rule) in enumerate(rules.items()):
+            bit = 1 << index
+            self._listed[category] = [
+                str(name) for name in (rule or {}).get("exact", ())
+            ]
+            for name in self._listed[category]:
+                key = name.casefold()
+                self._exact[key] = self._exact.get(key, 0) | bit
+            for keyword in (rule or {}).get("contains", ()):
+                key = str(keyword).casefold()
+                keywords[key] = keywords.get(key, 0) | bit
+        self._automaton = KeywordAutomaton(keywords) if keywords else None
+        self._memo: Dict[str, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def categories_of(self, name: str) -> Tuple[str, ...]:
+        """Every category ``name`` matches, highest priority first"""
+        cached = self._memo.get(name)
+        if cached is not None:
+            return cached
+
+        key = name.casefold()
+        mask = self._exact.get(key, 0)
+        if self._automaton is not None:
+            mask |= self._automaton.search(key)
+        result = tuple(c for i, c in enumerate(self.categories) if mask >> i & 1)
+
+        with self._lock:
+            if len(self._memo) >= MEMO_LIMIT:
+                self._memo.clear()
+            self._memo[name] = result
+        return result
+
+    def classify(self, name: str) -> Optional[str]:
+        """Highest-priority category of ``name``, or None"""
+        matches = self.categories_of(name)
+        return matches[0] if matches else None
+
+    def matches(self, name: str, category: str) -> bool:
+        return category in self.categories_of(name)
+
+    def count(self, names: Iterable[str]) -> Counter:
+        """How many names fall in each category (once per category a name matches)"""
+        counts: Counter = Counter()
+        for name in names:
+            counts.update(self.categories_of(name))
+        return counts
+
+    def dominant(self, names: Iterable[str]) -> Optional[str]:
+        """Highest-priority category matched by any of ``names``"""
+        best = len(self.categories)
+        rank = {c: i for i, c in enumerate(self.categories)}
+        for name in names:
+            matches = self.categories_of(name)
+            if matches:
+                best = min(best, rank[matches[0]])
+                if best == 0:
+                    break
+        return self.categories[best] if best < len(self.categories) else None
+
+    def names(self, category: str) -> List[str]:
+        """Exact names listed for ``category``, as spelled in the config"""
+        return list(self._listed.get(category, ()))
+
+
+def load_classifiers(config_path: Path = CONFIG_PATH) -> Dict[str, AppClassifier]:
+    """Compile every classifier in app_classes.yaml ({} if it can't be read)"""
+    try:
+        import yaml
+
+        with open(config_path, "r") as f:
+            config = yaml.safe_load(f) or {}
+    except Exception as e:
+        logger.warning(f"⚠️ Could not load app classes from {config_path}: {e}")
+        return {}
+    return {name: AppClassifier(rules or {}) for name, rules in config.items()}
+
+
+_shared_classifiers: Optional[Dict[str, AppClassifier]] = None
+_shared_lock = threading.Lock()
+
+
+def shared_classifier(name: str) -> AppClassifier:
+    """Process-wide compiled classifier (an empty one if ``name`` isn't configured)"""
+    global _shared_classifiers
+    with _shared_lock:
+        if _shared_classifiers is None:
+            _shared_classifiers = load_classifiers()
+        classifier = _shared_classifiers.get(name)
+        if classifier is None:
+            classifier = _shared_classifiers[name] = AppClassifier({})
+        return classifier
+
+
+def main(argv=None) -> int:
+    """
+    Shell entry point:
+        python -m nexus.core.app_classifier filter CLASSIFIER CATEGORY [--invert]
+        python -m nexus.core.app_classifier names CLASSIFIER CATEGORY
+    ``filter`` echoes the stdin lines that match (or with --invert, don't).
+    Exits 1 when the classes can't be loaded.
+    """
+    args = list(sys.argv[1:] if argv is None else argv)
+    invert = "--invert" in args
+    args = [a for a in args if a != "--invert"]
+    if len(args) != 3 or args[0] not in ("filter", "names"):
+        print(main.__doc__, file=sys.stderr)
+        return 2
+
+    action, classifier_name, category = args
+    # Unlike shared_classifier, a missing config is an error here: an empty
+    # classifier would quietly match nothing
+    classifier = load_classifiers(CONFIG_PATH).get(classifier_name)
+    if classifier is None or category not in classifier.categories:
+        print(
+            f"❌ No {classifier_name}/{category} classes in {CONFIG_PATH}",
+            file=sys.stderr,
+        )
+        return 1
+    if action == "names":
+        for name in classifier.names(category):
+            print(name)
+        return 0
+
+    for line in sys.stdin:
+        name = line.rstrip("\n")
+        if name and classifier.matches(name, category) != invert:
+            print(name)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+App Launcher
+Launches a set of apps concurrently, skipping ones already running, and
+reports per-app latency and failures
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .app_readiness import run_blocking
+from .command_runner import shared_runner
+from .process_table import ProcessTable, shared_process_table
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_LAUNCH_TIMEOUT = 30.0
+
+
+class LaunchError(Exception):
+    """A launch command failed or timed out"""
+
+
+@dataclass
+class LaunchResult:
+    """Outcome of launching one app"""
+
+    app: str
+    success: bool
+    already_running: bool = False
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class CommandBackend:
+    """
+    Launches an app by running a command, ``open -a <app>`` by default.
+
+    ``argv`` is a template whose ``{app}`` items are replaced by the app
+    name, so tests and benchmarks can point it at a local fake ``open``.
+    """
+
+    def __init__(
+        self,
+        argv: Sequence[str] = ("open", "-a", "{app}"),
+        timeout: float = DEFAULT_LAUNCH_TIMEOUT,
+    ):
+        self.argv = list(argv)
+        self.timeout = timeout
+
+    async def launch(self, app: str):
+        argv = [part.replace("{app}", app) for part in self.argv]
+        result = await shared_runner().run(argv, timeout=self.timeout, name="open")
+        if not result.ok:
+            raise LaunchError(result.error)
+
+
+class AppLauncher:
+    """
+    Launches many apps at once, at most ``max_concurrency`` at a time.
+
+    Duplicate names and apps that already have a process are skipped; the
+    result for every requested app says whether it was launched, how long
+    the launch command took and why it failed.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CommandBackend] = None,
+        processes: Optional[ProcessTable] = None,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        self.backend = backend or CommandBackend()
+        self.processes = processes or shared_process_table()
+        self.max_concurrency = max_concurrency
+
+    async def launch_all(self, apps: Iterable[str]) -> Dict[str, LaunchResult]:
+        apps = list(dict.fromkeys(apps))
+        running = self.processes.running(apps)
+        results = {
+            app: LaunchResult(app, True, already_running=True)
+            for app in apps
+            if running[app]
+        }
+
+        limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def launch(app: str) -> LaunchResult:
+            async with limit:
+                start = time.perf_counter()
+                try:
+                    await self.backend.launch(app)
+                    return LaunchResult(app, True, seconds=time.perf_counter() - start)
+                except (LaunchError, OSError) as e:
+                    return LaunchResult(
+                        app, False, seconds=time.perf_counter() - start, error=str(e)
+                    )
+
+        to_launch = [app for app in apps if not running[app]]
+        for result in await asyncio.gather(*(launch(app) for app in to_launch)):
+            results[result.app] = result
+        if to_launch:
+            # New processes exist now
+            self.processes.invalidate()
+
+        failed = [r for r in results.values() if not r.success]
+        for result in failed:
+            logger.warning(f"⚠️ Failed to launch {result.app}: {result.error}")
+        if to_launch:
+            slowest = max(results[app].seconds for app in to_launch)
+            launched = len(to_launch) - len(failed)
+            logger.info(
+                f"🚀 Launched {launched}/{len(to_launch)} apps (slowest {slowest:.2f}s)"
+            )
+        return {app: results[app] for app in apps}
+
+    def launch(self, apps: Iterable[str]) -> Dict[str, LaunchResult]:
+        """Synchronous wrapper around ``launch_all``"""
+        apps = list(apps)
+        return run_blocking(lambda: self.launch_all(apps))
+
+
+def launched_apps(results: Dict[str, LaunchResult]) -> List[str]:
+    """Apps a launch actually started (not failed, not already running)"""
+    return [r.app for r in results.values() if r.success and not r.already_running]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+App Readiness Waiter
+Waits until freshly launched apps have a window, driven by yabai window
+events when a live workspace model is available and by exponential-backoff
+polling otherwise
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List
+
+from .yabai import YabaiClient, YabaiError, YabaiWindow
+from .window_batch import select_windows
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10.0
+INITIAL_DELAY = 0.05
+MAX_DELAY = 1.0
+
+
+def run_blocking(coroutine_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run a coroutine to completion from sync code, inside a running loop or not"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine_factory())
+
+    # Can't nest asyncio.run; give the coroutine its own loop on a worker thread
+    outcome: Dict[str, Any] = {}
+
+    def worker():
+        try:
+            outcome["result"] = asyncio.run(coroutine_factory())
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+class AppReadinessWaiter:
+    """
+    Resolves each app to its first windows as soon as they exist.
+
+    All pending apps are checked together, so waiting for ten launches costs
+    one window query per round rather than ten, and the total wait is that
+    of the slowest app instead of the sum.
+    """
+
+    def __init__(
+        self,
+        client: YabaiClient,
+        model=None,
+        initial_delay: float = INITIAL_DELAY,
+        max_delay: float = MAX_DELAY,
+    ):
+        self.client = client
+        self.model = model
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+
+    async def wait_for_apps(
+        self, apps: Iterable[str], timeout: float = DEFAULT_TIMEOUT
+    ) -> Dict[str, List[YabaiWindow]]:
+        """Wait until every app has a window; apps missing at the deadline map to []"""
+        pending = set(apps)
+        ready: Dict[str, List[YabaiWindow]] = {app: [] for app in pending}
+        deadline = time.monotonic() + timeout
+        delay = self.initial_delay
+
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+        use_events = self.model is not None and self.model.listening
+
+        def on_event(event):
+            if event.event == "window_created":
+                loop.call_soon_threadsafe(changed.set)
+
+        if use_events:
+            self.model.subscribe(on_event)
+        try:
+            while pending:
+                # Cleared before looking, so an event during the lookup still wakes us
+                changed.clear()
+                for app, windows in self._find(pending, use_events).items():
+                    ready[app] = windows
+                    pending.discard(app)
+                remaining = deadline - time.monotonic()
+                if not pending or remaining <= 0:
+                    break
+
+                try:
+                    # Events wake us early; the backoff still bounds each wait
+                    await asyncio.wait_for(changed.wait(), min(delay, remaining))
+                except asyncio.TimeoutError:
+                    delay = min(delay * 2, self.max_delay)
+        finally:
+            if use_events:
+                self.model.unsubscribe(on_event)
+
+        if pending:
+            logger.warning(
+                f"⚠️ No window after {timeout:.0f}s for: {', '.join(sorted(pending))}"
+            )
+        return ready
+
+    async def wait_for_window(
+        self, app: str, timeout: float = DEFAULT_TIMEOUT
+    ) -> List[YabaiWindow]:
+        """Wait for one app's first window"""
+        return (await self.wait_for_apps([app], timeout))[app]
+
+    def wait_for_apps_blocking(
+        self, apps: Iterable[str], timeout: float = DEFAULT_TIMEOUT
+    ) -> Dict[str, List[YabaiWindow]]:
+        """Synchronous wrapper, safe to call with or without a running event loop"""
+        apps = list(apps)
+        return run_blocking(lambda: self.wait_for_apps(apps, timeout))
+
+    def _find(
+        self, apps: Iterable[str], use_events: bool
+    ) -> Dict[str, List[YabaiWindow]]:
+        """Windows for each of ``apps`` that already has one"""
+        if use_events:
+            found = {app: self.model.index.windows(app=app) for app in apps}
+        else:
+            # A cached snapshot may predate the launch
+            if hasattr(self.client, "invalidate"):
+                self.client.invalidate()
+            try:
+                windows = self.client.query_windows()
+            except YabaiError as e:
+                logger.debug(f"Window query failed while waiting for launch: {e}")
+                return {}
+            found = {app: select_windows(windows, app=app) for app in apps}
+        return {app: windows for app, windows in found.items() if windows}
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Circuit Breaker
+Health tracking for an external backend (yabai): after repeated failures
+calls fail fast, while a background probe waits for the backend to return
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+FAILURE_THRESHOLD = 3
+RESET_TIMEOUT = 2.0
+MAX_RESET_TIMEOUT = 30.0
+
+
+class CircuitBreaker:
+    """
+    Three-state breaker: closed (calls go through), open (calls are
+    short-circuited) and half-open (a probe is checking the backend).
+
+    ``failure_threshold`` consecutive failures open the circuit. While it is
+    open a daemon thread calls ``probe`` after ``reset_timeout`` seconds,
+    doubling the wait up to ``max_reset_timeout`` each time the probe fails;
+    the first successful probe (or any successful call) closes it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        probe: Optional[Callable[[], bool]] = None,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reset_timeout: float = RESET_TIMEOUT,
+        max_reset_timeout: float = MAX_RESET_TIMEOUT,
+    ):
+        self.name = name
+        self.probe = probe
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._next_probe: Optional[float] = None
+        self._prober: Optional[threading.Thread] = None
+        self._wake.set()  # no prober running yet
+        self.last_error: Optional[str] = None
+        self.short_circuits = 0
+        self.probes = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go to the backend; counts the ones that may not"""
+        if self._state == CLOSED:
+            return True
+        with self._lock:
+            self.short_circuits += 1
+        return False
+
+    def record_success(self):
+        if self._state == CLOSED and not self._failures:
+            return
+        with self._lock:
+            self._close()
+
+    def record_failure(self, error: Any):
+        with self._lock:
+            self.last_error = str(error)
+            self._failures += 1
+            if self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def reset(self):
+        """Close the circuit and stop probing"""
+        with self._lock:
+            self._close()
+
+    def _open(self):
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self.trips += 1
+        logger.warning(
+            f"⚠️ {self.name} unavailable after {self._failures} failures "
+            f"({self.last_error}); failing fast until it recovers"
+        )
+        if self.probe is not None:
+            # Each prober gets its own wake event, so a stale one can't linger
+            self._wake = threading.Event()
+            self._prober = threading.Thread(
+                target=self._probe_loop,
+                args=(self._wake,),
+                name=f"{self.name}-probe",
+                daemon=True,
+            )
+            self._prober.start()
+
+    def _close(self):
+        if self._state != CLOSED:
+            logger.info(f"✅ {self.name} available again")
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._next_probe = None
+        self._wake.set()
+
+    def _probe_loop(self, wake: threading.Event):
+        delay = self.reset_timeout
+        while True:
+            with self._lock:
+                if wake.is_set():
+                    return
+                self._next_probe = time.monotonic() + delay
+            if wake.wait(delay):
+                return
+
+            with self._lock:
+                if wake.is_set():
+                    return
+                self._state = HALF_OPEN
+                self.probes += 1
+            try:
+                healthy = bool(self.probe())
+            except Exception as e:
+                healthy = False
+                self.last_error = str(e)
+
+            with self._lock:
+                if wake.is_set():
+                    return
+                if healthy:
+                    self._close()
+                    return
+                self._state = OPEN
+            delay = min(delay * 2, self.max_reset_timeout)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """State and counters for status displays"""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "name": self.name,
+                "state": self._state,
+                "failures": self._failures,
+                "last_error": self.last_error,
+                "open_for": round(now - self._opened_at, 1)
+                if self._opened_at
+                else None,
+                "next_probe_in": round(max(self._next_probe - now, 0), 1)
+                if self._next_probe and self._state != CLOSED
+                else None,
+                "short_circuits": self.short_circuits,
+                "probes": self.probes,
+                "trips": self.trips,
+            }
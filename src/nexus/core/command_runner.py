@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Command Runner
+Runs external commands with a timeout, under one process-wide concurrency
+limit, and records every run in a per-command latency histogram
+"""
+
+import asyncio
+import bisect
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .app_readiness import run_blocking
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_CONCURRENCY = 8
+# Upper bounds in seconds; anything slower lands in the overflow bucket
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass
+class ProcessResult:
+    """Outcome of one command"""
+
+    argv: List[str]
+    returncode: Optional[int]
+    stdout: str = ""
+    stderr: str = ""
+    seconds: float = 0.0
+    timed_out: bool = False
+    cancelled: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not (self.timed_out or self.cancelled)
+
+    @property
+    def error(self) -> Optional[str]:
+        if self.timed_out:
+            return f"timed out after {self.seconds:.1f}s"
+        if self.cancelled:
+            return "cancelled"
+        if self.returncode != 0:
+            return self.stderr.strip() or f"exit status {self.returncode}"
+        return None
+
+
+class LatencyHistogram:
+    """Thread-safe latency counts per command name in fixed buckets"""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counts: Dict[str, List[int]] = {}
+        self._sums: Dict[str, float] = {}
+
+    def observe(self, name: str, seconds: float):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            counts = self._counts.setdefault(name, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self._sums[name] = self._sums.get(name, 0.0) + seconds
+
+    def count(self, name: str) -> int:
+        with self._lock:
+            return sum(self._counts.get(name, ()))
+
+    def percentile(self, name: str, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th percentile (inf on overflow)"""
+        with self._lock:
+            counts = list(self._counts.get(name, ()))
+        total = sum(counts)
+        if not total:
+            return None
+        rank, seen = q / 100 * total, 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """Per command: count, total seconds and cumulative counts per bucket bound"""
+        with self._lock:
+            items = [
+                (name, list(counts), self._sums[name])
+                for name, counts in self._counts.items()
+            ]
+        snapshot = {}
+        for name, counts, total in items:
+            cumulative, running = {}, 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                running += count
+                cumulative[str(bound)] = running
+            snapshot[name] = {
+                "count": running,
+                "sum": round(total, 6),
+                "buckets": cumulative,
+            }
+        return snapshot
+
+
+class CommandRunner:
+    """
+    Runs commands with ``asyncio.create_subprocess_exec`` (never a shell).
+
+    At most ``max_concurrency`` commands run at once across every thread and
+    event loop using this runner. A command that outlives its timeout or is
+    stopped by ``cancel_all`` is killed and reported in its result instead of
+    raising; cancelling the awaiting task kills the command too.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+        histogram: Optional[LatencyHistogram] = None,
+    ):
+        self.timeout = timeout
+        self.histogram = histogram or LatencyHistogram()
+        # A thread semaphore, since callers may each bring their own event loop
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._active: Dict[int, asyncio.subprocess.Process] = {}
+        self._cancelled = set()
+        self._lock = threading.Lock()
+
+    async def _acquire(self):
+        delay = 0.001
+        while not self._slots.acquire(blocking=False):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+
+    async def run(
+        self,
+        argv: Sequence[str],
+        timeout: Optional[float] = None,
+        name: Optional[str] = None,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> ProcessResult:
+        """
+        Run one command and collect its output.
+
+        Args:
+            argv: Program and arguments
+            timeout: Seconds before the command is killed (default: runner timeout)
+            name: Histogram key (default: the program's base name)
+            cwd: Working directory
+            env: Extra environment variables
+
+        Returns:
+            ProcessResult; a missing program is reported as returncode 127
+        """
+        argv = [str(part) for part in argv]
+        name = name or Path(argv[0]).name
+        timeout = self.timeout if timeout is None else timeout
+
+        await self._acquire()
+        start = time.perf_counter()
+        result = ProcessResult(argv, None)
+        process = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                stdin=asyncio.subprocess.DEVNULL,
+                cwd=cwd,
+                env=dict(os.environ, **env) if env else None,
+            )
+            with self._lock:
+                self._active[process.pid] = process
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            result.stdout = stdout.decode(errors="replace")
+            result.stderr = stderr.decode(errors="replace")
+            result.returncode = process.returncode
+            if process.pid in self._cancelled:
+                result.cancelled = True
+        except FileNotFoundError as e:
+            result.returncode, result.stderr = 127, str(e)
+        except asyncio.TimeoutError:
+            result.timed_out = True
+            await self._kill(process)
+            logger.warning(f"⚠️ {name} timed out after {timeout:.1f}s")
+        except asyncio.CancelledError:
+            result.cancelled = True
+            await self._kill(process)
+            raise
+        finally:
+            result.seconds = time.perf_counter() - start
+            self._slots.release()
+            if process is not None:
+                with self._lock:
+                    self._active.pop(process.pid, None)
+                    self._cancelled.discard(process.pid)
+            self.histogram.observe(name, result.seconds)
+        return result
+
+    async def _kill(self, process: Optional[asyncio.subprocess.Process]):
+        if process is None or process.returncode is not None:
+            return
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+    async def run_all(
+        self, commands: Sequence[Sequence[str]], **kwargs
+    ) -> List[ProcessResult]:
+        """Run several commands concurrently (still within the global limit)"""
+        return list(
+            await asyncio.gather(*(self.run(argv, **kwargs) for argv in commands))
+        )
+
+    def run_sync(self, argv: Sequence[str], **kwargs) -> ProcessResult:
+        """Synchronous wrapper around ``run``"""
+        return run_blocking(lambda: self.run(argv, **kwargs))
+
+    def cancel_all(self) -> int:
+        """Kill every running command; returns how many were signalled"""
+        with self._lock:
+            processes = list(self._active.items())
+            self._cancelled.update(pid for pid, _ in processes)
+        for _, process in processes:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        return len(processes)
+
+    @property
+    def running(self) -> int:
+        with self._lock:
+            return len(self._active)
+
+
+_shared_runner: Optional[CommandRunner] = None
+_shared_lock = threading.Lock()
+
+
+def shared_runner() -> CommandRunner:
+    """Process-wide runner, so the concurrency limit and histogram cover every caller"""
+    global _shared_runner
+    with _shared_lock:
+        if _shared_runner is None:
+            _shared_runner = CommandRunner()
+        return _shared_runner
+
+
+def run_command(argv: Sequence[str], **kwargs) -> ProcessResult:
+    """Run one command on the shared runner from synchronous code"""
+    return shared_runner().run_sync(argv, **kwargs)
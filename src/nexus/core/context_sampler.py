@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Context Sampler
+Background thread that keeps the latest workspace context (active apps,
+CPU, memory, displays) so readers never wait on osascript, yabai or psutil.
+Each sample reads every source concurrently, each under its own timeout
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import psutil
+
+from .yabai import YabaiError
+from .app_readiness import run_blocking
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 2.0
+# Seconds each source may take before the sample goes out without it
+DEFAULT_TIMEOUTS = {"apps": 1.0, "system": 0.5, "displays": 0.5}
+CPU_WINDOW = 0.1  # shortest span psutil's CPU percent is measured over
+CONFIG_PATH = Path(__file__).parent.parent.parent.parent / "configs" / "nexus.yaml"
+
+
+@dataclass(frozen=True)
+class ContextSample:
+    """One immutable reading of the workspace; replaced wholesale, never mutated"""
+
+    taken_at: float  # time.monotonic()
+    time: datetime
+    active_apps: Tuple[str, ...]
+    cpu_percent: float
+    memory_percent: float
+    available_memory_gb: float
+    displays: Tuple[Dict[str, Any], ...] = field(default=())
+    fresh: Dict[str, bool] = field(
+        default_factory=dict
+    )  # source -> read in this sample
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.taken_at
+
+    @property
+    def stale_sources(self) -> List[str]:
+        """Sources that timed out or failed and carry an older (or empty) value"""
+        return [name for name, fresh in self.fresh.items() if not fresh]
+
+
+@dataclass
+class ContextSource:
+    """One input to a sample: a blocking reader, its timeout and its fallback value"""
+
+    name: str
+    read: Callable[[], Any]
+    timeout: float
+    fallback: Any
+
+
+class SystemReader:
+    """
+    CPU percent since the previous call, memory percent and available GB.
+
+    psutil measures CPU against its previous reading, and the very first
+    call in a process has none, so it returns 0.0. The reader takes that
+    baseline when it is constructed, and its first read waits until at
+    least ``cpu_window`` seconds have passed since then.
+    """
+
+    def __init__(self, cpu_window: float = CPU_WINDOW):
+        self.cpu_window = cpu_window
+        psutil.cpu_percent(interval=None)
+        self._baseline_at: Optional[float] = time.monotonic()
+
+    def __call__(self) -> Tuple[float, float, float]:
+        if self._baseline_at is not None:
+            wait = self.cpu_window - (time.monotonic() - self._baseline_at)
+            if wait > 0:
+                time.sleep(wait)
+            self._baseline_at = None
+        memory = psutil.virtual_memory()
+        return (
+            psutil.cpu_percent(interval=None),
+            memory.percent,
+            memory.available / (1024**3),
+        )
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _source_executor() -> ThreadPoolExecutor:
+    # Not the event loop's default executor: asyncio.run() joins that one on
+    # exit, which would make every sample wait for its slowest source again
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="context-source"
+            )
+        return _executor
+
+
+class ContextSampler:
+    """
+    Samples the workspace every ``interval`` seconds on a daemon thread.
+
+    The latest sample is published by swapping one reference, so ``latest``
+    takes no lock and returns in microseconds. Readers that need fresher
+    data pass ``max_staleness`` and get a synchronous sample when the
+    published one is older than that.
+
+    A sample reads all sources concurrently. A source that fails or misses
+    its timeout keeps its previous value (or its fallback) and is marked
+    stale in ``ContextSample.fresh``; one that is still running from an
+    earlier sample is not started again until it finishes.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        client=None,
+        active_apps: Optional[Callable[[], List[str]]] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+    ):
+        if client is None:
+            from .state_cache import shared_client
+
+            client = shared_client()
+        if active_apps is None:
+            from .active_apps import shared_app_provider
+
+            active_apps = shared_app_provider()
+        self.interval = interval
+        self.client = client
+        timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+        self.sources = [
+            ContextSource("apps", active_apps, timeouts["apps"], ()),
+            ContextSource(
+                "system", SystemReader(), timeouts["system"], (0.0, 0.0, 0.0)
+            ),
+            ContextSource("displays", self._read_displays, timeouts["displays"], ()),
+        ]
+        self._values: Dict[str, Any] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._snapshot: Optional[ContextSample] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.samples = 0
+
+    def _read_displays(self) -> Tuple[Dict[str, Any], ...]:
+        return tuple(self.client.query("displays"))
+
+    async def _read(self, source: ContextSource) -> Tuple[Any, bool]:
+        future = self._inflight.get(source.name)
+        if future is None or future.done():
+            future = self._inflight[source.name] = _source_executor().submit(
+                source.read
+            )
+        try:
+            # A read that times out keeps running; the next sample waits on it again
+            value = await asyncio.wait_for(asyncio.wrap_future(future), source.timeout)
+            return value, True
+        except asyncio.TimeoutError:
+            logger.debug(
+                f"Context source {source.name} timed out after {source.timeout}s"
+            )
+        except YabaiError as e:
+            logger.debug(f"Context source {source.name} unavailable: {e}")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read {source.name}: {e}")
+        return self._values.get(source.name, source.fallback), False
+
+    async def collect(self) -> ContextSample:
+        """Read every source concurrently and publish the resulting sample"""
+        results = await asyncio.gather(*(self._read(source) for source in self.sources))
+        fresh = {}
+        for source, (value, ok) in zip(self.sources, results):
+            fresh[source.name] = ok
+            if ok:
+                self._values[source.name] = value
+
+        cpu, memory_percent, available_gb = results[1][0]
+        sample = ContextSample(
+            taken_at=time.monotonic(),
+            time=datetime.now(),
+            active_apps=tuple(results[0][0]),
+            cpu_percent=cpu,
+            memory_percent=memory_percent,
+            available_memory_gb=available_gb,
+            displays=tuple(results[2][0]),
+            fresh=fresh,
+        )
+        self._snapshot = sample
+        self.samples += 1
+        return sample
+
+    def sample(self) -> ContextSample:
+        """Collect and publish a new sample now (blocks at most the slowest timeout)"""
+        return run_blocking(self.collect)
+
+    def latest(self, max_staleness: Optional[float] = None) -> ContextSample:
+        """
+        The most recent sample, starting the sampler on first use.
+
+        Args:
+            max_staleness: Maximum acceptable age in seconds; an older
+                snapshot is replaced by a synchronous sample
+
+        Returns:
+            ContextSample
+        """
+        snapshot = self._snapshot
+        if snapshot is None or (
+            max_staleness is not None and snapshot.age > max_staleness
+        ):
+            snapshot = self.sample()
+        self.start()
+        return snapshot
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="context-sampler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning(f"⚠️ Context sample failed: {e}")
+
+
+def load_context_config(config_path: Path = CONFIG_PATH) -> Dict[str, Any]:
+    """The ``context`` section of nexus.yaml (sample_interval, source_timeouts)"""
+    try:
+        import yaml
+
+        with open(config_path, "r") as f:
+            return (yaml.safe_load(f) or {}).get("context") or {}
+    except Exception:
+        return {}
+
+
+_shared_sampler: Optional[ContextSampler] = None
+_shared_lock = threading.Lock()
+
+
+def shared_sampler() -> ContextSampler:
+    """Process-wide sampler, so every context reader shares one background thread"""
+    global _shared_sampler
+    with _shared_lock:
+        if _shared_sampler is None:
+            config = load_context_config()
+            _shared_sampler = ContextSampler(
+                interval=float(config.get("sample_interval", DEFAULT_INTERVAL)),
+                timeouts=config.get("source_timeouts"),
+            )
+        return _shared_sampler
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Display Topology
+Cached display count and geometry, invalidated on display hotplug or when
+the adaptive display count file changes
+"""
+
+import hashlib
+import threading
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from .yabai import YabaiClient, YabaiDisplay, YabaiError
+
+logger = logging.getLogger(__name__)
+
+COUNT_FILE = Path("configs/current_display_count.txt")
+DEFAULT_COUNT = 2  # common dual setup
+MAX_COUNT = 3
+
+# Events that change which displays exist or where they are
+TOPOLOGY_EVENTS = {
+    "display_added",
+    "display_removed",
+    "display_moved",
+    "display_resized",
+}
+
+
+@dataclass
+class DisplayTopology:
+    """Display count plus per-display geometry"""
+
+    count: int
+    displays: List[YabaiDisplay] = field(default_factory=list)
+    source: str = "default"
+    fingerprint: str = ""
+
+    @staticmethod
+    def compute_fingerprint(count: int, displays: List[YabaiDisplay]) -> str:
+        shape = [count] + sorted(
+            (d.uuid or str(d.id), tuple(sorted(d.frame.items()))) for d in displays
+        )
+        return hashlib.sha1(repr(shape).encode()).hexdigest()[:12]
+
+
+class DisplayTopologyService:
+    """
+    Resolves the display topology once and serves it from memory.
+
+    The count comes from the adaptive display count file when it holds a
+    sane value, otherwise from yabai, otherwise the dual-display default.
+    The cached topology is dropped when a display is added, removed, moved
+    or resized (via an attached workspace model) or when the count file's
+    mtime changes, which is a single stat per lookup.
+    """
+
+    def __init__(
+        self, client: Optional[YabaiClient] = None, count_file: Path = COUNT_FILE
+    ):
+        if client is None:
+            from .state_cache import shared_client
+
+            client = shared_client()
+        self.client = client
+        self.count_file = Path(count_file)
+        self._topology: Optional[DisplayTopology] = None
+        self._file_stamp: Optional[Tuple[float, int]] = None
+        self._attached = set()
+        self._listeners: List[Callable[[DisplayTopology], None]] = []
+        self._lock = threading.Lock()
+        self.resolutions = 0
+
+    def current(self) -> DisplayTopology:
+        """The current topology, resolved only if something changed"""
+        with self._lock:
+            stamp = self._stat_count_file()
+            if self._topology is None or stamp != self._file_stamp:
+                self._topology = self._resolve()
+                self._file_stamp = stamp
+            return self._topology
+
+    @property
+    def count(self) -> int:
+        return self.current().count
+
+    def invalidate(self):
+        with self._lock:
+            self._topology = None
+
+    def subscribe(self, callback: Callable[[DisplayTopology], None]):
+        """Call ``callback(topology)`` when a hotplug event changes the fingerprint"""
+        self._listeners.append(callback)
+
+    def attach(self, model):
+        """Invalidate on the workspace model's display hotplug events"""
+        if id(model) in self._attached:
+            return
+        self._attached.add(id(model))
+
+        def on_event(event):
+            if event.event in TOPOLOGY_EVENTS:
+                previous = self._topology
+                self.invalidate()
+                if self._listeners:
+                    self._notify(previous)
+
+        model.subscribe(on_event)
+
+    def _notify(self, previous: Optional[DisplayTopology]):
+        topology = self.current()
+        if previous is not None and previous.fingerprint == topology.fingerprint:
+            return
+        for callback in list(self._listeners):
+            try:
+                callback(topology)
+            except Exception as e:
+                logger.warning(f"⚠️ Display topology listener failed: {e}")
+
+    def _stat_count_file(self) -> Optional[Tuple[float, int]]:
+        try:
+            stat = self.count_file.stat()
+            return (stat.st_mtime, stat.st_size)
+        except OSError:
+            return None
+
+    def _resolve(self) -> DisplayTopology:
+        self.resolutions += 1
+        try:
+            displays = self.client.query_displays()
+        except YabaiError as e:
+            logger.debug(f"YABAI display query failed: {e}")
+            displays = []
+
+        count, source = self._count_from_file(), "file"
+        if count is None and 1 <= len(displays) <= MAX_COUNT:
+            count, source = len(displays), "yabai"
+        if count is None:
+            logger.warning(
+                f"⚠️ Could not detect display count, defaulting to {DEFAULT_COUNT}"
+            )
+            count, source = DEFAULT_COUNT, "default"
+
+        topology = DisplayTopology(
+            count,
+            displays,
+            source,
+            DisplayTopology.compute_fingerprint(count, displays),
+        )
+        logger.debug(
+            f"Display topology {topology.fingerprint}: {count} displays from {source}"
+        )
+        return topology
+
+    def _count_from_file(self) -> Optional[int]:
+        try:
+            count = int(self.count_file.read_text().strip())
+        except (OSError, ValueError):
+            return None
+        return count if 1 <= count <= MAX_COUNT else None
+
+
+_shared_service: Optional[DisplayTopologyService] = None
+_shared_lock = threading.Lock()
+
+
+def shared_topology() -> DisplayTopologyService:
+    """Process-wide topology service"""
+    global _shared_service
+    with _shared_lock:
+        if _shared_service is None:
+            _shared_service = DisplayTopologyService()
+        return _shared_service
+
+
+def current_topology() -> DisplayTopology:
+    """Shortcut for ``shared_topology().current()``"""
+    return shared_topology().current()
@@ -8,14 +8,32 @@ import os
 import sys
 import json
 import yaml
-import subprocess
 import asyncio
+import threading
+import time as timer
+from collections import Counter, deque
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, time
 import logging
 
+from .yabai import YabaiError, YabaiWindow
+from .state_cache import shared_client
+from .workspace_model import WorkspaceModel
+from .window_batch import CommandResult, WindowCommandBatch, select_windows
+from .app_readiness import AppReadinessWaiter
+from .process_table import shared_process_table
+from .app_launcher import AppLauncher, LaunchResult, launched_apps
+from .layout_journal import LayoutJournal
+from .display_topology import DisplayTopology, shared_topology
+from .layout_plans import RULE_LABEL_PREFIX, LayoutPlanCompiler, LayoutPlanStore
+from .tool_assignment import assign_tools
+from .suggestion_index import SuggestionIndex
+from ..utils.logger import log_operation
+
+HISTORY_SIZE = 100
+
 # Add N8N Workflows v2 to path
 sys.path.append('/Volumes/MICRO/Documents/Projects/N8N_Workflows_v2/src')
 
@@ -37,6 +55,7 @@ class Display:
     apps: List[str]
     current_tool: Optional[str] = None
     layout: str = "bsp"
+    stacked_tools: List[str] = field(default_factory=list)  # extra tools sharing the display
 
 
 @dataclass
@@ -55,10 +74,18 @@ class DynamicLayoutManager:
     Manages dynamic layout switching for YABAI + N8N Workflows v2
     """
     
-    def __init__(self, yabai_config_path: str = "configs/yabai_config.yaml"):
+    def __init__(self, yabai_config_path: str = "configs/yabai_config.yaml",
+                 workspace_model: Optional[WorkspaceModel] = None):
         self.logger = setup_logger("DynamicLayout") if setup_logger else logging.getLogger("DynamicLayout")
         self.yabai_config_path = Path(yabai_config_path)
         self.n8n_config = None
+        self.yabai = shared_client()
+        self.processes = shared_process_table()
+        self.launcher = AppLauncher(processes=self.processes)
+        self.workspace_model = workspace_model
+        self.topology = shared_topology()
+        if workspace_model:
+            self.topology.attach(workspace_model)
         
         # Load configurations
         self.load_yabai_config()
@@ -73,7 +100,23 @@ class DynamicLayoutManager:
         
         # Current state
         self.current_profile = "work"
-        self.layout_history = []
+        self.layout_history = deque(maxlen=HISTORY_SIZE)
+        self.journal = LayoutJournal(Path("configs/layout_state.json"))
+        self.launch_results: Dict[int, Dict[str, LaunchResult]] = {}
+        # Concurrent swaps share history and the state file; re-entrant so a
+        # swap can compact the journal while holding it
+        self._state_lock = threading.RLock()
+        self._applied_seq = 0  # last journal record reflected in memory
+        
+        # Tool suggestions per (profile, display id)
+        self.suggestions = SuggestionIndex()
+        
+        # Precompiled per-topology plans, applied on display hotplug
+        self.plan_compiler = LayoutPlanCompiler(self)
+        self.plans = LayoutPlanStore(config=self.plan_compiler.inputs())
+        self._applied_rule_labels = set()  # rules the last applied plan added
+        if workspace_model:
+            self.topology.subscribe(self._on_topology_change)
         
     def load_yabai_config(self):
         """Load YABAI configuration"""
@@ -100,41 +143,20 @@ class DynamicLayoutManager:
             self.n8n_config = {}
     
     def _get_current_display_count(self) -> int:
-        """Get current display count from various sources"""
+        """Get current display count from the cached display topology"""
         try:
-            # Try reading from adaptive display config
-            config_file = Path("configs/current_display_count.txt")
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    count = int(f.read().strip())
-                    if 1 <= count <= 3:
-                        return count
-            
-            # Try YABAI query
-            result = subprocess.run(
-                ["yabai", "-m", "query", "--displays"], 
-                capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                import json
-                displays = json.loads(result.stdout)
-                count = len(displays)
-                if 1 <= count <= 3:
-                    return count
-            
-            # Fallback: assume 2 displays (common dual setup)
-            self.logger.warning("⚠️ Could not detect display count, defaulting to 2")
-            return 2
-            
+            return self.topology.current().count
         except Exception as e:
             self.logger.error(f"❌ Error detecting display count: {e}")
             return 2
     
-    def _get_display_preference(self, preference_type: str) -> List[int]:
-        """Get display preferences based on current display count"""
-        if self.display_count == 1:
+    def _get_display_preference(self, preference_type: str, display_count: Optional[int] = None) -> List[int]:
+        """Get display preferences based on current (or the given) display count"""
+        if display_count is None:
+            display_count = self.display_count
+        if display_count == 1:
             return [1]  # Single display - everything goes to main
-        elif self.display_count == 2:
+        elif display_count == 2:
             if preference_type == "primary":
                 return [2, 1]  # Prefer right (main), fallback left
             elif preference_type == "secondary":
@@ -151,12 +173,11 @@ class DynamicLayoutManager:
             else:
                 return [2, 1, 3]  # Default to primary
     
-    def _create_displays(self) -> Dict[str, Display]:
+    def _create_displays(self, display_count: Optional[int] = None) -> Dict[str, Display]:
         """Create display objects from configuration with adaptive support"""
         displays = {}
         
-        # Load current display count
-        current_display_count = self._get_current_display_count()
+        current_display_count = display_count or self.display_count
         
         if current_display_count == 1:
             # Single display configuration
@@ -213,8 +234,9 @@ class DynamicLayoutManager:
         
         return displays
     
-    def _create_tools(self) -> Dict[str, Tool]:
+    def _create_tools(self, display_count: Optional[int] = None) -> Dict[str, Tool]:
         """Create tool objects from configuration"""
+        preference = lambda kind: self._get_display_preference(kind, display_count)
         tools = {
             # Development Tools
             "code_editor": Tool(
@@ -223,7 +245,7 @@ class DynamicLayoutManager:
                 apps=["Visual Studio Code", "Xcode", "PyCharm", "IntelliJ IDEA"],
                 description="Code editing and development",
                 workspace_profile="work",
-                display_preference=self._get_display_preference("primary")
+                display_preference=preference("primary")
             ),
             
             "terminal": Tool(
@@ -232,7 +254,7 @@ class DynamicLayoutManager:
                 apps=["Terminal", "iTerm2", "Alacritty"],
                 description="Command line interface", 
                 workspace_profile="work",
-                display_preference=self._get_display_preference("primary")
+                display_preference=preference("primary")
             ),
             
             # AI Tools
@@ -242,7 +264,7 @@ class DynamicLayoutManager:
                 apps=["ChatGPT", "Grok", "Claude", "Perplexity"],
                 description="AI chat and assistance",
                 workspace_profile="ai_research",
-                display_preference=self._get_display_preference("primary")
+                display_preference=preference("primary")
             ),
             
             "ai_development": Tool(
@@ -251,7 +273,7 @@ class DynamicLayoutManager:
                 apps=["Ollama", "LM Studio", "MLX", "Jupyter Notebook"],
                 description="AI model development and testing",
                 workspace_profile="ai_research",
-                display_preference=self._get_display_preference("primary")
+                display_preference=preference("primary")
             ),
             
             # Productivity Tools
@@ -261,7 +283,7 @@ class DynamicLayoutManager:
                 apps=["Notion", "Obsidian", "Calendar", "Reminders"],
                 description="Note-taking and productivity",
                 workspace_profile="personal",
-                display_preference=self._get_display_preference("communication")
+                display_preference=preference("communication")
             ),
             
             "communication": Tool(
@@ -270,7 +292,7 @@ class DynamicLayoutManager:
                 apps=["WhatsApp", "Slack", "Teams", "X", "Telegram"],
                 description="Communication and messaging",
                 workspace_profile="personal",
-                display_preference=self._get_display_preference("communication")
+                display_preference=preference("communication")
             ),
             
             # Web Tools
@@ -280,7 +302,7 @@ class DynamicLayoutManager:
                 apps=["Safari", "Chrome", "Firefox", "Vivaldi"],
                 description="Web browsing and research",
                 workspace_profile="work",
-                display_preference=self._get_display_preference("secondary")
+                display_preference=preference("secondary")
             ),
             
             # N8N Workflows v2 Tools
@@ -339,77 +361,91 @@ class DynamicLayoutManager:
                 "current_tool": display.current_tool,
                 "layout": display.layout
             }
+            if self.workspace_model:
+                status[display_name]["windows"] = self.workspace_model.window_count(display.id)
         
         return status
     
-    def swap_tool(self, display_name: str, tool_name: str) -> bool:
+    def swap_tool(self, display_name: str, tool_name: str, stack: bool = False) -> bool:
         """
         Swap a tool on a specific display
         
         Args:
             display_name: Name of the display (left, center, right)
             tool_name: Name of the tool to swap to
+            stack: Add the tool next to the display's current one instead of replacing it
             
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            # Validate display
-            if display_name not in self.displays:
-                self.logger.error(f"❌ Invalid display: {display_name}")
-                return False
-            
-            # Validate tool
-            if tool_name not in self.tools:
-                self.logger.error(f"❌ Invalid tool: {tool_name}")
+        with log_operation("swap_tool", display=display_name, tool=tool_name,
+                           profile=self.current_profile, stacked=stack) as op:
+            try:
+                # Validate display
+                if display_name not in self.displays:
+                    self.logger.error(f"❌ Invalid display: {display_name}")
+                    op["outcome"] = "invalid_display"
+                    return False
+                
+                # Validate tool
+                if tool_name not in self.tools:
+                    self.logger.error(f"❌ Invalid tool: {tool_name}")
+                    op["outcome"] = "invalid_tool"
+                    return False
+                
+                display = self.displays[display_name]
+                tool = self.tools[tool_name]
+                
+                # Check if tool can run on this display
+                if display.id not in tool.display_preference:
+                    self.logger.warning(f"⚠️ Tool {tool_name} not preferred for display {display_name}")
+                
+                # Record the swap
+                old_tool = display.current_tool
+                entry = {
+                    "timestamp": datetime.now().isoformat(),
+                    "display": display_name,
+                    "old_tool": old_tool,
+                    "new_tool": tool_name,
+                    "profile": self.current_profile
+                }
+                if stack:
+                    entry["stacked"] = True
+                
+                # Execute the swap
+                success = self._execute_tool_swap(display, tool, close_current=not stack)
+                
+                # Record what the launcher did for this swap
+                launches = self.launch_results.get(display.id, {})
+                entry["launches"] = {
+                    app: {"seconds": round(result.seconds, 3), "error": result.error}
+                    for app, result in launches.items() if not result.already_running
+                }
+                
+                if success:
+                    self.logger.info(f"✅ Swapped {tool_name} to {display_name} display")
+                    self._commit_swap(display, entry)
+                else:
+                    self.logger.error(f"❌ Failed to swap {tool_name} to {display_name}")
+                
+                op["outcome"] = "ok" if success else "failure"
+                return success
+                
+            except Exception as e:
+                self.logger.error(f"❌ Error during tool swap: {e}")
+                op["outcome"] = "error"
+                op["error"] = str(e)
                 return False
-            
-            display = self.displays[display_name]
-            tool = self.tools[tool_name]
-            
-            # Check if tool can run on this display
-            if display.id not in tool.display_preference:
-                self.logger.warning(f"⚠️ Tool {tool_name} not preferred for display {display_name}")
-            
-            # Record the swap
-            old_tool = display.current_tool
-            display.current_tool = tool_name
-            
-            # Update layout history
-            self.layout_history.append({
-                "timestamp": datetime.now().isoformat(),
-                "display": display_name,
-                "old_tool": old_tool,
-                "new_tool": tool_name,
-                "profile": self.current_profile
-            })
-            
-            # Execute the swap
-            success = self._execute_tool_swap(display, tool)
-            
-            if success:
-                self.logger.info(f"✅ Swapped {tool_name} to {display_name} display")
-                self._save_layout_state()
-            else:
-                # Revert on failure
-                display.current_tool = old_tool
-                self.logger.error(f"❌ Failed to swap {tool_name} to {display_name}")
-            
-            return success
-            
-        except Exception as e:
-            self.logger.error(f"❌ Error during tool swap: {e}")
-            return False
     
-    def _execute_tool_swap(self, display: Display, tool: Tool) -> bool:
+    def _execute_tool_swap(self, display: Display, tool: Tool, close_current: bool = True) -> bool:
         """Execute the actual tool swap"""
         try:
             # 1. Close current apps on display (if any)
-            if display.current_tool:
+            if close_current and display.current_tool:
                 self._close_display_apps(display)
             
             # 2. Launch new tool apps
-            self._launch_tool_apps(tool, display.id)
+            self.launch_results[display.id] = self._launch_tool_apps(tool, display.id)
             
             # 3. Update YABAI workspace
             self._update_yabai_workspace(display.id, tool)
@@ -422,53 +458,64 @@ class DynamicLayoutManager:
         except Exception as e:
             self.logger.error(f"❌ Error executing tool swap: {e}")
             return False
+        
+        finally:
+            # Windows and spaces changed behind the client's back
+            self.yabai.invalidate()
+    
+    def _find_windows(self, app: Optional[str] = None, display: Optional[int] = None) -> List[YabaiWindow]:
+        """Find windows from the live model if attached, otherwise with one query"""
+        if self.workspace_model:
+            return self.workspace_model.index.windows(app=app, display=display)
+        return select_windows(self.yabai.query_windows(display=display), app=app)
     
-    def _close_display_apps(self, display: Display):
+    def _close_display_apps(self, display: Display) -> List[CommandResult]:
         """Close apps on a specific display"""
         try:
-            # Get current apps on display
-            cmd = f"yabai -m query --displays --display {display.id}"
-            result = subprocess.run(cmd.split(), capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                # Close windows on this display
-                cmd = f"yabai -m query --windows --display {display.id} | jq '.[].id' | xargs -I {{}} yabai -m window {{}} --close"
-                subprocess.run(cmd, shell=True)
+            windows = self._find_windows(display=display.id)
+            results = WindowCommandBatch(self.yabai).close(windows).execute()
+            closed = sum(1 for r in results if r.success)
+            self.logger.info(f"🧹 Closed {closed}/{len(results)} windows on display {display.id}")
+            return results
                 
         except Exception as e:
             self.logger.warning(f"⚠️ Error closing display apps: {e}")
+            return []
     
-    def _launch_tool_apps(self, tool: Tool, display_id: int):
+    def _launch_tool_apps(self, tool: Tool, display_id: int) -> Dict[str, LaunchResult]:
         """Launch apps for a specific tool"""
         try:
-            for app in tool.apps:
-                # Check if app is already running
-                cmd = f"pgrep -x '{app}'"
-                result = subprocess.run(cmd, shell=True, capture_output=True)
-                
-                if result.returncode != 0:
-                    # Launch app
-                    cmd = f"open -a '{app}'"
-                    subprocess.run(cmd, shell=True)
-                    
-                    # Move to correct display
-                    self._move_app_to_display(app, display_id)
+            # Apps already running are skipped; the rest launch concurrently
+            results = self.launcher.launch(tool.apps)
+            
+            # Move to correct display once each app has a window
+            launched = launched_apps(results)
+            if launched:
+                self._move_apps_when_ready(launched, display_id)
+            return results
                     
         except Exception as e:
             self.logger.warning(f"⚠️ Error launching tool apps: {e}")
+            return {}
     
     def _move_app_to_display(self, app_name: str, display_id: int):
         """Move app to specific display"""
+        self._move_apps_when_ready([app_name], display_id)
+    
+    def _move_apps_when_ready(self, apps: List[str], display_id: int) -> List[CommandResult]:
+        """Wait for every app's first window concurrently, then move them all"""
         try:
-            # Wait a moment for app to launch
-            asyncio.sleep(1)
+            waiter = AppReadinessWaiter(self.yabai, self.workspace_model)
+            ready = waiter.wait_for_apps_blocking(apps)
             
-            # Move app to display
-            cmd = f"yabai -m query --windows | jq '.[] | select(.app == \"{app_name}\") | .id' | xargs -I {{}} yabai -m window {{}} --display {display_id}"
-            subprocess.run(cmd, shell=True)
+            batch = WindowCommandBatch(self.yabai)
+            for windows in ready.values():
+                batch.move_to_display(windows, display_id)
+            return batch.execute()
             
         except Exception as e:
             self.logger.warning(f"⚠️ Error moving app to display: {e}")
+            return []
     
     def _update_yabai_workspace(self, display_id: int, tool: Tool):
         """Update YABAI workspace for the tool"""
@@ -476,8 +523,7 @@ class DynamicLayoutManager:
             # Set workspace layout based on tool
             layout = self._get_optimal_layout(tool)
             
-            cmd = f"yabai -m space --layout {layout}"
-            subprocess.run(cmd, shell=True)
+            self.yabai.request("space", "--layout", layout)
             
         except Exception as e:
             self.logger.warning(f"⚠️ Error updating YABAI workspace: {e}")
@@ -496,72 +542,178 @@ class DynamicLayoutManager:
         
         return layout_map.get(tool.category, "bsp")
     
-    def _save_layout_state(self):
-        """Save current layout state"""
+    def _commit_swap(self, display: Display, entry: Dict[str, Any]):
+        """Apply a successful swap to the in-memory state and journal it"""
+        # One lock for both, so a checkpoint never holds a swap its sequence
+        # number says is still to be replayed
+        with self._state_lock:
+            if entry.get("stacked"):
+                display.stacked_tools.append(entry["new_tool"])
+            else:
+                display.current_tool = entry["new_tool"]
+                display.stacked_tools = []
+            self.layout_history.append(entry)
+            self._save_layout_state(entry, display.layout)
+    
+    def _save_layout_state(self, entry: Dict[str, Any], layout: str):
+        """Journal a successful swap, compacting into a checkpoint now and then"""
         try:
+            with self._state_lock:
+                record = self.journal.append(dict(entry, event="swap", layout=layout))
+                self._applied_seq = record["seq"]
+                if self.journal.needs_compaction:
+                    self._write_checkpoint()
+                
+        except Exception as e:
+            self.logger.error(f"❌ Error saving layout state: {e}")
+    
+    def _write_checkpoint(self):
+        """Fold the journal into a full layout state checkpoint"""
+        with self._state_lock:
             state = {
                 "timestamp": datetime.now().isoformat(),
                 "current_profile": self.current_profile,
                 "displays": {
                     name: {
                         "current_tool": display.current_tool,
+                        "stacked_tools": list(display.stacked_tools),
                         "layout": display.layout
                     }
                     for name, display in self.displays.items()
                 },
-                "layout_history": self.layout_history[-10:]  # Keep last 10 entries
+                "layout_history": list(self.layout_history)
             }
-            
-            state_file = Path("configs/layout_state.json")
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2)
-                
-        except Exception as e:
-            self.logger.error(f"❌ Error saving layout state: {e}")
+            self.journal.checkpoint(state, seq=self._applied_seq)
     
     def load_layout_state(self):
-        """Load saved layout state"""
+        """Load saved layout state: the checkpoint, then the journal tail"""
         try:
-            state_file = Path("configs/layout_state.json")
-            if state_file.exists():
-                with open(state_file, 'r') as f:
-                    state = json.load(f)
-                
-                # Restore display states
-                for display_name, display_state in state.get("displays", {}).items():
-                    if display_name in self.displays:
-                        self.displays[display_name].current_tool = display_state.get("current_tool")
-                        self.displays[display_name].layout = display_state.get("layout", "bsp")
-                
-                # Restore profile
-                self.current_profile = state.get("current_profile", "work")
-                
-                # Restore history
-                self.layout_history = state.get("layout_history", [])
-                
-                self.logger.info("✅ Layout state restored")
+            state, tail = self.journal.load()
+            if not state and not tail:
+                return
+            
+            # Restore display states
+            for display_name, display_state in state.get("displays", {}).items():
+                if display_name in self.displays:
+                    self.displays[display_name].current_tool = display_state.get("current_tool")
+                    self.displays[display_name].stacked_tools = list(display_state.get("stacked_tools", []))
+                    self.displays[display_name].layout = display_state.get("layout", "bsp")
+            
+            # Restore profile
+            self.current_profile = state.get("current_profile", "work")
+            
+            # Restore history
+            self.layout_history = deque(state.get("layout_history", []), maxlen=HISTORY_SIZE)
+            
+            # Replay swaps made since the checkpoint
+            for record in tail:
+                if record.get("event") != "swap":
+                    continue
+                display = self.displays.get(record.get("display"))
+                if display:
+                    if record.get("stacked"):
+                        display.stacked_tools.append(record.get("new_tool"))
+                    else:
+                        display.current_tool = record.get("new_tool")
+                        display.stacked_tools = []
+                    display.layout = record.get("layout", display.layout)
+                self.current_profile = record.get("profile", self.current_profile)
+                self.layout_history.append(
+                    {k: v for k, v in record.items() if k not in ("event", "layout", "seq")}
+                )
+            
+            self._applied_seq = max([state.get("seq", 0)] + [r["seq"] for r in tail])
+            self.logger.info(f"✅ Layout state restored ({len(tail)} journal entries)")
                 
         except Exception as e:
             self.logger.error(f"❌ Error loading layout state: {e}")
     
+    def compile_layout_plans(self) -> int:
+        """Precompile plans for every known topology and store them; returns the plan count"""
+        compiled = self.plan_compiler.compile_known(self.topology.current())
+        self.plans.update(compiled)
+        self.plans.save()
+        count = sum(len(plans) for plans in compiled.values())
+        self.logger.info(f"✅ Compiled {count} layout plans for {len(compiled)} topologies")
+        return count
+    
+    def apply_layout_plan(self, topology: Optional[DisplayTopology] = None,
+                          profile: Optional[str] = None) -> List[CommandResult]:
+        """Switch to the precompiled plan for a topology (compiling it only on a miss)"""
+        start = timer.perf_counter()
+        topology = topology or self.topology.current()
+        profile = profile or self.current_profile
+        
+        plan = self.plans.get(topology, profile)
+        if plan is None:
+            self.plans.update({topology.fingerprint: self.plan_compiler.compile(topology)})
+            self.plans.save()
+            plan = self.plans.get(topology, profile)
+            if plan is None:
+                self.logger.error(f"❌ No layout plan for profile {profile}")
+                return []
+        
+        # Adopt the plan's displays and preferences as-is
+        self.display_count = plan.display_count
+        self.displays = {name: Display(**fields) for name, fields in plan.displays.items()}
+        for tool_key, preference in plan.preferences.items():
+            if tool_key in self.tools:
+                self.tools[tool_key].display_preference = list(preference)
+        self.suggestions.invalidate()
+        
+        commands = plan.commands_for(topology)
+        if not topology.displays:
+            self.logger.warning("⚠️ Display spaces unknown; leaving space layouts unchanged")
+        
+        batch = WindowCommandBatch(self.yabai)
+        # Drop the previous plan's rules so they don't pile up across switches
+        for label in self._plan_rule_labels():
+            batch.add("rule", "--remove", label)
+        for command in commands:
+            batch.add(*command)
+        self._applied_rule_labels = {
+            command[2].partition("=")[2] for command in commands if command[:2] == ["rule", "--add"]
+        }
+        for window in self._find_windows():
+            if window.app in plan.apps:
+                batch.move_to_display([window], plan.apps[window.app])
+        results = batch.execute()
+        
+        self.logger.info(
+            f"✅ Applied {profile} plan for {plan.display_count} displays "
+            f"({len(results)} commands in {timer.perf_counter() - start:.3f}s)"
+        )
+        return results
+    
+    def _plan_rule_labels(self) -> List[str]:
+        """Labels of the plan rules yabai has installed (those applied here if it can't list them)"""
+        try:
+            rules = json.loads(self.yabai.request("rule", "--list") or "[]")
+            return [r["label"] for r in rules if str(r.get("label", "")).startswith(RULE_LABEL_PREFIX)]
+        except (YabaiError, ValueError, TypeError, KeyError) as e:
+            self.logger.debug(f"Could not list yabai rules: {e}")
+            return sorted(self._applied_rule_labels)
+    
+    def _on_topology_change(self, topology: DisplayTopology):
+        """Display hotplug: switch to the stored plan instead of rebuilding"""
+        self.logger.info(f"🖥️ Display topology changed: {topology.count} displays")
+        self.apply_layout_plan(topology)
+    
     def get_layout_suggestions(self, display_name: str) -> List[Tool]:
         """Get tool suggestions for a display"""
         if display_name not in self.displays:
             return []
         
         display = self.displays[display_name]
-        available_tools = self.get_available_tools()
-        
-        # Filter tools that can run on this display
-        suggestions = []
-        for tool in available_tools:
-            if display.id in tool.display_preference:
-                suggestions.append(tool)
-        
-        # Sort by preference (display_id index in preference list)
-        suggestions.sort(key=lambda t: tool.display_preference.index(display.id))
         
-        return suggestions
+        # Tools that can run on this display, by preference (display_id index in preference list)
+        self.suggestions.ensure(self.tools.values(), (d.id for d in self.displays.values()),
+                                self._suggestion_source())
+        return self.suggestions.get(self.current_profile, display.id)
+    
+    def _suggestion_source(self):
+        """Identity of the tools and topology the suggestion index was built from"""
+        return (self.tools, self.displays, self.display_count)
     
     def create_quick_swap_menu(self):
         """Create a quick swap menu for all displays"""
@@ -579,18 +731,128 @@ class DynamicLayoutManager:
         
         return "\n".join(menu_items)
     
-    def swap_by_profile(self, profile: str):
-        """Swap all displays to tools for a specific profile"""
+    def swap_by_profile(self, profile: str, concurrent: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Swap all displays to tools for a specific profile
+        
+        Args:
+            profile: Workspace profile to switch to
+            concurrent: Run independent displays' swaps at the same time
+            
+        Returns:
+            Per-display result: {"tool", "success", "seconds"}, plus
+            "stacked" when extra tools share the display
+        """
         self.current_profile = profile
-        available_tools = self.get_available_tools(profile)
+        try:
+            windows = self._find_windows()
+        except YabaiError as e:
+            self.logger.debug(f"Planning without window positions: {e}")
+            windows = []
+        assignments = self._plan_profile_swap(profile, windows=windows)
+        
+        start = timer.perf_counter()
+        if concurrent and not self._in_event_loop():
+            timings = asyncio.run(self.swap_by_profile_async(assignments))
+        else:
+            # Callers already inside an event loop should await swap_by_profile_async
+            timings = self._run_swap_group(assignments)
+        elapsed = timer.perf_counter() - start
+        
+        for display_name, timing in timings.items():
+            self.logger.info(
+                f"⏱️ {display_name}: {timing['tool']} in {timing['seconds']:.2f}s"
+                f"{'' if timing['success'] else ' (failed)'}"
+            )
+        self.logger.info(f"✅ Swapped to {profile} profile in {elapsed:.2f}s")
+        return timings
+    
+    async def swap_by_profile_async(self, assignments: List[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+        """Run (display, tool) swaps, one task per group of displays that share apps"""
+        groups = self._group_by_shared_apps(assignments)
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._run_swap_group, group) for group in groups
+        ))
+        
+        timings = {}
+        for result in results:
+            timings.update(result)
+        # Report in display order, not completion order
+        return {name: timings[name] for name, _ in assignments}
+    
+    @staticmethod
+    def _in_event_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+    
+    def _plan_profile_swap(self, profile: str, displays: Optional[Dict[str, Display]] = None,
+                           tools: Optional[Dict[str, Tool]] = None,
+                           windows: Optional[List[YabaiWindow]] = None) -> List[Tuple[str, str]]:
+        """
+        Place the profile's tools on displays by min-cost assignment.
         
-        # Distribute tools across displays
-        for i, (display_name, display) in enumerate(self.displays.items()):
-            if i < len(available_tools):
-                tool = available_tools[i]
-                self.swap_tool(display_name, tool.name)
+        Costs combine each tool's display_preference rank, its apps already
+        showing on a display and the windows that would have to move; tools
+        beyond the display count are stacked. Returns (display, tool key)
+        pairs, a display's first tool before any stacked on it.
+        """
+        displays = self.displays if displays is None else displays
+        tools = self.tools if tools is None else tools
+        open_windows = Counter((w.app, w.display) for w in windows or [])
         
-        self.logger.info(f"✅ Swapped to {profile} profile")
+        return assign_tools(
+            [(key, tool.display_preference, tool.apps)
+             for key, tool in tools.items() if tool.workspace_profile == profile],
+            [(name, display.id) for name, display in displays.items()],
+            open_windows
+        )
+    
+    def _group_by_shared_apps(self, assignments: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+        """
+        Split swaps into independent groups.
+        
+        Two swaps conflict when they touch the same app, either by launching
+        it or by closing the display's current tool. Conflicting swaps stay
+        in one group, in their original order.
+        """
+        groups: List[Tuple[set, List[Tuple[str, str]]]] = []
+        for display_name, tool_key in assignments:
+            # Tools stacked on one display also run in order
+            apps = set(self.tools[tool_key].apps) | {("display", display_name)}
+            current = self.displays[display_name].current_tool
+            if current in self.tools:
+                apps.update(self.tools[current].apps)
+            
+            overlapping = [g for g in groups if g[0] & apps]
+            merged_apps = apps.union(*(g[0] for g in overlapping))
+            merged = sorted(
+                [a for g in overlapping for a in g[1]] + [(display_name, tool_key)],
+                key=assignments.index
+            )
+            groups = [g for g in groups if g not in overlapping]
+            groups.append((merged_apps, merged))
+        
+        return sorted((swaps for _, swaps in groups), key=lambda swaps: assignments.index(swaps[0]))
+    
+    def _run_swap_group(self, swaps: List[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+        """Run swaps one after another, timing each"""
+        timings = {}
+        for display_name, tool_key in swaps:
+            start = timer.perf_counter()
+            timing = timings.get(display_name)
+            # A display's later tools are stacked next to its first one
+            success = self.swap_tool(display_name, tool_key, stack=timing is not None)
+            elapsed = timer.perf_counter() - start
+            if timing is None:
+                timings[display_name] = {"tool": tool_key, "success": success, "seconds": elapsed}
+            else:
+                timing.setdefault("stacked", []).append(tool_key)
+                timing["success"] = timing["success"] and success
+                timing["seconds"] += elapsed
+        return timings
 
 
 class LayoutCLI:
@@ -667,8 +929,9 @@ class LayoutCLI:
             tool_choice = int(input("Select tool: ")) - 1
             tool = suggestions[tool_choice]
             
-            # Execute swap
-            success = self.manager.swap_tool(display_name, tool.name)
+            # Execute swap (swap_tool takes the tool's key, not its display name)
+            tool_key = next(key for key, t in self.manager.tools.items() if t is tool)
+            success = self.manager.swap_tool(display_name, tool_key)
             if success:
                 print(f"✅ Swapped {tool.name} to {display_name}")
             else:
@@ -706,7 +969,7 @@ class LayoutCLI:
         print("\n📜 Layout History:")
         print("-" * 40)
         
-        for entry in self.manager.layout_history[-5:]:  # Last 5 entries
+        for entry in list(self.manager.layout_history)[-5:]:  # Last 5 entries
             timestamp = entry["timestamp"][:19]  # Remove microseconds
             print(f"{timestamp}: {entry['display']} - {entry['old_tool']} → {entry['new_tool']}")
 
@@ -738,11 +1001,22 @@ def main():
             status = manager.get_display_status()
             print(json.dumps(status, indent=2))
         
+        elif sys.argv[1] == "compile":
+            count = manager.compile_layout_plans()
+            print(f"✅ Compiled {count} layout plans")
+        
+        elif sys.argv[1] == "plan":
+            results = manager.apply_layout_plan(profile=sys.argv[2] if len(sys.argv) >= 3 else None)
+            failed = [r for r in results if not r.success]
+            print("✅ Success" if not failed else f"⚠️ {len(failed)} commands failed")
+        
         else:
             print("Usage:")
             print("  python dynamic_layout_manager.py swap <display> <tool>")
             print("  python dynamic_layout_manager.py profile <profile_name>")
             print("  python dynamic_layout_manager.py status")
+            print("  python dynamic_layout_manager.py compile")
+            print("  python dynamic_layout_manager.py plan [profile_name]")
             print("  python dynamic_layout_manager.py (interactive mode)")
     
     else:
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Layout Journal
+Append-only log of layout events with batched fsync, periodically compacted
+into a checkpoint file
+"""
+
+import os
+import json
+import atexit
+import weakref
+import threading
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FSYNC_BATCH = 16  # records
+FSYNC_INTERVAL = 0.5  # seconds
+COMPACT_EVERY = 200  # records since the last checkpoint
+
+
+class LayoutJournal:
+    """
+    Checkpoint + journal pair.
+
+    ``append`` writes one JSON line and flushes it to the OS; the file is
+    fsynced once ``fsync_batch`` records have accumulated, or by a timer
+    ``fsync_interval`` seconds after the first unsynced record, so a burst
+    of swaps costs one fsync. Every record carries a sequence number, and
+    the checkpoint remembers the last one it folded in, so a crash between
+    writing a checkpoint and truncating the journal never replays an event
+    twice. Numbering resumes from what is already on disk, so a new process
+    never reuses a sequence number the checkpoint has folded in.
+    """
+
+    def __init__(
+        self,
+        checkpoint_path: Path,
+        journal_path: Optional[Path] = None,
+        fsync_batch: int = FSYNC_BATCH,
+        fsync_interval: float = FSYNC_INTERVAL,
+        compact_every: int = COMPACT_EVERY,
+    ):
+        self.checkpoint_path = Path(checkpoint_path)
+        self.journal_path = (
+            Path(journal_path)
+            if journal_path
+            else self.checkpoint_path.with_name(
+                self.checkpoint_path.stem + ".journal.jsonl"
+            )
+        )
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+        self.compact_every = compact_every
+        self.seq = 0
+        self.pending = 0  # records since the last checkpoint
+        self._unsynced = 0
+        self._timer: Optional[threading.Timer] = None
+        self._file = None
+        self._lock = threading.Lock()
+        _open_journals.add(self)
+        try:
+            self.load()
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"⚠️ Could not read {self.checkpoint_path}, "
+                f"numbering the journal from 0: {e}"
+            )
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self.pending >= self.compact_every
+
+    def load(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Checkpoint state plus the journal records written after it"""
+        state: Dict[str, Any] = {}
+        if self.checkpoint_path.exists():
+            with open(self.checkpoint_path, "r") as f:
+                state = json.load(f)
+        checkpoint_seq = state.get("seq", 0)
+        tail = self._read_journal(after=checkpoint_seq)
+
+        with self._lock:
+            self.seq = max([checkpoint_seq] + [r["seq"] for r in tail])
+            self.pending = len(tail)
+        return state, tail
+
+    def append(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Journal one event; returns it with its sequence number"""
+        with self._lock:
+            self.seq += 1
+            record = dict(record, seq=self.seq)
+            f = self._open()
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            f.flush()
+            self.pending += 1
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_batch:
+                self._sync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.fsync_interval, self._timed_flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return record
+
+    def checkpoint(self, state: Dict[str, Any], seq: Optional[int] = None):
+        """
+        Atomically replace the checkpoint with ``state`` and empty the journal.
+
+        ``seq`` is the last record ``state`` reflects (default: the last one
+        appended); records after it stay in the journal to be replayed.
+        """
+        with self._lock:
+            seq = self.seq if seq is None else seq
+            state = dict(state, seq=seq)
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.checkpoint_path.with_name(
+                self.checkpoint_path.name + ".tmp"
+            )
+            with open(tmp_path, "w") as f:
+                json.dump(state, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.checkpoint_path)
+
+            if self._file:
+                self._file.close()
+                self._file = None
+            # Records up to state["seq"] are in the checkpoint now
+            tail = self._read_journal(after=seq) if seq < self.seq else []
+            tmp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+            with open(tmp_path, "w") as f:
+                for record in tail:
+                    f.write(json.dumps(record, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.journal_path)
+            self.pending = len(tail)
+            self._unsynced = 0
+
+    def flush(self):
+        """fsync any buffered records now"""
+        with self._lock:
+            if self._file and self._unsynced:
+                self._sync()
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def _read_journal(self, after: int) -> List[Dict[str, Any]]:
+        records = []
+        if self.journal_path.exists():
+            with open(self.journal_path, "r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn final line from a crash mid-write
+                        logger.warning(
+                            "⚠️ Skipping unreadable journal line in "
+                            f"{self.journal_path}"
+                        )
+                        continue
+                    if record.get("seq", 0) > after:
+                        records.append(record)
+        return records
+
+    def _open(self):
+        if self._file is None:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.journal_path, "a")
+        return self._file
+
+    def _timed_flush(self):
+        with self._lock:
+            self._timer = None
+            if self._file and self._unsynced:
+                self._sync()
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+
+# One exit hook for every journal, holding none of them alive
+_open_journals: "weakref.WeakSet[LayoutJournal]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_journals():
+    for journal in list(_open_journals):
+        journal.close()
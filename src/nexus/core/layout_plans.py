@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Layout Plans
+Display/tool assignments and yabai commands precompiled per display
+topology and profile, stored on disk so a hotplug only has to look one up
+"""
+
+import os
+import json
+import hashlib
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .display_topology import MAX_COUNT, DisplayTopology
+
+logger = logging.getLogger(__name__)
+
+PLANS_FILE = Path("configs/layout_plans.json")
+RULE_LABEL_PREFIX = "nexus_"  # every yabai rule a plan adds carries it
+PLAN_FORMAT = 2  # bump when the shape of plans or their commands changes
+
+
+def app_pattern(app: str) -> str:
+    """Anchored yabai rule regex matching exactly ``app``"""
+    return "^" + "".join("\\" + c if c in ".^$*+?()[]{}|\\" else c for c in app) + "$"
+
+
+def rule_label(app: str) -> str:
+    """Label of the rule a plan adds for ``app``"""
+    return RULE_LABEL_PREFIX + app
+
+
+def count_fingerprint(display_count: int) -> str:
+    """Fingerprint of a topology known only by its display count"""
+    return DisplayTopology.compute_fingerprint(display_count, [])
+
+
+def space_layout_commands(
+    displays: Dict[str, Dict[str, Any]], topology: DisplayTopology
+) -> List[List[str]]:
+    """`space --layout` for the first space of every display given a tool"""
+    first_space = {d.index: d.spaces[0] for d in topology.displays if d.spaces}
+    return [
+        ["space", str(first_space[fields["id"]]), "--layout", fields["layout"]]
+        for fields in displays.values()
+        if fields["current_tool"] and fields["id"] in first_space
+    ]
+
+
+@dataclass
+class LayoutPlan:
+    """Everything needed to lay out one profile on one display topology"""
+
+    fingerprint: str
+    display_count: int
+    profile: str
+    displays: Dict[str, Dict[str, Any]]  # display name -> Display fields, tool assigned
+    preferences: Dict[str, List[int]]  # tool key -> preferred display ids
+    commands: List[List[str]] = field(default_factory=list)
+    apps: Dict[str, int] = field(
+        default_factory=dict
+    )  # app -> display id for open windows
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LayoutPlan":
+        return cls(**data)
+
+    def commands_for(self, topology: DisplayTopology) -> List[List[str]]:
+        """
+        Commands that apply this plan on ``topology``. A plan compiled for a
+        display count alone has no spaces, so it takes them from ``topology``.
+        """
+        if self.fingerprint != count_fingerprint(self.display_count):
+            return self.commands
+        return space_layout_commands(self.displays, topology) + self.commands
+
+
+class LayoutPlanCompiler:
+    """
+    Evaluates the manager's display, preference and tool rules for a given
+    topology without touching the manager's own state.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    def inputs(self) -> Dict[str, Any]:
+        """Everything plans are compiled from, for the store's config hash"""
+        manager = self.manager
+        return {
+            "yabai": manager.yabai_config,
+            "displays": {
+                count: {
+                    name: asdict(display)
+                    for name, display in manager._create_displays(count).items()
+                }
+                for count in range(1, MAX_COUNT + 1)
+            },
+            "tools": {
+                count: {
+                    key: asdict(tool)
+                    for key, tool in manager._create_tools(count).items()
+                }
+                for count in range(1, MAX_COUNT + 1)
+            },
+        }
+
+    def compile(self, topology: DisplayTopology) -> Dict[str, LayoutPlan]:
+        """One plan per profile for ``topology``"""
+        manager = self.manager
+        tools = manager._create_tools(topology.count)
+        profiles = sorted({tool.workspace_profile for tool in tools.values()})
+
+        plans = {}
+        for profile in profiles:
+            displays = manager._create_displays(topology.count)
+            commands, apps = [], {}
+            for display_name, tool_key in manager._plan_profile_swap(
+                profile, displays, tools
+            ):
+                display, tool = displays[display_name], tools[tool_key]
+                if display.current_tool:
+                    display.stacked_tools.append(tool_key)
+                else:
+                    display.current_tool = tool_key
+                    display.layout = manager._get_optimal_layout(tool)
+                for app in tool.apps:
+                    apps[app] = display.id
+                    # New windows of the app open on its display
+                    commands.append(
+                        [
+                            "rule",
+                            "--add",
+                            f"label={rule_label(app)}",
+                            f"app={app_pattern(app)}",
+                            f"display={display.id}",
+                        ]
+                    )
+
+            fields = {name: asdict(display) for name, display in displays.items()}
+            plans[profile] = LayoutPlan(
+                fingerprint=topology.fingerprint,
+                display_count=topology.count,
+                profile=profile,
+                displays=fields,
+                preferences={
+                    key: list(tool.display_preference) for key, tool in tools.items()
+                },
+                commands=space_layout_commands(fields, topology) + commands,
+                apps=apps,
+            )
+        return plans
+
+    def compile_known(
+        self, current: Optional[DisplayTopology] = None
+    ) -> Dict[str, Dict[str, LayoutPlan]]:
+        """Plans for the current topology and for every supported display count"""
+        topologies = [
+            DisplayTopology(count, [], "count", count_fingerprint(count))
+            for count in range(1, MAX_COUNT + 1)
+        ]
+        if current is not None:
+            topologies.append(current)
+        return {topology.fingerprint: self.compile(topology) for topology in topologies}
+
+
+class LayoutPlanStore:
+    """
+    Compiled plans on disk, keyed by topology fingerprint then profile.
+
+    Plans are tagged with a hash of the plan format and the configuration
+    they were compiled from, and are ignored once either changes.
+    """
+
+    def __init__(
+        self, path: Path = PLANS_FILE, config: Optional[Dict[str, Any]] = None
+    ):
+        self.path = Path(path)
+        self.config_hash = self.hash_config(config or {})
+        self.plans: Dict[str, Dict[str, LayoutPlan]] = {}
+        self.load()
+
+    @staticmethod
+    def hash_config(config: Dict[str, Any]) -> str:
+        versioned = {"format": PLAN_FORMAT, "config": config}
+        return hashlib.sha1(
+            json.dumps(versioned, sort_keys=True, default=str).encode()
+        ).hexdigest()[:12]
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("config_hash") != self.config_hash:
+            logger.info(
+                "🔄 Layout plans were compiled for another configuration; ignoring them"
+            )
+            return
+        self.plans = {
+            fingerprint: {
+                profile: LayoutPlan.from_dict(plan) for profile, plan in plans.items()
+            }
+            for fingerprint, plans in data.get("topologies", {}).items()
+        }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "config_hash": self.config_hash,
+                    "topologies": {
+                        fingerprint: {
+                            profile: plan.to_dict() for profile, plan in plans.items()
+                        }
+                        for fingerprint, plans in self.plans.items()
+                    },
+                },
+                f,
+                indent=2,
+            )
+        os.replace(tmp_path, self.path)
+
+    def update(self, plans: Dict[str, Dict[str, LayoutPlan]]):
+        self.plans.update(plans)
+
+    def get(self, topology: DisplayTopology, profile: str) -> Optional[LayoutPlan]:
+        """The plan for this exact topology, else the one for its display count"""
+        for fingerprint in (topology.fingerprint, count_fingerprint(topology.count)):
+            plan = self.plans.get(fingerprint, {}).get(profile)
+            if plan:
+                return plan
+        return None
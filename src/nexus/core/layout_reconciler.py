@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Layout Reconciler
+Captures full window placement and restores it by applying only the
+difference between the current and the saved layout
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .yabai import YabaiClient, YabaiWindow
+from .window_batch import CommandResult, WindowCommandBatch
+
+logger = logging.getLogger(__name__)
+
+# Commands run in this order: a window has to be on the right space before
+# its float state matters, and only floating windows keep an explicit frame
+PHASE_SPACE_LAYOUT = 0
+PHASE_MOVE = 1
+PHASE_FLOAT = 2
+PHASE_FRAME = 3
+
+FRAME_TOLERANCE = 2.0  # pixels
+
+
+@dataclass
+class WindowPlacement:
+    """Where a window lives and how it is shown"""
+
+    app: str
+    title: str
+    display: int
+    space: int
+    frame: Dict[str, float]
+    floating: bool = False
+    id: Optional[int] = None
+
+    @classmethod
+    def from_window(cls, window: YabaiWindow) -> "WindowPlacement":
+        return cls(
+            app=window.app,
+            title=window.title,
+            display=window.display,
+            space=window.space,
+            frame=dict(window.frame),
+            floating=window.is_floating,
+            id=window.id,
+        )
+
+
+@dataclass
+class LayoutSnapshot:
+    """Saved layout: window placements plus per-space layout type"""
+
+    name: str
+    timestamp: str
+    profile: Optional[str]
+    displays: int
+    windows: List[WindowPlacement] = field(default_factory=list)
+    spaces: Dict[int, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["spaces"] = {str(index): layout for index, layout in self.spaces.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LayoutSnapshot":
+        return cls(
+            name=data.get("name", ""),
+            timestamp=data.get("timestamp", ""),
+            profile=data.get("profile"),
+            displays=data.get("displays", 0),
+            windows=[WindowPlacement(**w) for w in data.get("windows", [])],
+            spaces={
+                int(index): layout for index, layout in data.get("spaces", {}).items()
+            },
+        )
+
+
+@dataclass
+class LayoutCommand:
+    """One yabai command in a restore plan"""
+
+    phase: int
+    args: List[str]
+    reason: str
+
+
+def save_layout(snapshot: LayoutSnapshot, path: Path):
+    """Write a layout snapshot as JSON"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(snapshot.to_dict(), f, indent=2)
+
+
+def load_layout(path: Path) -> LayoutSnapshot:
+    """Read a layout snapshot written by save_layout"""
+    with open(path, "r") as f:
+        return LayoutSnapshot.from_dict(json.load(f))
+
+
+class LayoutReconciler:
+    """
+    Turns the current window state into a saved layout with the minimal
+    command set: unchanged windows and spaces produce no commands at all.
+    """
+
+    def __init__(self, client: Optional[YabaiClient] = None):
+        if client is None:
+            from .state_cache import shared_client
+
+            client = shared_client()
+        self.client = client
+
+    def capture(
+        self, name: str = "current", profile: Optional[str] = None
+    ) -> LayoutSnapshot:
+        """Snapshot every window's display, space, frame and float state"""
+        return LayoutSnapshot(
+            name=name,
+            timestamp=datetime.now().isoformat(),
+            profile=profile,
+            displays=len(self.client.query_displays()),
+            windows=[
+                WindowPlacement.from_window(w) for w in self.client.query_windows()
+            ],
+            spaces={s.index: s.type for s in self.client.query_spaces()},
+        )
+
+    def plan(
+        self, target: LayoutSnapshot, current: Optional[LayoutSnapshot] = None
+    ) -> List[LayoutCommand]:
+        """Commands that turn ``current`` (captured if omitted) into ``target``"""
+        if current is None:
+            current = self.capture()
+
+        commands = []
+        for index, layout in sorted(target.spaces.items()):
+            if index in current.spaces and current.spaces[index] != layout:
+                commands.append(
+                    LayoutCommand(
+                        PHASE_SPACE_LAYOUT,
+                        ["space", str(index), "--layout", layout],
+                        f"space {index}: {current.spaces[index]} -> {layout}",
+                    )
+                )
+
+        for want, have in self._match(target.windows, current.windows):
+            commands.extend(self._diff_window(want, have, current))
+
+        commands.sort(key=lambda c: c.phase)
+        return commands
+
+    def restore(
+        self, target: LayoutSnapshot, current: Optional[LayoutSnapshot] = None
+    ) -> List[CommandResult]:
+        """Plan and apply a layout, reporting each command's outcome"""
+        commands = self.plan(target, current)
+        batch = WindowCommandBatch(self.client)
+        for command in commands:
+            batch.add(*command.args)
+        results = batch.execute()
+        logger.info(f"🔄 Layout '{target.name}' restored with {len(results)} commands")
+        return results
+
+    @staticmethod
+    def _match(
+        wanted: List[WindowPlacement], existing: List[WindowPlacement]
+    ) -> List[Tuple[WindowPlacement, WindowPlacement]]:
+        """Pair saved windows with live ones: by id, then app+title, then app"""
+        pool = {w.id: w for w in existing}
+        pairs = []
+        unmatched = []
+
+        for want in wanted:
+            have = pool.get(want.id)
+            if have is not None and have.app == want.app:
+                pairs.append((want, pool.pop(have.id)))
+            else:
+                unmatched.append(want)
+
+        for key in (lambda w: (w.app, w.title), lambda w: w.app):
+            remaining = []
+            by_key: Dict[Any, List[WindowPlacement]] = {}
+            for have in pool.values():
+                by_key.setdefault(key(have), []).append(have)
+            for want in unmatched:
+                candidates = by_key.get(key(want))
+                if candidates:
+                    have = candidates.pop(0)
+                    pool.pop(have.id)
+                    pairs.append((want, have))
+                else:
+                    remaining.append(want)
+            unmatched = remaining
+
+        for want in unmatched:
+            logger.debug(f"No open window for saved {want.app} '{want.title}'")
+        return pairs
+
+    @staticmethod
+    def _diff_window(
+        want: WindowPlacement, have: WindowPlacement, current: LayoutSnapshot
+    ) -> List[LayoutCommand]:
+        window = str(have.id)
+        commands = []
+
+        if want.space != have.space and want.space in current.spaces:
+            commands.append(
+                LayoutCommand(
+                    PHASE_MOVE,
+                    ["window", window, "--space", str(want.space)],
+                    f"{have.app}: space {have.space} -> {want.space}",
+                )
+            )
+        elif want.display != have.display:
+            commands.append(
+                LayoutCommand(
+                    PHASE_MOVE,
+                    ["window", window, "--display", str(want.display)],
+                    f"{have.app}: display {have.display} -> {want.display}",
+                )
+            )
+
+        if want.floating != have.floating:
+            commands.append(
+                LayoutCommand(
+                    PHASE_FLOAT,
+                    ["window", window, "--toggle", "float"],
+                    f"{have.app}: floating -> {want.floating}",
+                )
+            )
+
+        if want.floating and want.frame:
+
+            def changed(*keys):
+                return any(
+                    abs(want.frame.get(k, 0) - have.frame.get(k, 0)) > FRAME_TOLERANCE
+                    for k in keys
+                )
+
+            if changed("x", "y"):
+                commands.append(
+                    LayoutCommand(
+                        PHASE_FRAME,
+                        [
+                            "window",
+                            window,
+                            "--move",
+                            f"abs:{int(want.frame['x'])}:{int(want.frame['y'])}",
+                        ],
+                        f"{have.app}: move",
+                    )
+                )
+            if changed("w", "h"):
+                commands.append(
+                    LayoutCommand(
+                        PHASE_FRAME,
+                        [
+                            "window",
+                            window,
+                            "--resize",
+                            f"abs:{int(want.frame['w'])}:{int(want.frame['h'])}",
+                        ],
+                        f"{have.app}: resize",
+                    )
+                )
+
+        return commands
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Process Table
+One psutil snapshot of running processes, indexed by executable and app
+bundle name, replacing a `pgrep` per app
+"""
+
+import re
+import time
+import threading
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 1.0
+
+# Outermost bundle in a path like /Applications/Slack.app/Contents/MacOS/Slack
+BUNDLE_PATTERN = re.compile(r"/([^/]+)\.app/")
+
+
+@dataclass
+class ProcessInfo:
+    """The names a running process answers to"""
+
+    pid: int
+    name: str
+    exe: str = ""
+    bundle: Optional[str] = None
+    started: float = 0.0  # create time; with the pid it identifies the process
+
+    @property
+    def identity(self) -> Tuple[int, float]:
+        return self.pid, self.started
+
+    @property
+    def keys(self) -> Set[str]:
+        names = {self.name}
+        if self.exe:
+            names.add(self.exe.rsplit("/", 1)[-1])
+        if self.bundle:
+            names.add(self.bundle)
+        return {n.casefold() for n in names if n}
+
+
+def bundle_name(exe: str) -> Optional[str]:
+    """App bundle an executable belongs to ('Visual Studio Code' for its Electron)"""
+    match = BUNDLE_PATTERN.search(exe or "")
+    return match.group(1) if match else None
+
+
+class ProcessTable:
+    """
+    Running processes keyed by name, refreshed incrementally.
+
+    Entries are keyed by (pid, create time), so a pid the OS hands to a new
+    process is seen as a different process. A refresh lists pids with their
+    create times; processes that appeared since the last one are inspected
+    and vanished ones dropped, so steady-state refreshes never re-read
+    names or executables. Lookups are case-insensitive and match the
+    process name, the executable's file name or the enclosing .app bundle
+    name.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        self._procs: Dict[Tuple[int, float], ProcessInfo] = {}
+        self._by_name: Dict[str, Set[Tuple[int, float]]] = {}
+        self._refreshed = 0.0
+        self._lock = threading.Lock()
+        self.inspected = 0
+
+    def refresh(self, force: bool = False) -> "ProcessTable":
+        """Diff the table against the live processes (skipped within ``ttl``)"""
+        with self._lock:
+            if not force and time.monotonic() - self._refreshed < self.ttl:
+                return self
+            live = {}
+            for pid in psutil.pids():
+                try:
+                    process = psutil.Process(pid)
+                    live[(pid, process.create_time())] = process
+                except (
+                    psutil.NoSuchProcess,
+                    psutil.ZombieProcess,
+                    psutil.AccessDenied,
+                ):
+                    continue
+            known = set(self._procs)
+            for identity in known - live.keys():
+                self._remove(identity)
+            for identity in live.keys() - known:
+                info = self._inspect(live[identity], identity[1])
+                if info:
+                    self._add(info)
+            self._refreshed = time.monotonic()
+        return self
+
+    def invalidate(self):
+        """Force the next lookup to refresh"""
+        self._refreshed = 0.0
+
+    def is_running(self, app: str) -> bool:
+        return self.running([app])[app]
+
+    def running(self, apps: Iterable[str]) -> Dict[str, bool]:
+        """Whether each app is running, answered from one snapshot"""
+        self.refresh()
+        with self._lock:
+            return {app: bool(self._by_name.get(app.casefold())) for app in apps}
+
+    def pids(self, app: str) -> List[int]:
+        self.refresh()
+        with self._lock:
+            return sorted(pid for pid, _ in self._by_name.get(app.casefold(), ()))
+
+    def processes(self) -> Dict[int, ProcessInfo]:
+        """Current pid -> ProcessInfo mapping (a copy; the infos are shared)"""
+        self.refresh()
+        with self._lock:
+            return {info.pid: info for info in self._procs.values()}
+
+    def __len__(self) -> int:
+        return len(self._procs)
+
+    def _inspect(
+        self, process: psutil.Process, started: float
+    ) -> Optional[ProcessInfo]:
+        self.inspected += 1
+        try:
+            name = process.name()
+        except (psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
+            return None
+        try:
+            exe = process.exe()
+        except (
+            psutil.AccessDenied,
+            psutil.NoSuchProcess,
+            psutil.ZombieProcess,
+            OSError,
+        ):
+            exe = ""
+        return ProcessInfo(
+            pid=process.pid,
+            name=name,
+            exe=exe,
+            bundle=bundle_name(exe),
+            started=started,
+        )
+
+    def _add(self, info: ProcessInfo):
+        self._procs[info.identity] = info
+        for key in info.keys:
+            self._by_name.setdefault(key, set()).add(info.identity)
+
+    def _remove(self, identity: Tuple[int, float]):
+        info = self._procs.pop(identity, None)
+        if info is None:
+            return
+        for key in info.keys:
+            identities = self._by_name.get(key)
+            if identities is not None:
+                identities.discard(identity)
+                if not identities:
+                    del self._by_name[key]
+
+
+_shared_table: Optional[ProcessTable] = None
+_shared_lock = threading.Lock()
+
+
+def shared_process_table() -> ProcessTable:
+    """Process-wide table, so every caller reuses one snapshot"""
+    global _shared_table
+    with _shared_lock:
+        if _shared_table is None:
+            _shared_table = ProcessTable()
+        return _shared_table
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+YABAI State Cache
+Coalescing, TTL-cached snapshot of window-manager state shared by all callers
+"""
+
+import time
+import threading
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from .yabai import YabaiClient
+from .circuit_breaker import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 0.5  # seconds
+
+
+class _Flight:
+    """An in-flight query that concurrent callers wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+class CachedYabaiClient(YabaiClient):
+    """
+    YabaiClient that serves repeated queries from a short-lived snapshot.
+
+    Identical queries issued concurrently are merged into one request to
+    yabai, results are reused for ``ttl`` seconds, and any non-query message
+    (a mutating command) invalidates the snapshot.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, **client_kwargs):
+        super().__init__(**client_kwargs)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, ...], Tuple[float, str]] = {}
+        self._inflight: Dict[Tuple[str, ...], _Flight] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    def request(self, *args: str) -> str:
+        if not args or args[0] != "query":
+            try:
+                return super().request(*args)
+            finally:
+                self.invalidate()
+
+        key = tuple(args)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+
+            flight = self._inflight.get(key)
+            if flight:
+                self.coalesced += 1
+                leader = False
+            else:
+                self.misses += 1
+                flight = self._inflight[key] = _Flight()
+                generation = self._generation
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = super().request(*args)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                # Don't store results that raced with an invalidation
+                if flight.error is None and generation == self._generation:
+                    self._entries[key] = (time.monotonic(), flight.result)
+            flight.done.set()
+
+        return flight.result
+
+    def invalidate(self):
+        """Drop the cached snapshot (call after state changes outside this client)"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.invalidations += 1
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters; ``saved`` is the number of yabai round trips avoided"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "invalidations": self.invalidations,
+                "saved": self.hits + self.coalesced,
+                "ttl": self.ttl,
+            }
+
+
+_shared_client: Optional[CachedYabaiClient] = None
+_shared_lock = threading.Lock()
+
+
+def shared_client() -> CachedYabaiClient:
+    """Process-wide cached client: one snapshot and one yabai health state for all"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = CachedYabaiClient(breaker=CircuitBreaker("yabai"))
+        return _shared_client
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Suggestion Index
+Tools per (profile, display id), ordered by preference rank and built once
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class SuggestionIndex:
+    """
+    Precomputed tool suggestions.
+
+    ``build`` walks the tools once and files each under every display it
+    prefers, sorted by where that display sits in its display_preference
+    (ties keep the tools' configured order). Lookups are a dict probe.
+    ``ensure`` rebuilds only when the caller's source changes; sources are
+    tuples whose objects are compared by identity (plain values by value).
+    """
+
+    def __init__(self):
+        self._index: Dict[Tuple[str, int], List[Any]] = {}
+        self._source: Optional[Tuple] = None
+        self.builds = 0
+
+    def build(
+        self,
+        tools: Iterable[Any],
+        display_ids: Iterable[int],
+        source: Optional[Tuple] = None,
+    ):
+        """Index ``tools`` (objects with workspace_profile and display_preference)"""
+        display_ids = set(display_ids)
+        ranked: Dict[Tuple[str, int], List[Tuple[int, int, Any]]] = defaultdict(list)
+        for order, tool in enumerate(tools):
+            for rank, display_id in enumerate(tool.display_preference):
+                if display_id in display_ids:
+                    ranked[(tool.workspace_profile, display_id)].append(
+                        (rank, order, tool)
+                    )
+
+        self._index = {
+            key: [tool for _, _, tool in sorted(entries, key=lambda e: e[:2])]
+            for key, entries in ranked.items()
+        }
+        self._source = source
+        self.builds += 1
+
+    def ensure(self, tools: Iterable[Any], display_ids: Iterable[int], source: Tuple):
+        """Rebuild if ``source`` differs from the one the index was built from"""
+        if self._changed(source):
+            self.build(tools, display_ids, source)
+
+    def _changed(self, source: Tuple) -> bool:
+        if self._source is None or len(source) != len(self._source):
+            return True
+        for new, old in zip(source, self._source):
+            if isinstance(new, (int, str)):
+                if new != old:
+                    return True
+            elif new is not old:
+                return True
+        return False
+
+    def invalidate(self):
+        self._source = None
+
+    def get(self, profile: str, display_id: int) -> List[Any]:
+        return list(self._index.get((profile, display_id), ()))
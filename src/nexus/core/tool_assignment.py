@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tool Assignment
+Min-cost matching of tools to displays, from preference rank, apps already
+on each display and the window moves a placement would need
+"""
+
+import math
+from collections import Counter
+from typing import Iterable, List, Sequence, Tuple
+
+PREFERENCE_WEIGHT = 4.0  # per step down a tool's display_preference
+UNPREFERRED_RANK = 5  # rank for displays missing from display_preference
+MOVE_WEIGHT = 1.0  # per window that would have to move
+PRESENT_WEIGHT = 1.0  # credit per tool app already showing on the display
+STACK_WEIGHT = 10.0  # per tool already stacked on the display
+TIE_BREAK = 1e-6  # keeps the dict-order placement among equal optima
+
+
+def hungarian(cost: Sequence[Sequence[float]]) -> List[int]:
+    """
+    Minimum-cost assignment of every row to a distinct column.
+
+    ``cost`` is n x m with n <= m; returns the column chosen for each row.
+    This is the O(n^2 m) shortest-augmenting-path form with row and column
+    potentials.
+    """
+    n = len(cost)
+    if n == 0:
+        return []
+    m = len(cost[0])
+    if n > m:
+        raise ValueError("hungarian() needs at least as many columns as rows")
+
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    match = [0] * (m + 1)  # column -> row (1-based, 0 = free)
+    way = [0] * (m + 1)
+
+    for row in range(1, n + 1):
+        match[0] = row
+        col0 = 0
+        min_slack = [math.inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[col0] = True
+            row0 = match[col0]
+            delta, col1 = math.inf, 0
+            for col in range(1, m + 1):
+                if used[col]:
+                    continue
+                slack = cost[row0 - 1][col - 1] - u[row0] - v[col]
+                if slack < min_slack[col]:
+                    min_slack[col] = slack
+                    way[col] = col0
+                if min_slack[col] < delta:
+                    delta, col1 = min_slack[col], col
+            for col in range(m + 1):
+                if used[col]:
+                    u[match[col]] += delta
+                    v[col] -= delta
+                else:
+                    min_slack[col] -= delta
+            col0 = col1
+            if match[col0] == 0:
+                break
+        while col0:
+            col1 = way[col0]
+            match[col0] = match[col1]
+            col0 = col1
+
+    assignment = [0] * n
+    for col in range(1, m + 1):
+        if match[col]:
+            assignment[match[col] - 1] = col - 1
+    return assignment
+
+
+def placement_cost(
+    preference: Sequence[int], apps: Iterable[str], display_id: int, windows: Counter
+) -> float:
+    """Cost of placing a tool with ``apps`` on ``display_id``"""
+    rank = (
+        list(preference).index(display_id)
+        if display_id in preference
+        else UNPREFERRED_RANK
+    )
+    moves = present = 0
+    for app in apps:
+        here = windows.get((app, display_id), 0)
+        elsewhere = sum(
+            count
+            for (name, display), count in windows.items()
+            if name == app and display != display_id
+        )
+        moves += elsewhere
+        present += 1 if here else 0
+    return PREFERENCE_WEIGHT * rank + MOVE_WEIGHT * moves - PRESENT_WEIGHT * present
+
+
+def assign_tools(
+    tools: Sequence[Tuple[str, Sequence[int], Sequence[str]]],
+    displays: Sequence[Tuple[str, int]],
+    windows: Counter = None,
+) -> List[Tuple[str, str]]:
+    """
+    Place every tool on a display at minimum total cost.
+
+    ``tools`` are (key, display_preference, apps), ``displays`` are
+    (name, id) and ``windows`` counts open windows per (app, display id).
+    With more tools than displays, each display gets enough slots and every
+    extra tool stacked on a display costs STACK_WEIGHT more, so tools spread
+    out before they stack. Returns (display name, tool key) pairs in display
+    order, a display's first tool before any stacked on it.
+    """
+    if not tools or not displays:
+        return []
+    windows = windows or Counter()
+    slots = math.ceil(len(tools) / len(displays))
+
+    columns = [(d, slot) for slot in range(slots) for d in range(len(displays))]
+    cost = []
+    for t, (_, preference, apps) in enumerate(tools):
+        row = []
+        for d, slot in columns:
+            base = placement_cost(preference, apps, displays[d][1], windows)
+            row.append(
+                base
+                + STACK_WEIGHT * slot
+                + TIE_BREAK * abs(t - (slot * len(displays) + d))
+            )
+        cost.append(row)
+
+    chosen = hungarian(cost)
+    placed = sorted(((columns[c][0], columns[c][1], t) for t, c in enumerate(chosen)))
+    return [(displays[d][0], tools[t][0]) for d, _, t in placed]
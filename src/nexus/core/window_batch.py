@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Window Command Batch
+Filters windows in Python and sends the resulting yabai commands in-process,
+replacing `yabai | jq | xargs yabai` shell pipelines
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence
+
+from .yabai import YabaiClient, YabaiError, YabaiWindow
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CommandResult:
+    """Outcome of one command in a batch"""
+
+    command: List[str]
+    success: bool
+    error: Optional[str] = None
+
+
+class WindowCommandBatch:
+    """
+    Collects window commands and sends them over one client.
+
+    Nothing is forked: each command is a single message on the yabai socket,
+    and a failing command does not stop the rest of the batch.
+    """
+
+    def __init__(self, client: YabaiClient):
+        self.client = client
+        self.commands: List[List[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def add(self, *args: str) -> "WindowCommandBatch":
+        self.commands.append(list(args))
+        return self
+
+    def close(self, windows: Iterable[YabaiWindow]) -> "WindowCommandBatch":
+        for window in windows:
+            self.add("window", str(window.id), "--close")
+        return self
+
+    def move_to_display(
+        self, windows: Iterable[YabaiWindow], display_id: int
+    ) -> "WindowCommandBatch":
+        for window in windows:
+            if window.display != display_id:
+                self.add("window", str(window.id), "--display", str(display_id))
+        return self
+
+    def execute(self) -> List[CommandResult]:
+        """Send every queued command and report per-command success"""
+        results = []
+        for command in self.commands:
+            try:
+                self.client.send(command)
+                results.append(CommandResult(command, True))
+            except YabaiError as e:
+                results.append(CommandResult(command, False, str(e)))
+        self.commands = []
+
+        failed = [r for r in results if not r.success]
+        if failed:
+            logger.warning(f"⚠️ {len(failed)}/{len(results)} window commands failed")
+        return results
+
+
+def select_windows(
+    windows: Iterable[YabaiWindow],
+    app: Optional[str] = None,
+    display: Optional[int] = None,
+    apps: Optional[Sequence[str]] = None,
+) -> List[YabaiWindow]:
+    """Filter a window list the way the old jq selectors did"""
+    wanted = set(apps) if apps is not None else None
+    return [
+        w
+        for w in windows
+        if (app is None or w.app == app)
+        and (wanted is None or w.app in wanted)
+        and (display is None or w.display == display)
+    ]
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Window Index
+Multi-key index over the window table (app, display, space, pid, focus)
+"""
+
+from collections import Counter, OrderedDict, defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .yabai import YabaiWindow
+
+
+class WindowIndex:
+    """
+    Hash indexes over windows, maintained incrementally.
+
+    Every selector (app, display, space, pid and the app+display pair) maps
+    to a set of window ids, so "all Slack windows on display 2" is a single
+    dict probe no matter how many windows are open. A most-recently-used
+    list tracks focus order.
+    """
+
+    def __init__(self, windows: Iterable[YabaiWindow] = ()):
+        self._windows: Dict[int, YabaiWindow] = {}
+        self._by_app: Dict[str, Set[int]] = defaultdict(set)
+        self._by_display: Dict[int, Set[int]] = defaultdict(set)
+        self._by_space: Dict[int, Set[int]] = defaultdict(set)
+        self._by_pid: Dict[int, Set[int]] = defaultdict(set)
+        self._by_app_display: Dict[Tuple[str, int], Set[int]] = defaultdict(set)
+        self._visible_apps: Counter = Counter()
+        self._mru: "OrderedDict[int, None]" = OrderedDict()
+        for window in windows:
+            self.add(window)
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def __contains__(self, window_id: int) -> bool:
+        return window_id in self._windows
+
+    def __iter__(self) -> Iterator[YabaiWindow]:
+        return iter(list(self._windows.values()))
+
+    @property
+    def table(self) -> Dict[int, YabaiWindow]:
+        """The underlying id -> window table (treat as read-only)"""
+        return self._windows
+
+    def get(self, window_id: int) -> Optional[YabaiWindow]:
+        return self._windows.get(window_id)
+
+    # Maintenance
+
+    def add(self, window: YabaiWindow):
+        """Insert or replace a window"""
+        if window.id in self._windows:
+            self.remove(window.id, keep_focus=True)
+        self._windows[window.id] = window
+        self._by_app[window.app].add(window.id)
+        self._by_display[window.display].add(window.id)
+        self._by_space[window.space].add(window.id)
+        self._by_pid[window.pid].add(window.id)
+        self._by_app_display[(window.app, window.display)].add(window.id)
+        if window.is_visible:
+            self._visible_apps[window.app] += 1
+        if window.has_focus:
+            self.focus(window.id)
+        elif window.id not in self._mru:
+            # Never-focused windows rank below everything that has been
+            self._mru[window.id] = None
+            self._mru.move_to_end(window.id, last=False)
+
+    def remove(self, window_id: int, keep_focus: bool = False) -> Optional[YabaiWindow]:
+        """Drop a window from every index"""
+        window = self._windows.pop(window_id, None)
+        if window is None:
+            return None
+        self._discard(self._by_app, window.app, window_id)
+        self._discard(self._by_display, window.display, window_id)
+        self._discard(self._by_space, window.space, window_id)
+        self._discard(self._by_pid, window.pid, window_id)
+        self._discard(self._by_app_display, (window.app, window.display), window_id)
+        if window.is_visible:
+            self._visible_apps[window.app] -= 1
+            if self._visible_apps[window.app] <= 0:
+                del self._visible_apps[window.app]
+        if not keep_focus:
+            self._mru.pop(window_id, None)
+        return window
+
+    def focus(self, window_id: int):
+        """Mark a window as most recently focused"""
+        if window_id not in self._windows:
+            return
+        for previous in reversed(self._mru):
+            if previous != window_id and self._windows[previous].has_focus:
+                self._windows[previous].has_focus = False
+            break
+        self._windows[window_id].has_focus = True
+        self._mru[window_id] = None
+        self._mru.move_to_end(window_id)
+
+    def clear(self):
+        self.__init__()
+
+    @staticmethod
+    def _discard(index: Dict, key, window_id: int):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(window_id)
+            if not ids:
+                del index[key]
+
+    # Lookups
+
+    def ids(
+        self,
+        app: Optional[str] = None,
+        display: Optional[int] = None,
+        space: Optional[int] = None,
+        pid: Optional[int] = None,
+    ) -> Set[int]:
+        """Window ids matching every given selector"""
+        if app is not None and display is not None:
+            candidates = [self._by_app_display.get((app, display), set())]
+        else:
+            candidates = []
+            if app is not None:
+                candidates.append(self._by_app.get(app, set()))
+            if display is not None:
+                candidates.append(self._by_display.get(display, set()))
+        if space is not None:
+            candidates.append(self._by_space.get(space, set()))
+        if pid is not None:
+            candidates.append(self._by_pid.get(pid, set()))
+
+        if not candidates:
+            return set(self._windows)
+        candidates.sort(key=len)
+        return candidates[0].intersection(*candidates[1:])
+
+    def windows(
+        self,
+        app: Optional[str] = None,
+        display: Optional[int] = None,
+        space: Optional[int] = None,
+        pid: Optional[int] = None,
+    ) -> List[YabaiWindow]:
+        """Windows matching every given selector"""
+        return [
+            self._windows[i]
+            for i in self.ids(app=app, display=display, space=space, pid=pid)
+        ]
+
+    def count(self, app: Optional[str] = None, display: Optional[int] = None) -> int:
+        """Number of windows of an app and/or on a display, in O(1)"""
+        if app is not None and display is not None:
+            return len(self._by_app_display.get((app, display), ()))
+        if app is not None:
+            return len(self._by_app.get(app, ()))
+        if display is not None:
+            return len(self._by_display.get(display, ()))
+        return len(self._windows)
+
+    def apps(self) -> List[str]:
+        """Apps that currently have windows"""
+        return list(self._by_app)
+
+    def is_app_visible(self, app: str) -> bool:
+        return self._visible_apps.get(app, 0) > 0
+
+    def visible_apps(self) -> List[str]:
+        return list(self._visible_apps)
+
+    @property
+    def focused(self) -> Optional[YabaiWindow]:
+        if self._mru:
+            window = self._windows.get(next(reversed(self._mru)))
+            if window and window.has_focus:
+                return window
+        return None
+
+    def mru(self, limit: Optional[int] = None) -> List[YabaiWindow]:
+        """Windows in most-recently-focused order"""
+        result = []
+        for window_id in reversed(self._mru):
+            result.append(self._windows[window_id])
+            if limit is not None and len(result) >= limit:
+                break
+        return result
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Workspace Model
+Long-lived in-memory model of displays, spaces and windows, kept current by
+yabai signals instead of re-querying everything
+"""
+
+import os
+import json
+import time
+import shlex
+import getpass
+import threading
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .yabai import YabaiClient, YabaiDisplay, YabaiError, YabaiSpace, YabaiWindow
+from .window_index import WindowIndex
+
+logger = logging.getLogger(__name__)
+
+# yabai signal -> {field: environment variable yabai sets for the action}
+SIGNAL_ENV = {
+    "window_created": {"window": "YABAI_WINDOW_ID"},
+    "window_destroyed": {"window": "YABAI_WINDOW_ID"},
+    "window_focused": {"window": "YABAI_WINDOW_ID"},
+    "window_moved": {"window": "YABAI_WINDOW_ID"},
+    "window_resized": {"window": "YABAI_WINDOW_ID"},
+    "window_minimized": {"window": "YABAI_WINDOW_ID"},
+    "window_deminimized": {"window": "YABAI_WINDOW_ID"},
+    "window_title_changed": {"window": "YABAI_WINDOW_ID"},
+    "application_terminated": {"pid": "YABAI_PROCESS_ID"},
+    "space_created": {"space": "YABAI_SPACE_ID"},
+    "space_destroyed": {"space": "YABAI_SPACE_ID"},
+    "space_changed": {"space": "YABAI_SPACE_ID"},
+    "display_added": {"display": "YABAI_DISPLAY_ID"},
+    "display_removed": {"display": "YABAI_DISPLAY_ID"},
+    "display_moved": {"display": "YABAI_DISPLAY_ID"},
+    "display_resized": {"display": "YABAI_DISPLAY_ID"},
+    "display_changed": {"display": "YABAI_DISPLAY_ID"},
+}
+
+WINDOW_REFRESH_EVENTS = {
+    "window_created",
+    "window_focused",
+    "window_moved",
+    "window_resized",
+    "window_minimized",
+    "window_deminimized",
+    "window_title_changed",
+}
+SPACE_EVENTS = {"space_created", "space_destroyed", "space_changed"}
+DISPLAY_EVENTS = {
+    "display_added",
+    "display_removed",
+    "display_moved",
+    "display_resized",
+    "display_changed",
+}
+
+# Signal action body: a non-blocking write, so yabai's shell fails fast
+# (ENXIO) instead of hanging on the FIFO while nothing is reading it
+SIGNAL_WRITER = 'sysopen(F, shift, O_WRONLY|O_NONBLOCK) and syswrite(F, "@ARGV\\n")'
+LOAD_RETRY_INTERVAL = 5.0  # seconds between attempts to reach yabai again
+
+
+def default_fifo_path() -> str:
+    """FIFO the yabai signal actions write to"""
+    user = os.environ.get("USER") or getpass.getuser()
+    return f"/tmp/nexus_yabai_{user}.fifo"
+
+
+@dataclass
+class SignalEvent:
+    """A yabai signal, optionally with the state fetched for it"""
+
+    event: str
+    window: Optional[int] = None
+    space: Optional[int] = None
+    display: Optional[int] = None
+    pid: Optional[int] = None
+    payload: Optional[Any] = None
+
+    @classmethod
+    def parse(cls, line: str) -> Optional["SignalEvent"]:
+        """Parse a FIFO line such as ``window_created window=123``"""
+        parts = line.split()
+        if not parts or parts[0] not in SIGNAL_ENV:
+            return None
+        values = {}
+        for part in parts[1:]:
+            key, _, value = part.partition("=")
+            if key in ("window", "space", "display", "pid") and value.isdigit():
+                values[key] = int(value)
+        return cls(event=parts[0], **values)
+
+    def to_json(self) -> str:
+        data = {k: v for k, v in self.__dict__.items() if v is not None}
+        return json.dumps(data, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> "SignalEvent":
+        return cls(**json.loads(line))
+
+
+class WorkspaceModel:
+    """
+    In-memory displays/spaces/windows tables updated incrementally; windows
+    live in a WindowIndex so per-app/display/space lookups stay O(1).
+
+    Window events refetch only the affected window. Space and display events
+    refetch their domain plus the window table, since they change which
+    display each window is on and whether it is visible. Every applied
+    event can be recorded, together
+    with the state fetched for it, to a JSONL signal log that ``replay`` feeds
+    back without yabai.
+    """
+
+    def __init__(
+        self, client: Optional[YabaiClient] = None, log_path: Optional[str] = None
+    ):
+        self.client = client
+        self.log_path = Path(log_path) if log_path else None
+        self.displays: Dict[int, YabaiDisplay] = {}
+        self.spaces: Dict[int, YabaiSpace] = {}
+        self.index = WindowIndex()
+        self.focused_space: Optional[int] = None
+        self.version = 0
+        self._lock = threading.RLock()
+        self._subscribers: List[Callable[[SignalEvent], None]] = []
+        self._listener: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # Queries (O(1) reads of maintained state)
+
+    @property
+    def windows(self) -> Dict[int, YabaiWindow]:
+        return self.index.table
+
+    @property
+    def focused_window(self) -> Optional[int]:
+        window = self.index.focused
+        return window.id if window else None
+
+    @property
+    def display_count(self) -> int:
+        return len(self.displays)
+
+    def window_count(self, display_index: int) -> int:
+        return self.index.count(display=display_index)
+
+    def is_app_visible(self, app: str) -> bool:
+        return self.index.is_app_visible(app)
+
+    def visible_apps(self) -> List[str]:
+        return self.index.visible_apps()
+
+    @property
+    def listening(self) -> bool:
+        """True while the signal listener thread is feeding the model"""
+        return (
+            self._listener is not None
+            and self._listener.is_alive()
+            and not self._stop.is_set()
+        )
+
+    def subscribe(self, callback: Callable[[SignalEvent], None]):
+        """Call ``callback(event)`` after every applied event"""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[SignalEvent], None]):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    # Full synchronisation
+
+    def load(self):
+        """Populate the model from scratch with one query per domain"""
+        if self.client is None:
+            raise YabaiError("WorkspaceModel has no yabai client to load from")
+        # Recorded like any other event, so a signal log replays from scratch
+        self.apply(
+            SignalEvent(
+                "snapshot",
+                payload={
+                    "displays": [d.raw for d in self.client.query_displays()],
+                    "spaces": [s.raw for s in self.client.query_spaces()],
+                    "windows": [w.raw for w in self.client.query_windows()],
+                },
+            )
+        )
+
+    # Incremental updates
+
+    def apply(self, event: SignalEvent):
+        """Apply one signal, fetching only the state it touches"""
+        if event.payload is None:
+            # The signal means yabai state changed; cached snapshots are stale
+            if hasattr(self.client, "invalidate"):
+                self.client.invalidate()
+            event.payload = self._fetch(event)
+
+        with self._lock:
+            if event.event == "snapshot":
+                self._reset(event.payload)
+            elif event.event == "window_destroyed":
+                self.index.remove(event.window)
+            elif event.event in WINDOW_REFRESH_EVENTS:
+                if event.payload:
+                    window = YabaiWindow.from_json(event.payload)
+                    self.index.add(window)
+                    if event.event == "window_focused":
+                        self.index.focus(window.id)
+                else:
+                    # Window vanished before we could look at it
+                    self.index.remove(event.window)
+            elif event.event == "application_terminated":
+                for window_id in self.index.ids(pid=event.pid):
+                    self.index.remove(window_id)
+            elif event.event in SPACE_EVENTS or event.event in DISPLAY_EVENTS:
+                payload = event.payload or {}
+                if isinstance(payload, list):
+                    # Signal logs recorded before windows were part of the payload
+                    payload = {"spaces": payload}
+                if "displays" in payload:
+                    self._set_displays(payload["displays"])
+                self._set_spaces(payload.get("spaces", []))
+                if "windows" in payload:
+                    self._sync_windows(payload["windows"])
+            self.version += 1
+
+        if self.log_path:
+            with open(self.log_path, "a") as f:
+                f.write(event.to_json() + "\n")
+
+        for callback in list(self._subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.warning(f"⚠️ Workspace model subscriber failed: {e}")
+
+    def replay(self, events: Iterable[SignalEvent]):
+        """Apply recorded events (each must carry its payload)"""
+        for event in events:
+            self.apply(event)
+
+    @staticmethod
+    def read_log(log_path: str) -> List[SignalEvent]:
+        """Read a signal log written by a recording model"""
+        with open(log_path, "r") as f:
+            return [SignalEvent.from_json(line) for line in f if line.strip()]
+
+    def _fetch(self, event: SignalEvent) -> Any:
+        if event.event in WINDOW_REFRESH_EVENTS:
+            try:
+                windows = self.client.query_windows(window=event.window)
+                return windows[0].raw if windows and windows[0].id else None
+            except YabaiError:
+                return None
+        if event.event in SPACE_EVENTS:
+            return {
+                "spaces": [s.raw for s in self.client.query_spaces()],
+                "windows": [w.raw for w in self.client.query_windows()],
+            }
+        if event.event in DISPLAY_EVENTS:
+            return {
+                "displays": [d.raw for d in self.client.query_displays()],
+                "spaces": [s.raw for s in self.client.query_spaces()],
+                "windows": [w.raw for w in self.client.query_windows()],
+            }
+        return None
+
+    def _reset(self, payload: Dict[str, Any]):
+        self._set_displays(payload.get("displays", []))
+        self._set_spaces(payload.get("spaces", []))
+        self.index = WindowIndex(
+            YabaiWindow.from_json(w) for w in payload.get("windows", [])
+        )
+
+    def _sync_windows(self, windows: List[Dict[str, Any]]):
+        """Bring the index in line with a full window query, keeping focus order"""
+        with self._lock:
+            current = {w["id"]: w for w in windows if w.get("id")}
+            for window_id in set(self.index.table) - current.keys():
+                self.index.remove(window_id)
+            for raw in current.values():
+                window = YabaiWindow.from_json(raw)
+                if self.index.get(window.id) != window:
+                    self.index.add(window)
+
+    def _set_displays(self, displays: List[Dict[str, Any]]):
+        with self._lock:
+            self.displays = {d["index"]: YabaiDisplay.from_json(d) for d in displays}
+
+    def _set_spaces(self, spaces: List[Dict[str, Any]]):
+        with self._lock:
+            self.spaces = {s["index"]: YabaiSpace.from_json(s) for s in spaces}
+            for space in self.spaces.values():
+                if space.has_focus:
+                    self.focused_space = space.index
+
+    # Signal wiring
+
+    def register_signals(
+        self, fifo_path: Optional[str] = None, label_prefix: str = "nexus"
+    ):
+        """
+        Install labelled yabai signals whose actions write to ``fifo_path``.
+
+        The signals outlive this process, so the action must not block when
+        no listener has the FIFO open; events sent then are dropped.
+        """
+        fifo_path = fifo_path or default_fifo_path()
+        for event, env in SIGNAL_ENV.items():
+            fields = " ".join(f"{key}=${var}" for key, var in env.items())
+            action = (
+                f"perl -MFcntl -e {shlex.quote(SIGNAL_WRITER)} "
+                f'{shlex.quote(fifo_path)} "{event} {fields}"'
+            )
+            self.client.send(
+                [
+                    "signal",
+                    "--add",
+                    f"event={event}",
+                    f"label={label_prefix}_{event}",
+                    f"action={action}",
+                ]
+            )
+
+    def start(self, fifo_path: Optional[str] = None):
+        """Listen on the signal FIFO in a background thread"""
+        fifo_path = fifo_path or default_fifo_path()
+        if not os.path.exists(fifo_path):
+            os.mkfifo(fifo_path)
+        self._stop.clear()
+        self._listener = threading.Thread(
+            target=self._listen, args=(fifo_path,), name="nexus-signals", daemon=True
+        )
+        self._listener.start()
+
+    def stop(self, fifo_path: Optional[str] = None):
+        """Stop the FIFO listener"""
+        self._stop.set()
+        fifo_path = fifo_path or default_fifo_path()
+        if self._listener and os.path.exists(fifo_path):
+            # Wake the blocked reader
+            with open(fifo_path, "w") as f:
+                f.write("\n")
+            self._listener.join(timeout=1)
+
+    def _listen(self, fifo_path: str):
+        # O_RDWR keeps the FIFO open between writers, so reads never hit EOF
+        fd = os.open(fifo_path, os.O_RDWR)
+        with os.fdopen(fd, "r") as fifo:
+            for line in fifo:
+                if self._stop.is_set():
+                    return
+                event = SignalEvent.parse(line)
+                if event:
+                    try:
+                        self.apply(event)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Failed to apply {event.event}: {e}")
+
+
+_shared_model: Optional[WorkspaceModel] = None
+_shared_lock = threading.Lock()
+_last_attempt: Optional[float] = None
+
+
+def shared_model(client: Optional[YabaiClient] = None) -> WorkspaceModel:
+    """
+    Process-wide model: loaded once, then kept current by yabai signals.
+    If yabai was unreachable, later calls try again (at most every
+    LOAD_RETRY_INTERVAL seconds) until the model is loaded and listening.
+    """
+    global _shared_model, _last_attempt
+    with _shared_lock:
+        if _shared_model is None:
+            from .state_cache import shared_client
+
+            _shared_model = WorkspaceModel(client or shared_client())
+        model = _shared_model
+        if not model.listening and (
+            _last_attempt is None
+            or time.monotonic() - _last_attempt >= LOAD_RETRY_INTERVAL
+        ):
+            _last_attempt = time.monotonic()
+            try:
+                model.load()
+                model.register_signals()
+                model.start()
+            except (YabaiError, OSError) as e:
+                logger.warning(f"⚠️ Workspace model running without yabai signals: {e}")
+        return model
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+YABAI Socket Client
+Talks to the yabai daemon over its Unix domain socket instead of forking
+the yabai binary for every query
+"""
+
+import os
+import json
+import shlex
+import socket
+import struct
+import getpass
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+# yabai prefixes error responses with a BEL byte
+FAILURE_MESSAGE = b"\x07"
+
+
+class YabaiError(Exception):
+    """Raised when yabai rejects a message or cannot be reached"""
+
+
+class YabaiUnavailable(YabaiError):
+    """Raised when yabai cannot be reached at all (as opposed to rejecting a message)"""
+
+
+@dataclass
+class YabaiWindow:
+    """Window as reported by `yabai -m query --windows`"""
+
+    id: int
+    pid: int
+    app: str
+    title: str
+    display: int
+    space: int
+    frame: Dict[str, float]
+    has_focus: bool = False
+    is_visible: bool = True
+    is_floating: bool = False
+    raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "YabaiWindow":
+        return cls(
+            id=data.get("id", 0),
+            pid=data.get("pid", 0),
+            app=data.get("app", ""),
+            title=data.get("title", ""),
+            display=data.get("display", 0),
+            space=data.get("space", 0),
+            frame=data.get("frame", {}),
+            has_focus=data.get("has-focus", data.get("focused", False)),
+            is_visible=data.get("is-visible", data.get("visible", True)),
+            is_floating=data.get("is-floating", data.get("floating", False)),
+            raw=data,
+        )
+
+
+@dataclass
+class YabaiSpace:
+    """Space as reported by `yabai -m query --spaces`"""
+
+    id: int
+    index: int
+    label: str
+    type: str
+    display: int
+    windows: List[int]
+    has_focus: bool = False
+    is_visible: bool = False
+    raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "YabaiSpace":
+        return cls(
+            id=data.get("id", 0),
+            index=data.get("index", 0),
+            label=data.get("label", ""),
+            type=data.get("type", "bsp"),
+            display=data.get("display", 0),
+            windows=data.get("windows", []),
+            has_focus=data.get("has-focus", data.get("focused", False)),
+            is_visible=data.get("is-visible", data.get("visible", False)),
+            raw=data,
+        )
+
+
+@dataclass
+class YabaiDisplay:
+    """Display as reported by `yabai -m query --displays`"""
+
+    id: int
+    uuid: str
+    index: int
+    frame: Dict[str, float]
+    spaces: List[int]
+    has_focus: bool = False
+    raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "YabaiDisplay":
+        return cls(
+            id=data.get("id", 0),
+            uuid=data.get("uuid", ""),
+            index=data.get("index", 0),
+            frame=data.get("frame", {}),
+            spaces=data.get("spaces", []),
+            has_focus=data.get("has-focus", data.get("focused", False)),
+            raw=data,
+        )
+
+
+def default_socket_path() -> str:
+    """Socket path used by the yabai daemon for the current user"""
+    override = os.environ.get("YABAI_SOCKET_PATH")
+    if override:
+        return override
+    user = os.environ.get("USER") or getpass.getuser()
+    return f"/tmp/yabai_{user}.socket"
+
+
+class YabaiClient:
+    """
+    Client for the yabai message socket (yabai >= 6 wire format).
+
+    yabai answers exactly one message per connection, so the client keeps
+    the resolved socket address and opens a fresh in-process connection per
+    message; no yabai, jq or shell process is ever started. When the socket
+    is missing the client falls back to the yabai binary.
+
+    With a ``breaker`` (see circuit_breaker.CircuitBreaker), repeated
+    YabaiUnavailable failures open the circuit and later messages fail fast
+    with the last error until a background probe reaches yabai again.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        timeout: float = 2.0,
+        yabai_path: str = "yabai",
+        cli_fallback: bool = True,
+        breaker=None,
+    ):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self.yabai_path = yabai_path
+        self.cli_fallback = cli_fallback
+        self.breaker = breaker
+        if breaker is not None and breaker.probe is None:
+            breaker.probe = self._probe
+
+    @staticmethod
+    def encode_message(args: Sequence[str]) -> bytes:
+        """Frame arguments the way `yabai -m` does: length, NUL-separated args, NUL"""
+        payload = b"".join(arg.encode("utf-8") + b"\0" for arg in args) + b"\0"
+        return struct.pack("i", len(payload)) + payload
+
+    def request(self, *args: str) -> str:
+        """Send one message (e.g. "query", "--windows") and return the raw response"""
+        if not args:
+            raise YabaiError("Empty yabai message")
+
+        breaker = self.breaker
+        if breaker is None:
+            return self._send(args)
+        if not breaker.allow():
+            raise YabaiUnavailable(
+                f"yabai unavailable (circuit open): {breaker.last_error}"
+            )
+        try:
+            response = self._send(args)
+        except YabaiUnavailable as e:
+            breaker.record_failure(e)
+            raise
+        except YabaiError:
+            # yabai answered, it just rejected the message
+            breaker.record_success()
+            raise
+        breaker.record_success()
+        return response
+
+    def _send(self, args: Sequence[str]) -> str:
+        if not os.path.exists(self.socket_path):
+            if self.cli_fallback:
+                return self._request_cli(args)
+            raise YabaiUnavailable(f"yabai socket not found: {self.socket_path}")
+
+        try:
+            response = self._request_socket(args)
+        except OSError as e:
+            if self.cli_fallback:
+                logger.debug(f"yabai socket unavailable ({e}), using CLI")
+                return self._request_cli(args)
+            raise YabaiUnavailable(f"yabai socket error: {e}") from e
+
+        if response.startswith(FAILURE_MESSAGE):
+            raise YabaiError(response[1:].decode("utf-8", "replace").strip())
+        return response.decode("utf-8", "replace")
+
+    def _probe(self) -> bool:
+        """Breaker probe: whether yabai answers at all, bypassing the breaker"""
+        try:
+            self._send(("query", "--displays"))
+        except YabaiUnavailable:
+            return False
+        except YabaiError:
+            pass
+        return True
+
+    def _request_socket(self, args: Sequence[str]) -> bytes:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(self.encode_message(args))
+            sock.shutdown(socket.SHUT_WR)
+
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            return b"".join(chunks)
+
+    def _request_cli(self, args: Sequence[str]) -> str:
+        # Imported here: the runner's module imports this one
+        from .command_runner import run_command
+
+        result = run_command(
+            [self.yabai_path, "-m", *args], timeout=self.timeout, name="yabai"
+        )
+        if result.timed_out or result.cancelled or result.returncode == 127:
+            raise YabaiUnavailable(f"yabai not reachable: {result.error}")
+
+        if result.returncode != 0:
+            error = result.stderr.strip() or f"yabai exited with {result.returncode}"
+            if "failed to connect to socket" in error:
+                # The binary is there but the daemon isn't running
+                raise YabaiUnavailable(error)
+            raise YabaiError(error)
+        return result.stdout
+
+    def query(self, domain: str, *selectors: str) -> Any:
+        """Run `query --<domain> [selectors]` and decode the JSON response"""
+        response = self.request("query", f"--{domain}", *selectors)
+        try:
+            return json.loads(response)
+        except json.JSONDecodeError as e:
+            raise YabaiError(f"Invalid JSON from yabai query --{domain}: {e}") from e
+
+    def _query_list(self, domain: str, selectors: List[str]) -> List[Dict[str, Any]]:
+        data = self.query(domain, *selectors)
+        if isinstance(data, dict):
+            return [data]
+        return data or []
+
+    def query_windows(
+        self,
+        display: Optional[int] = None,
+        space: Optional[int] = None,
+        window: Optional[int] = None,
+    ) -> List[YabaiWindow]:
+        """Query windows, optionally restricted to a display, space or single window"""
+        selectors = []
+        if window is not None:
+            selectors += ["--window", str(window)]
+        elif space is not None:
+            selectors += ["--space", str(space)]
+        elif display is not None:
+            selectors += ["--display", str(display)]
+        return [
+            YabaiWindow.from_json(w) for w in self._query_list("windows", selectors)
+        ]
+
+    def query_spaces(
+        self, display: Optional[int] = None, space: Optional[int] = None
+    ) -> List[YabaiSpace]:
+        """Query spaces, optionally restricted to a display or single space"""
+        selectors = []
+        if space is not None:
+            selectors += ["--space", str(space)]
+        elif display is not None:
+            selectors += ["--display", str(display)]
+        return [YabaiSpace.from_json(s) for s in self._query_list("spaces", selectors)]
+
+    def query_displays(self, display: Optional[int] = None) -> List[YabaiDisplay]:
+        """Query displays, optionally a single display"""
+        selectors = ["--display", str(display)] if display is not None else []
+        return [
+            YabaiDisplay.from_json(d) for d in self._query_list("displays", selectors)
+        ]
+
+    def send(self, command: Union[str, Sequence[str]]) -> str:
+        """Send a command such as "window 42 --close" or ["space", "--layout", "bsp"]"""
+        args = shlex.split(command) if isinstance(command, str) else list(command)
+        return self.request(*args)
+
+    @property
+    def health(self) -> Dict[str, Any]:
+        """Breaker state for status displays ("closed" without a breaker)"""
+        if self.breaker is None:
+            return {"state": "closed"}
+        return self.breaker.snapshot()
+
+    def is_available(self) -> bool:
+        """Check whether yabai answers queries"""
+        try:
+            self.query("displays")
+            return True
+        except YabaiError:
+            return False
@@ -0,0 +1,27 @@
+"""Resident daemon (nexusd) and its JSON-RPC client."""
+
+import importlib
+
+_LAZY = {
+    "NexusClient": ".client",
+    "DaemonUnavailable": ".client",
+    "RemoteError": ".client",
+    "NexusDaemon": ".server",
+}
+
+__all__ = [
+    "NexusClient",
+    "DaemonUnavailable",
+    "RemoteError",
+    "NexusDaemon",
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+NEXUS Daemon Client
+Minimal JSON-RPC client for nexusd; standard library only, so it can run
+as a bare script without importing the rest of NEXUS
+"""
+
+import os
+import sys
+import json
+import socket
+import getpass
+from typing import Any, Optional
+
+# Exit status telling bin/nexus to fall back to the full CLI
+EXIT_UNAVAILABLE = 3
+
+
+def default_socket_path() -> str:
+    """Unix socket nexusd listens on (override with NEXUSD_SOCKET)"""
+    user = os.environ.get("USER") or getpass.getuser()
+    return os.environ.get("NEXUSD_SOCKET") or f"/tmp/nexusd_{user}.socket"
+
+
+class DaemonUnavailable(ConnectionError):
+    """nexusd is not running or not reachable"""
+
+
+class RemoteError(Exception):
+    """The daemon answered with a JSON-RPC error"""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class NexusClient:
+    """Sends JSON-RPC 2.0 requests to nexusd, one JSON document per line"""
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 30.0):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self._next_id = 0
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call ``method`` with positional or keyword params and return its result"""
+        if args and kwargs:
+            raise ValueError("JSON-RPC params are either positional or named, not both")
+        self._next_id += 1
+        request = {
+            "jsonrpc": "2.0",
+            "id": self._next_id,
+            "method": method,
+            "params": kwargs or list(args),
+        }
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except OSError as e:
+                raise DaemonUnavailable(
+                    f"nexusd is not running at {self.socket_path}"
+                ) from e
+            # Past this point the daemon may have acted on the request, so
+            # failures are errors rather than a reason to retry elsewhere
+            try:
+                sock.sendall(json.dumps(request).encode() + b"\n")
+                with sock.makefile("rb") as stream:
+                    line = stream.readline()
+            except OSError as e:
+                raise RemoteError(-32000, f"lost connection to nexusd: {e}") from e
+
+        if not line:
+            raise RemoteError(-32000, "nexusd closed the connection without answering")
+        response = json.loads(line)
+        if "error" in response:
+            error = response["error"]
+            raise RemoteError(
+                error.get("code", -32603), error.get("message", ""), error.get("data")
+            )
+        return response.get("result")
+
+    def is_running(self) -> bool:
+        try:
+            return self.call("ping") == "pong"
+        except (DaemonUnavailable, RemoteError):
+            return False
+
+
+def main(argv=None) -> int:
+    """Fast path for `nexus swap|profile switch|daemon ping` when nexusd is up"""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    client = NexusClient()
+    try:
+        if len(argv) == 3 and argv[0] == "swap":
+            ok = client.call("swap", display=argv[1], tool=argv[2])
+            print("✅ Success" if ok else "❌ Failed")
+            return 0 if ok else 1
+        if len(argv) >= 3 and argv[:2] == ["profile", "switch"]:
+            ok = client.call(
+                "profile.switch", profile_name=argv[2], force="--force" in argv[3:]
+            )
+            print(
+                f"✅ Switched to profile: {argv[2]}"
+                if ok
+                else f"❌ Failed to switch to profile: {argv[2]}"
+            )
+            return 0 if ok else 1
+        if argv == ["daemon", "ping"]:
+            print(client.call("ping"))
+            return 0
+    except DaemonUnavailable:
+        return EXIT_UNAVAILABLE
+    except RemoteError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    # Not a fast-path command
+    return EXIT_UNAVAILABLE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+NEXUS Daemon (nexusd)
+Long-running process that keeps the layout manager, caches and yabai
+connection warm and serves JSON-RPC requests over a Unix socket
+"""
+
+import os
+import json
+import inspect
+import logging
+import argparse
+import threading
+import socketserver
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .client import NexusClient, default_socket_path
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+project_root = Path(__file__).parent.parent.parent.parent
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """One client connection: newline-delimited requests, one response line each"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.nexusd.dispatch(line)
+            if response is not None:
+                self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+                self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class NexusDaemon:
+    """
+    Holds one DynamicLayoutManager (and through it the shared yabai client,
+    workspace model and process table) for the life of the process.
+
+    Calls that change the workspace are serialised; read-only calls run
+    concurrently on the server's handler threads.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        manager_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.socket_path = socket_path or default_socket_path()
+        self._manager_factory = manager_factory or self._default_manager
+        self.manager = None
+        self._profile_switcher = None
+        self._server: Optional[_Server] = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self.methods: Dict[str, Callable[..., Any]] = {
+            "ping": lambda: "pong",
+            "status": self.status,
+            "swap": self.swap,
+            "swap_profile": self.swap_profile,
+            "suggestions": self.suggestions,
+            "profile.switch": self.switch_profile,
+            "profile.current": self.current_profile,
+            "layout.save": self.save_layout,
+            "layout.restore": self.restore_layout,
+            "shutdown": self.shutdown,
+        }
+
+    @staticmethod
+    def _default_manager():
+        from ..core.dynamic_layout_manager import DynamicLayoutManager
+        from ..core.workspace_model import shared_model
+
+        return DynamicLayoutManager(workspace_model=shared_model())
+
+    # Lifecycle
+
+    def start(self):
+        """Build the manager and start serving in a background thread"""
+        self._claim_socket()
+        self._stopped.clear()
+        self.manager = self._manager_factory()
+        # Create the socket owner-only, rather than chmod it after bind
+        umask = os.umask(0o077)
+        try:
+            self._server = _Server(self.socket_path, _Handler)
+        finally:
+            os.umask(umask)
+        self._server.nexusd = self
+        threading.Thread(
+            target=self._server.serve_forever, name="nexusd", daemon=True
+        ).start()
+        logger.info(f"✅ nexusd listening on {self.socket_path}")
+
+    def serve_forever(self):
+        self.start()
+        try:
+            self._stopped.wait()
+        except KeyboardInterrupt:
+            self.shutdown()
+
+    def shutdown(self) -> bool:
+        server, self._server = self._server, None
+        if server is not None:
+            # shutdown() blocks until serve_forever returns, and this may be
+            # running on one of its handler threads
+            threading.Thread(
+                target=lambda: (server.shutdown(), server.server_close())
+            ).start()
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+            logger.info("👋 nexusd stopped")
+        self._stopped.set()
+        return True
+
+    def _claim_socket(self):
+        if not os.path.exists(self.socket_path):
+            return
+        if NexusClient(self.socket_path, timeout=1).is_running():
+            raise RuntimeError(f"nexusd is already running at {self.socket_path}")
+        # Left behind by a daemon that died
+        os.unlink(self.socket_path)
+
+    # Dispatch
+
+    def dispatch(self, line: bytes) -> Optional[Dict[str, Any]]:
+        """Handle one JSON-RPC request line; notifications get no response"""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return self._error(None, PARSE_ERROR, "Parse error")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return self._error(None, INVALID_REQUEST, "Invalid Request")
+
+        request_id = request.get("id")
+        method = self.methods.get(request["method"])
+        if method is None:
+            return self._error(
+                request_id, METHOD_NOT_FOUND, f"Method not found: {request['method']}"
+            )
+
+        params = request.get("params", [])
+        args, kwargs = (params, {}) if isinstance(params, list) else ([], params)
+        try:
+            inspect.signature(method).bind(*args, **kwargs)
+        except TypeError as e:
+            return self._error(request_id, INVALID_PARAMS, str(e))
+
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"❌ nexusd {request['method']} failed: {e}")
+            return self._error(request_id, INTERNAL_ERROR, str(e))
+
+        if "id" not in request:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    @staticmethod
+    def _error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
+
+    # Methods
+
+    def status(self) -> Dict[str, Any]:
+        from ..core.command_runner import shared_runner
+
+        return {
+            "pid": os.getpid(),
+            "profile": self.manager.current_profile,
+            "display_count": self.manager.display_count,
+            "displays": self.manager.get_display_status(),
+            "yabai": self.manager.yabai.health,
+            "commands": shared_runner().histogram.snapshot(),
+        }
+
+    def swap(self, display: str, tool: str) -> bool:
+        with self._lock:
+            return self.manager.swap_tool(display, tool)
+
+    def swap_profile(self, profile: str) -> Dict[str, Any]:
+        with self._lock:
+            return self.manager.swap_by_profile(profile)
+
+    def suggestions(self, display: str):
+        return [tool.name for tool in self.manager.get_layout_suggestions(display)]
+
+    def switch_profile(self, profile_name: str, force: bool = False) -> bool:
+        with self._lock:
+            return self._switcher().switch_profile(profile_name, force=force)
+
+    def current_profile(self) -> Optional[str]:
+        return self._switcher().get_current_profile()
+
+    def save_layout(self, name: str) -> int:
+        from ..core.layout_reconciler import LayoutReconciler, save_layout
+
+        snapshot = LayoutReconciler().capture(
+            name, profile=self.manager.current_profile
+        )
+        save_layout(snapshot, project_root / "configs" / "layouts" / f"{name}.json")
+        return len(snapshot.windows)
+
+    def restore_layout(self, name: str) -> Dict[str, Any]:
+        from ..core.layout_reconciler import LayoutReconciler, load_layout
+
+        with self._lock:
+            results = LayoutReconciler().restore(
+                load_layout(project_root / "configs" / "layouts" / f"{name}.json")
+            )
+        return {
+            "applied": sum(1 for r in results if r.success),
+            "failed": [
+                {"command": r.command, "error": r.error}
+                for r in results
+                if not r.success
+            ],
+        }
+
+    def _switcher(self):
+        if self._profile_switcher is None:
+            from ..cli.profile_switcher import ProfileSwitcher
+
+            self._profile_switcher = ProfileSwitcher()
+        return self._profile_switcher
+
+
+def main():
+    """Run nexusd in the foreground"""
+    parser = argparse.ArgumentParser(description="NEXUS resident daemon")
+    parser.add_argument(
+        "--socket",
+        help="Unix socket path (default: $NEXUSD_SOCKET or /tmp/nexusd_$USER.socket)",
+    )
+    args = parser.parse_args()
+
+    from ..utils.logger import setup_logging
+
+    setup_logging()
+    NexusDaemon(args.socket).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -18,8 +18,15 @@ import os
 import time
 from datetime import datetime, timedelta
 import subprocess
+import sys
 from pathlib import Path
 
+# Make the NEXUS package importable under `streamlit run`
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from nexus.core.display_topology import shared_topology
+from nexus.core.state_cache import shared_client
+
 # Custom CSS for modern dashboard appearance
 st.markdown("""
 <style>
@@ -219,21 +226,14 @@ st.markdown("""
 # Utility functions
 def get_display_count():
     """Get current display count from adaptive detection"""
-    try:
-        with open('configs/current_display_count.txt', 'r') as f:
-            return int(f.read().strip())
-    except:
-        return 2  # Default to dual display
+    # Cached across reruns; re-resolved only when the count file or displays change
+    return shared_topology().count
 
 def get_system_status():
     """Get comprehensive system status"""
-    try:
-        # Try to get YABAI status
-        yabai_status = subprocess.run(['yabai', '-m', 'query', '--displays'], 
-                                    capture_output=True, text=True)
-        yabai_running = yabai_status.returncode == 0
-    except:
-        yabai_running = False
+    # Shared client: fails fast while the yabai circuit is open
+    yabai = shared_client()
+    yabai_running = yabai.is_available()
     
     # Check external models
     models_available = os.path.exists('/Volumes/MICRO/models')
@@ -248,6 +248,7 @@ def get_system_status():
     
     return {
         'yabai': yabai_running,
+        'yabai_circuit': yabai.health['state'],
         'models': models_available,
         'ollama': ollama_installed,
         'display_count': get_display_count()
@@ -607,6 +608,8 @@ def main():
             status_icon = "🟢" if status else "🔴"
             status_text = "Active" if status else "Inactive"
             st.markdown(f"{status_icon} **{name}**: {status_text}")
+        if system_status['yabai_circuit'] != "closed":
+            st.markdown(f"🟠 **YABAI circuit**: {system_status['yabai_circuit']} (failing fast)")
     
     # CENTER - Main Content Area with live updates
     with col2:
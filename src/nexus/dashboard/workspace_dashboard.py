@@ -1,10 +1,22 @@
 import streamlit as st
-import subprocess
-import json
+import shlex
 import os
+import sys
 import time
 from pathlib import Path
 
+# Make the NEXUS package importable under `streamlit run`
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from nexus.core.yabai import YabaiError
+from nexus.core.state_cache import shared_client
+from nexus.core.workspace_model import shared_model
+from nexus.core.command_runner import shared_runner
+
+# Shared across reruns, so one rerun queries each yabai domain at most once
+yabai = shared_client()
+runner = shared_runner()
+
 # Page configuration
 st.set_page_config(
     page_title="YABAI Workspace Manager",
@@ -44,36 +56,40 @@ st.markdown("""
 
 def run_command(command):
     """Run a shell command and return the output"""
+    # yabai messages go straight to the yabai socket
+    if command.startswith("yabai -m "):
+        try:
+            return yabai.request(*shlex.split(command)[2:]), "", 0
+        except YabaiError as e:
+            return "", str(e), 1
+    
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        return result.stdout, result.stderr, result.returncode
+        # No shell: the shared runner applies its timeout and concurrency limit
+        result = runner.run_sync(shlex.split(command))
+        if command.startswith("yabai --"):
+            # Service restarts change everything yabai reports
+            yabai.invalidate()
+        if result.ok:
+            return result.stdout, result.stderr, 0
+        # Timeouts and cancellations have no exit status of their own
+        return result.stdout, result.error, result.returncode or 1
     except Exception as e:
         return "", str(e), 1
 
 def get_yabai_status():
     """Get YABAI service status"""
-    stdout, stderr, code = run_command("yabai -m query --displays")
-    return code == 0
+    return yabai.is_available()
 
 def get_display_info():
     """Get display information from YABAI"""
-    stdout, stderr, code = run_command("yabai -m query --displays")
-    if code == 0:
-        try:
-            return json.loads(stdout)
-        except:
-            return []
-    return []
+    try:
+        return yabai.query("displays")
+    except YabaiError:
+        return []
 
 def get_window_info():
-    """Get window information from YABAI"""
-    stdout, stderr, code = run_command("yabai -m query --windows")
-    if code == 0:
-        try:
-            return json.loads(stdout)
-        except:
-            return []
-    return []
+    """Get window information from the signal-fed workspace model"""
+    return [window.raw for window in shared_model(yabai).windows.values()]
 
 def load_profile(profile_name):
     """Load a workspace profile"""
@@ -87,7 +103,7 @@ def load_profile(profile_name):
     if profile_name in profile_scripts:
         script_path = profile_scripts[profile_name]
         if os.path.exists(script_path):
-            stdout, stderr, code = run_command(f"source {script_path}")
+            stdout, stderr, code = run_command(f"bash {shlex.quote(script_path)}")
             return code == 0
     return False
 
@@ -102,13 +118,17 @@ with st.sidebar:
     yabai_status = get_yabai_status()
     status_color = "status-active" if yabai_status else "status-inactive"
     status_text = "Active" if yabai_status else "Inactive"
+    health = yabai.health
     
     st.markdown(f"""
     <div class="profile-card">
         <h4>YABAI Status</h4>
         <span class="status-indicator {status_color}"></span>{status_text}
+        <br><small>Circuit: {health["state"]}</small>
     </div>
     """, unsafe_allow_html=True)
+    if health["state"] != "closed":
+        st.caption(f"Failing fast: {health['last_error']} (next probe in {health['next_probe_in']}s)")
     
     # YABAI Controls
     if st.button("🔄 Restart YABAI"):
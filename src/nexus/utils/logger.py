@@ -4,77 +4,221 @@ NEXUS Logger Utility
 Centralized logging configuration for NEXUS
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import re
 import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+project_root = Path(__file__).parent.parent.parent.parent
+CONFIG_PATH = project_root / "configs" / "nexus.yaml"
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DEFAULT_MAX_SIZE = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+# Fields every operation record carries, in output order
+OPERATION_FIELDS = ("operation", "duration_ms", "display", "tool", "profile", "outcome")
+OPERATIONS_LOGGER = "nexus.ops"
+
+_lock = threading.Lock()
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listeners = []
+_file_loggers: Dict[str, logging.Logger] = {}
+
+
+def parse_size(value: Any, default: int = DEFAULT_MAX_SIZE) -> int:
+    """Turn '10MB', '512 KB' or 1048576 into a byte count"""
+    if isinstance(value, int):
+        return value
+    match = re.fullmatch(
+        r"\s*(\d+(?:\.\d+)?)\s*([KMG]?)B?\s*", str(value or ""), re.IGNORECASE
+    )
+    if not match:
+        return default
+    number, unit = match.groups()
+    return int(float(number) * 1024 ** " KMG".index(unit.upper() or " "))
+
+
+def load_logging_config(config_path: Path = CONFIG_PATH) -> Dict[str, Any]:
+    """The ``logging`` section of nexus.yaml, or {} if it can't be read"""
+    try:
+        import yaml
+
+        with open(config_path, "r") as f:
+            return (yaml.safe_load(f) or {}).get("logging", {}) or {}
+    except Exception:
+        return {}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one compact JSON line, operation fields at top level"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            data.update((key, fields.get(key)) for key in OPERATION_FIELDS)
+            data.update(
+                (key, value) for key, value in fields.items() if key not in data
+            )
+        else:
+            data["message"] = record.getMessage()
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, separators=(",", ":"), default=str)
+
+
+def _rotating_handler(
+    log_file: Path, max_bytes: int, backup_count: int, formatter: logging.Formatter
+):
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    # delay=True: the file is opened by the listener thread on first write
+    handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, delay=True
+    )
+    handler.setFormatter(formatter)
+    return handler
+
+
+def _start_listener(*handlers: logging.Handler) -> logging.handlers.QueueHandler:
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        records, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    _listeners.append(listener)
+    return logging.handlers.QueueHandler(records)
+
 
 def setup_logging(
-    level: str = "INFO",
+    level: Optional[str] = None,
     log_file: Optional[str] = None,
-    log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    log_format: str = DEFAULT_FORMAT,
+    config_path: Path = CONFIG_PATH,
+    structured: Optional[bool] = None,
+    stream: Optional[TextIO] = None,
 ) -> None:
     """
     Setup logging configuration for NEXUS.
-    
+
+    Only the first call configures anything; later calls at most change the
+    level. Records go onto a queue and a background QueueListener writes
+    them to stdout and a size-rotated log file, so callers never wait on I/O.
+
     Args:
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_file: Optional log file path
+        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL);
+            defaults to logging.level in nexus.yaml
+        log_file: Optional log file path; defaults to logging.file in nexus.yaml
         log_format: Log message format
+        config_path: nexus.yaml providing level, file, max_size and backup_count
+        structured: Write the log file as JSON lines (see JsonFormatter);
+            defaults to logging.structured in nexus.yaml. The console stays plain text.
+        stream: Console stream (default stdout); scripts whose stdout is
+            machine-read pass sys.stderr
     """
-    try:
-        # Get project root
-        project_root = Path(__file__).parent.parent.parent.parent
-        
-        # Create logs directory if it doesn't exist
-        logs_dir = project_root / "data" / "logs"
-        logs_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Set default log file if none specified
-        if log_file is None:
-            log_file = logs_dir / "nexus.log"
-        
-        # Configure logging
-        logging.basicConfig(
-            level=getattr(logging, level.upper()),
-            format=log_format,
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler(log_file)
-            ]
-        )
-        
+    global _queue_handler
+
+    with _lock:
+        if _queue_handler is not None:
+            if level:
+                set_log_level(level)
+            return
+
+        config = load_logging_config(config_path)
+        level = (level or config.get("level") or "INFO").upper()
+        log_level = getattr(logging, level, logging.INFO)
+        if structured is None:
+            structured = bool(config.get("structured", False))
+
+        try:
+            if log_file is None:
+                log_file = project_root / config.get("file", "data/logs/nexus.log")
+
+            console = logging.StreamHandler(stream or sys.stdout)
+            console.setFormatter(logging.Formatter(log_format))
+            file_handler = _rotating_handler(
+                Path(log_file),
+                parse_size(config.get("max_size")),
+                int(config.get("backup_count", DEFAULT_BACKUP_COUNT)),
+                JsonFormatter() if structured else logging.Formatter(log_format),
+            )
+            _queue_handler = _start_listener(console, file_handler)
+
+        except Exception as e:
+            # Fallback to console-only logging if the log file can't be set up
+            _queue_handler = _start_listener(
+                logging.StreamHandler(stream or sys.stdout)
+            )
+            logging.getLogger(__name__).warning(
+                f"Could not setup advanced logging: {e}"
+            )
+
+        root = logging.getLogger()
+        root.addHandler(_queue_handler)
+        root.setLevel(log_level)
+
         # Set specific logger levels
-        logging.getLogger("nexus").setLevel(getattr(logging, level.upper()))
-        
+        logging.getLogger("nexus").setLevel(log_level)
+
         # Reduce noise from external libraries
         logging.getLogger("urllib3").setLevel(logging.WARNING)
         logging.getLogger("requests").setLevel(logging.WARNING)
-        
-    except Exception as e:
-        # Fallback to basic logging if setup fails
-        logging.basicConfig(
-            level=getattr(logging, level.upper()),
-            format=log_format
-        )
-        logging.warning(f"Could not setup advanced logging: {e}")
+
+
+def shutdown_logging() -> None:
+    """Flush queued records, stop the listener threads and undo setup_logging"""
+    global _queue_handler
+
+    with _lock:
+        for listener in _listeners:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        _listeners.clear()
+
+        if _queue_handler is not None:
+            logging.getLogger().removeHandler(_queue_handler)
+            _queue_handler = None
+        for logger in _file_loggers.values():
+            logger.handlers.clear()
+        _file_loggers.clear()
+
+
+atexit.register(shutdown_logging)
+
 
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for the specified name.
-    
+
     Args:
         name: Logger name (usually __name__)
-        
+
     Returns:
         Configured logger instance
     """
     return logging.getLogger(name)
 
+
 def set_log_level(level: str) -> None:
     """
     Set the logging level for all NEXUS loggers.
-    
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
@@ -85,47 +229,92 @@ def set_log_level(level: str) -> None:
     except AttributeError:
         logging.warning(f"Invalid log level: {level}")
 
-def log_to_file(message: str, level: str = "INFO", log_file: Optional[str] = None) -> None:
+
+@contextmanager
+def log_operation(
+    operation: str, logger: Optional[logging.Logger] = None, **fields: Any
+) -> Iterator[Dict[str, Any]]:
+    """
+    Time a block and emit one structured record for it when it ends.
+
+    The yielded dict holds the record's fields; the block may add to it or
+    set ``outcome`` (default "ok", or "error" if the block raises).
+
+    Example:
+        with log_operation("swap_tool", display="left", tool="coding") as op:
+            op["outcome"] = "ok" if swap() else "failure"
+
+    Args:
+        operation: Operation name, e.g. swap_tool
+        logger: Logger to emit on (default nexus.ops)
+        **fields: Initial fields such as display, tool and profile
+    """
+    record = {"operation": operation, **fields}
+    start = time.perf_counter()
+    try:
+        yield record
+    except Exception as e:
+        record["outcome"] = "error"
+        record.setdefault("error", str(e))
+        raise
+    finally:
+        record.setdefault("outcome", "ok")
+        record["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        details = " ".join(
+            f"{key}={record[key]}"
+            for key in ("display", "tool", "profile")
+            if record.get(key)
+        )
+        message = f"⏱️ {operation} {record['outcome']} in {record['duration_ms']:.1f}ms"
+        (logger or logging.getLogger(OPERATIONS_LOGGER)).info(
+            f"{message} {details}".rstrip(), extra={"fields": record}
+        )
+
+
+def log_to_file(
+    message: str, level: str = "INFO", log_file: Optional[str] = None
+) -> None:
     """
     Log a message to a specific file.
-    
+
+    The default file is the main NEXUS log; other files each get one queued
+    rotating handler, created on first use and reused afterwards.
+
     Args:
         message: Message to log
         level: Logging level
         log_file: Optional log file path
     """
     try:
+        log_level = getattr(logging, level.upper())
+
         if log_file is None:
-            project_root = Path(__file__).parent.parent.parent.parent
-            log_file = project_root / "data" / "logs" / "nexus.log"
-        
-        # Ensure directory exists
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Create file handler
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, level.upper()))
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        file_handler.setFormatter(formatter)
-        
-        # Get logger and add handler
-        logger = logging.getLogger("nexus.file")
-        logger.addHandler(file_handler)
-        logger.setLevel(getattr(logging, level.upper()))
-        
-        # Log message
-        log_method = getattr(logger, level.lower())
-        log_method(message)
-        
-        # Remove handler to avoid duplicates
-        logger.removeHandler(file_handler)
-        
+            setup_logging()
+            logging.getLogger("nexus.file").log(log_level, message)
+            return
+
+        key = str(Path(log_file).resolve())
+        with _lock:
+            logger = _file_loggers.get(key)
+            if logger is None:
+                config = load_logging_config()
+                logger = logging.getLogger(f"nexus.file.{len(_file_loggers)}")
+                logger.propagate = False
+                logger.setLevel(logging.DEBUG)
+                logger.addHandler(
+                    _start_listener(
+                        _rotating_handler(
+                            Path(log_file),
+                            parse_size(config.get("max_size")),
+                            int(config.get("backup_count", DEFAULT_BACKUP_COUNT)),
+                            logging.Formatter(DEFAULT_FORMAT),
+                        )
+                    )
+                )
+                _file_loggers[key] = logger
+        logger.log(log_level, message)
+
     except Exception as e:
         logging.error(f"Could not log to file: {e}")
         # Fallback to console logging
-        logging.log(getattr(logging, level.upper()), message)
-
+        logging.log(getattr(logging, level.upper(), logging.INFO), message)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Shared fixtures for NEXUS tests"""
+
+import json
+import shutil
+import socket
+import struct
+import tempfile
+import threading
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+
+class FakeYabaiServer:
+    """Local stand-in for the yabai daemon socket.
+
+    Speaks the yabai wire format (int32 length, NUL-separated arguments) and
+    answers from ``self.state``; every other message is recorded and acked.
+    """
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.state = {"windows": [], "spaces": [], "displays": []}
+        self.messages = []
+        self.failures = {}
+        self._sock = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(self.socket_path)
+        self._sock.listen(64)
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._sock:
+            # shutdown() wakes the blocked accept() so the thread exits before
+            # its file descriptor number can be reused by the next server
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._sock.close()
+            self._thread.join(timeout=1)
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            with conn:
+                header = self._read_exact(conn, 4)
+                if not header:
+                    continue
+                (length,) = struct.unpack("i", header)
+                payload = self._read_exact(conn, length)
+                args = [a.decode() for a in payload.split(b"\0")[:-2]]
+                conn.sendall(self._handle(args))
+
+    @staticmethod
+    def _read_exact(conn, size):
+        data = b""
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+
+    def _handle(self, args):
+        with self._lock:
+            self.messages.append(args)
+        key = " ".join(args)
+        if key in self.failures:
+            return b"\x07" + self.failures[key].encode()
+        if args and args[0] == "query":
+            domain = args[1].lstrip("-")
+            items = self.state.get(domain, [])
+            if len(args) >= 4:
+                selector, value = args[2].lstrip("-"), int(args[3])
+                if selector == domain[:-1]:
+                    field = "index" if domain != "windows" else "id"
+                    match = [i for i in items if i.get(field) == value]
+                    return json.dumps(match[0] if match else {}).encode()
+                items = [i for i in items if i.get(selector) == value]
+            return json.dumps(items).encode()
+        if args[:2] == ["rule", "--list"]:
+            return json.dumps(self.state.get("rules", [])).encode()
+        return b""
+
+
+@pytest.fixture
+def yabai_server():
+    """Running fake yabai daemon; yields the server (socket at ``.socket_path``)"""
+    # AF_UNIX paths are length-limited, so keep the directory short
+    tmp_dir = tempfile.mkdtemp(prefix="yabai")
+    server = FakeYabaiServer(str(Path(tmp_dir) / "yabai.socket"))
+    server.start()
+    yield server
+    server.stop()
+    shutil.rmtree(tmp_dir, ignore_errors=True)
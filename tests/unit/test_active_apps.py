@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Unit tests for the active-app providers"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+import psutil
+
+from src.nexus.core.active_apps import (
+    AppProvider,
+    AppleScriptAppProvider,
+    ProcessAppProvider,
+    make_app_provider,
+)
+from src.nexus.core.process_table import ProcessInfo, ProcessTable, bundle_name
+
+
+class FakeTable:
+    """Stands in for ProcessTable with a hand-written process list"""
+
+    def __init__(self):
+        self.procs = {}
+
+    def add(self, pid, name, exe=""):
+        self.procs[pid] = ProcessInfo(pid, name, exe, bundle_name(exe))
+
+    def processes(self):
+        return dict(self.procs)
+
+
+@pytest.fixture
+def table():
+    table = FakeTable()
+    table.add(1, "launchd", "/sbin/launchd")
+    table.add(2, "Slack", "/Applications/Slack.app/Contents/MacOS/Slack")
+    helper = "Slack Helper.app/Contents/MacOS/Slack Helper"
+    table.add(
+        3, "Slack Helper", f"/Applications/Slack.app/Contents/Frameworks/{helper}"
+    )
+    table.add(4, "code", "/usr/share/code/code")
+    table.add(5, "Dock", "/System/Library/CoreServices/Dock.app/Contents/MacOS/Dock")
+    return table
+
+
+def test_maps_bundles_and_executables_to_apps(table):
+    provider = ProcessAppProvider(
+        table, exe_map={"code": "Visual Studio Code"}, ignore=["Dock"]
+    )
+    assert provider() == ["Slack", "Visual Studio Code"]
+
+
+def test_only_new_processes_are_mapped(table):
+    provider = ProcessAppProvider(table, exe_map={"code": "Visual Studio Code"})
+    provider.apps()
+    assert provider.mapped == 5
+
+    provider.apps()
+    assert provider.mapped == 5
+
+    table.add(6, "firefox", "/usr/lib/firefox/firefox")
+    table.add(7, "Cursor", "/Applications/Cursor.app/Contents/MacOS/Cursor")
+    del table.procs[2]
+    apps = provider.apps()
+    assert provider.mapped == 7
+    # Slack's helper is still running; Firefox isn't in the map and has no bundle
+    assert apps == ["Slack", "Visual Studio Code", "Cursor"]
+
+    del table.procs[3]
+    assert "Slack" not in provider.apps()
+
+
+def test_reused_pid_is_mapped_again(table):
+    provider = ProcessAppProvider(table)
+    assert "Slack" in provider.apps()
+
+    # Slack exits and its pids go to new processes
+    table.procs[2] = ProcessInfo(
+        2,
+        "Cursor",
+        "/Applications/Cursor.app/Contents/MacOS/Cursor",
+        "Cursor",
+        started=2.0,
+    )
+    table.procs[3] = ProcessInfo(3, "zsh", "/bin/zsh", None, started=2.0)
+    assert provider.apps() == ["Cursor"]
+
+
+def test_system_agents_are_not_apps(table):
+    table.add(
+        6,
+        "SystemUIServer",
+        "/System/Library/CoreServices/SystemUIServer.app/Contents/MacOS/SystemUIServer",
+    )
+    table.add(
+        7, "Finder", "/System/Library/CoreServices/Finder.app/Contents/MacOS/Finder"
+    )
+    table.add(8, "Notes", "/System/Applications/Notes.app/Contents/MacOS/Notes")
+    table.add(
+        9, "Tool", str(Path("~/Applications/Tool.app/Contents/MacOS/Tool").expanduser())
+    )
+    provider = ProcessAppProvider(table, exe_map={"finder": "Finder"})
+    assert provider() == ["Slack", "Finder", "Notes", "Tool"]
+
+
+def test_provider_interface_is_abstract():
+    with pytest.raises(TypeError):
+        AppProvider()
+
+
+def test_real_process_table_finds_this_process():
+    me = psutil.Process()
+    provider = ProcessAppProvider(ProcessTable(), exe_map={me.name(): "Test Runner"})
+    assert "Test Runner" in provider.apps()
+
+
+def test_backend_selection():
+    assert isinstance(make_app_provider({}), ProcessAppProvider)
+    assert isinstance(
+        make_app_provider({"backend": "applescript"}), AppleScriptAppProvider
+    )
+    provider = make_app_provider({"exe_map": {"Code": "VS Code"}, "ignore": ["Dock"]})
+    assert provider.exe_map == {"code": "VS Code"} and provider.ignore == {"dock"}
+
+
+def test_applescript_backend_without_osascript():
+    # No osascript here: the provider reports nothing rather than failing
+    assert AppleScriptAppProvider(timeout=1).apps() == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
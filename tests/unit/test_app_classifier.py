@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Unit tests for the compiled app classifier"""
+
+import io
+import random
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.app_classifier import (
+    AppClassifier,
+    KeywordAutomaton,
+    load_classifiers,
+    main,
+)
+
+
+def test_automaton_matches_brute_force():
+    rng = random.Random(7)
+    keywords = {"he": 1, "she": 2, "his": 4, "hers": 8, "e": 16, "ushers": 32, "sh": 64}
+    automaton = KeywordAutomaton(keywords)
+    for _ in range(500):
+        text = "".join(rng.choice("hesrux") for _ in range(rng.randint(0, 12)))
+        expected = 0
+        for keyword, mask in keywords.items():
+            if keyword in text:
+                expected |= mask
+        assert automaton.search(text) == expected, text
+
+
+def test_exact_and_contains_rules_in_priority_order():
+    classifier = AppClassifier(
+        {
+            "development": {"exact": ["Terminal"], "contains": ["code"]},
+            "communication": {"contains": ["slack", "teams"]},
+            "media": {"exact": ["Spotify"]},
+        }
+    )
+    assert classifier.categories_of("Visual Studio Code") == ("development",)
+    assert classifier.categories_of("terminal") == ("development",)
+    assert classifier.categories_of("Terminal Helper") == ()
+    assert classifier.categories_of("Slack Code Review") == (
+        "development",
+        "communication",
+    )
+    assert classifier.classify("Microsoft Teams") == "communication"
+    assert classifier.classify("Finder") is None
+    assert classifier.matches("SPOTIFY", "media")
+
+    apps = ["Finder", "Spotify", "Slack", "Microsoft Teams", "Cursor"]
+    assert classifier.count(apps) == {"media": 1, "communication": 2}
+    assert classifier.dominant(apps) == "communication"
+    assert classifier.dominant(apps + ["Terminal Helper"]) == "communication"
+    assert classifier.dominant(apps + ["VS Code"]) == "development"
+    assert classifier.dominant(["Finder"]) is None
+
+
+def test_results_are_memoised_per_name():
+    classifier = AppClassifier({"development": {"contains": ["code"]}})
+    calls = []
+    search = classifier._automaton.search
+    classifier._automaton.search = lambda text: calls.append(text) or search(text)
+
+    classifier.count(["VS Code", "Slack"] * 100)
+    assert calls == ["vs code", "slack"]
+
+
+def test_shipped_config_matches_the_old_rules():
+    classifiers = load_classifiers()
+
+    activity = classifiers["activity"]
+    assert activity.dominant(["Safari", "Figma"]) == "creative"
+    assert activity.dominant(["Spotify", "Terminal"]) == "development"
+    assert activity.dominant(["Finder"]) is None
+
+    signals = classifiers["profile_signals"].count(
+        ["Cursor", "Visual Studio Code", "Slack", "Spotify"]
+    )
+    assert (
+        signals["development"],
+        signals["communication"],
+        signals["entertainment"],
+    ) == (2, 1, 1)
+
+    purpose = classifiers["model_purpose"]
+    assert purpose.classify("Phi-4-reasoning-plus") == "reasoning"
+    assert purpose.classify("Qwen2.5-VL-7B") == "vision"
+    assert purpose.classify("deepseek-coder-6.7b") == "coding"
+    assert purpose.classify("Llama-3.1-8B-Instruct") == "chat"
+    assert purpose.classify("mistral-7b") is None
+
+    assert classifiers["window_rules"].names("float")[:4] == [
+        "Terminal",
+        "Finder",
+        "iTerm2",
+        "iTerm",
+    ]
+
+
+def test_missing_config_loads_nothing(tmp_path):
+    assert load_classifiers(tmp_path / "missing.yaml") == {}
+
+
+def test_cli_filters_stdin(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("Terminal\nCursor\nFinder\nSafari\n"))
+    assert main(["filter", "window_rules", "float", "--invert"]) == 0
+    assert capsys.readouterr().out.split("\n") == ["Cursor", "Safari", ""]
+
+    assert main(["names", "window_rules", "float"]) == 0
+    assert "System Settings" in capsys.readouterr().out.splitlines()
+    assert main(["filter", "window_rules"]) == 2
+
+
+def test_cli_fails_loudly_without_its_classes(monkeypatch, capsys, tmp_path):
+    from src.nexus.core import app_classifier
+
+    monkeypatch.setattr(app_classifier, "CONFIG_PATH", tmp_path / "missing.yaml")
+    monkeypatch.setattr(sys, "stdin", io.StringIO("Terminal\nCursor\n"))
+    assert main(["filter", "window_rules", "float", "--invert"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == "" and "window_rules/float" in captured.err
+
+    monkeypatch.undo()
+    assert main(["names", "window_rules", "no-such-category"]) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Unit tests for the batched app launcher"""
+
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.app_launcher import AppLauncher, CommandBackend, launched_apps
+from src.nexus.core import command_runner
+from src.nexus.core.dynamic_layout_manager import DynamicLayoutManager
+
+
+@pytest.fixture
+def fake_open(tmp_path):
+    """Stand-in for `open -a`: takes 0.2s, logs the app, fails for 'Broken'"""
+    script = tmp_path / "open"
+    log = tmp_path / "launched.log"
+    script.write_text(
+        "#!/bin/sh\n"
+        "sleep 0.2\n"
+        f'echo "$2" >> {log}\n'
+        'if [ "$2" = Broken ]; then\n'
+        "  echo \"Unable to find application named 'Broken'\" >&2; exit 1\n"
+        "fi\n"
+    )
+    script.chmod(0o755)
+    return script, log
+
+
+def processes(running=()):
+    table = MagicMock()
+    table.running.side_effect = lambda apps: {app: app in running for app in apps}
+    return table
+
+
+def test_launches_concurrently_and_skips_running(fake_open):
+    script, log = fake_open
+    launcher = AppLauncher(
+        CommandBackend([str(script), "-a", "{app}"]),
+        processes(running={"Finder"}),
+        max_concurrency=4,
+    )
+
+    start = time.perf_counter()
+    results = launcher.launch(["Code", "Slack", "Code", "Finder", "Broken", "Notes"])
+    elapsed = time.perf_counter() - start
+
+    assert list(results) == ["Code", "Slack", "Finder", "Broken", "Notes"]
+    assert results["Finder"].already_running
+    assert not results["Broken"].success and "Unable to find" in results["Broken"].error
+    assert all(results[app].seconds >= 0.2 for app in ("Code", "Slack", "Notes"))
+    assert launched_apps(results) == ["Code", "Slack", "Notes"]
+    assert sorted(log.read_text().split()) == ["Broken", "Code", "Notes", "Slack"]
+    # Four launches of 0.2s each, all in flight together
+    assert elapsed < 0.6
+
+
+def test_concurrency_limit(fake_open):
+    script, _ = fake_open
+    launcher = AppLauncher(
+        CommandBackend([str(script), "-a", "{app}"]), processes(), max_concurrency=2
+    )
+    start = time.perf_counter()
+    launcher.launch(["A", "B", "C", "D"])
+    assert time.perf_counter() - start >= 0.4
+
+
+def test_missing_backend_command_is_a_failure():
+    launcher = AppLauncher(CommandBackend(["/nonexistent/open", "{app}"]), processes())
+    result = launcher.launch(["Code"])["Code"]
+    assert not result.success and result.error
+
+
+def test_launches_are_recorded_and_time_limited(fake_open, monkeypatch):
+    script, _ = fake_open
+    runner = command_runner.CommandRunner()
+    monkeypatch.setattr(command_runner, "_shared_runner", runner)
+    launcher = AppLauncher(
+        CommandBackend([str(script), "-a", "{app}"], timeout=0.05), processes()
+    )
+    result = launcher.launch(["Code"])["Code"]
+    assert not result.success and "timed out" in result.error
+    assert runner.histogram.count("open") == 1
+
+
+def test_swap_tool_records_launch_results(fake_open):
+    script, _ = fake_open
+    manager = DynamicLayoutManager()
+    manager.launcher = AppLauncher(
+        CommandBackend([str(script), "-a", "{app}"]), processes()
+    )
+    display_name = next(iter(manager.displays))
+
+    with patch.object(manager, "_move_apps_when_ready") as move, patch.object(
+        manager, "_update_yabai_workspace"
+    ), patch.object(manager, "_save_layout_state"):
+        assert manager.swap_tool(display_name, "terminal")
+
+    move.assert_called_once()
+    launches = manager.layout_history[-1]["launches"]
+    assert set(launches) == {"Terminal", "iTerm2", "Alacritty"}
+    assert all(
+        entry["error"] is None and entry["seconds"] >= 0.2
+        for entry in launches.values()
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
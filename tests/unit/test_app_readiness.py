@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Unit tests for the app launch readiness waiter"""
+
+import asyncio
+import threading
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.yabai import YabaiClient
+from src.nexus.core.app_readiness import AppReadinessWaiter
+from src.nexus.core.workspace_model import SignalEvent, WorkspaceModel
+from src.nexus.core.dynamic_layout_manager import DynamicLayoutManager
+
+
+def window(window_id, app, display=1):
+    return {
+        "id": window_id,
+        "pid": window_id,
+        "app": app,
+        "display": display,
+        "space": 1,
+        "frame": {},
+    }
+
+
+def open_later(server, delay, *windows):
+    timer = threading.Timer(delay, lambda: server.state["windows"].extend(windows))
+    timer.start()
+    return timer
+
+
+@pytest.fixture
+def client(yabai_server):
+    return YabaiClient(socket_path=yabai_server.socket_path, cli_fallback=False)
+
+
+def test_waits_for_all_launches_concurrently(client, yabai_server):
+    open_later(yabai_server, 0.2, window(1, "Code"))
+    open_later(yabai_server, 0.3, window(2, "Slack"))
+
+    start = time.perf_counter()
+    ready = asyncio.run(
+        AppReadinessWaiter(client).wait_for_apps(["Code", "Slack"], timeout=3)
+    )
+    elapsed = time.perf_counter() - start
+
+    assert [w.id for w in ready["Code"]] == [1]
+    assert [w.id for w in ready["Slack"]] == [2]
+    assert elapsed < 1.0
+
+
+def test_missing_app_times_out_empty(client):
+    start = time.perf_counter()
+    windows = asyncio.run(
+        AppReadinessWaiter(client).wait_for_window("Nope", timeout=0.3)
+    )
+    assert windows == []
+    assert time.perf_counter() - start < 0.6
+
+
+def test_window_created_event_wakes_waiter(client, yabai_server):
+    model = WorkspaceModel(client)
+    model.load()
+    yabai_server.state["windows"].append(window(5, "Code"))
+    threading.Timer(
+        0.1, lambda: model.apply(SignalEvent("window_created", window=5))
+    ).start()
+
+    # Backoff alone would not poll again for seconds
+    waiter = AppReadinessWaiter(client, model, initial_delay=5, max_delay=5)
+    with patch.object(
+        WorkspaceModel, "listening", new_callable=PropertyMock, return_value=True
+    ):
+        start = time.perf_counter()
+        windows = asyncio.run(waiter.wait_for_window("Code", timeout=5))
+
+    assert [w.id for w in windows] == [5]
+    assert time.perf_counter() - start < 1.0
+    assert model._subscribers == []
+
+
+def test_event_during_lookup_is_not_lost(client, yabai_server):
+    model = WorkspaceModel(client)
+    model.load()
+    waiter = AppReadinessWaiter(client, model, initial_delay=5, max_delay=5)
+    find = waiter._find
+    calls = []
+
+    def racing_find(apps, use_events):
+        # The window appears just after this lookup missed it
+        found = find(apps, use_events)
+        if not calls:
+            yabai_server.state["windows"].append(window(6, "Code"))
+            thread = threading.Thread(
+                target=model.apply, args=(SignalEvent("window_created", window=6),)
+            )
+            thread.start()
+            thread.join()
+            found = {}
+        calls.append(1)
+        return found
+
+    with patch.object(
+        WorkspaceModel, "listening", new_callable=PropertyMock, return_value=True
+    ), patch.object(waiter, "_find", side_effect=racing_find):
+        start = time.perf_counter()
+        windows = asyncio.run(waiter.wait_for_window("Code", timeout=5))
+
+    assert [w.id for w in windows] == [6]
+    assert time.perf_counter() - start < 1.0
+
+
+def test_move_app_waits_for_first_window(client, yabai_server):
+    manager = DynamicLayoutManager()
+    manager.yabai = client
+    open_later(yabai_server, 0.2, window(7, "Code", display=1))
+
+    manager._move_app_to_display("Code", 2)
+    assert ["window", "7", "--display", "2"] in yabai_server.messages
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
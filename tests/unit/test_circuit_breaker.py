@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Unit tests for the yabai circuit breaker"""
+
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.circuit_breaker import CircuitBreaker, CLOSED, OPEN
+from src.nexus.core.yabai import YabaiClient, YabaiError, YabaiUnavailable
+
+
+def wait_for(predicate, timeout=2.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def down_client(yabai_server):
+    """Client whose socket doesn't exist yet; point it at yabai_server to restart"""
+    breaker = CircuitBreaker(
+        "yabai", failure_threshold=3, reset_timeout=0.05, max_reset_timeout=0.1
+    )
+    return YabaiClient(
+        socket_path=yabai_server.socket_path + ".down",
+        cli_fallback=False,
+        breaker=breaker,
+    )
+
+
+def test_opens_after_consecutive_failures_and_fails_fast(down_client):
+    breaker = down_client.breaker
+    for _ in range(3):
+        with pytest.raises(YabaiUnavailable):
+            down_client.query("windows")
+    assert breaker.state == OPEN
+
+    with pytest.raises(YabaiUnavailable, match="circuit open"):
+        down_client.query("windows")
+    assert not down_client.is_available()
+    assert breaker.snapshot()["short_circuits"] == 2
+    assert "socket not found" in down_client.health["last_error"]
+
+
+def test_background_probe_closes_the_circuit(down_client, yabai_server):
+    yabai_server.state["displays"] = [{"id": 1, "index": 1}]
+    for _ in range(3):
+        with pytest.raises(YabaiUnavailable):
+            down_client.query("displays")
+
+    # Probes keep failing while yabai is down
+    assert wait_for(lambda: down_client.breaker.probes >= 2)
+    assert down_client.breaker.state != CLOSED
+    assert yabai_server.messages == []
+
+    down_client.socket_path = yabai_server.socket_path
+    assert wait_for(lambda: down_client.breaker.state == CLOSED)
+    assert down_client.query("displays") == [{"id": 1, "index": 1}]
+
+
+def test_rejected_messages_are_not_outages(yabai_server):
+    breaker = CircuitBreaker("yabai", failure_threshold=2)
+    client = YabaiClient(
+        socket_path=yabai_server.socket_path, cli_fallback=False, breaker=breaker
+    )
+    yabai_server.failures["window --focus 99"] = "could not locate window"
+
+    for _ in range(3):
+        with pytest.raises(YabaiError) as error:
+            client.send("window --focus 99")
+        assert not isinstance(error.value, YabaiUnavailable)
+    assert breaker.state == CLOSED
+    assert client.query("windows") == []
+
+
+def test_success_resets_the_failure_count(down_client, yabai_server):
+    for _ in range(2):
+        with pytest.raises(YabaiUnavailable):
+            down_client.query("windows")
+    down_client.socket_path = yabai_server.socket_path
+    down_client.query("windows")
+    assert down_client.health["failures"] == 0
+    assert down_client.breaker.trips == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
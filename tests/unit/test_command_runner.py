@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Unit tests for the central async command runner"""
+
+import asyncio
+import sys
+import threading
+import time
+import pytest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.command_runner import CommandRunner, LatencyHistogram
+
+PYTHON = sys.executable
+
+
+def test_collects_output_and_records_latency():
+    runner = CommandRunner()
+    result = runner.run_sync(
+        [PYTHON, "-c", "import sys; print('hi'); sys.stderr.write('warn')"], name="echo"
+    )
+
+    assert result.ok and result.stdout.strip() == "hi" and result.stderr == "warn"
+    assert runner.histogram.count("echo") == 1
+    assert runner.histogram.snapshot()["echo"]["count"] == 1
+
+
+def test_failures_and_missing_programs_are_reported():
+    runner = CommandRunner()
+    failed = runner.run_sync([PYTHON, "-c", "import sys; sys.exit(3)"])
+    missing = runner.run_sync(["/nonexistent/program"])
+
+    assert not failed.ok and failed.returncode == 3 and failed.error == "exit status 3"
+    assert missing.returncode == 127 and not missing.ok
+    assert runner.histogram.count("program") == 1
+
+
+def test_timeout_kills_the_command():
+    runner = CommandRunner(timeout=0.2)
+    start = time.perf_counter()
+    result = runner.run_sync([PYTHON, "-c", "import time; time.sleep(10)"])
+
+    assert result.timed_out and not result.ok
+    assert time.perf_counter() - start < 2
+    assert runner.running == 0
+
+
+def test_concurrency_limit_is_global_across_threads():
+    runner = CommandRunner(max_concurrency=2)
+    sleep = [PYTHON, "-c", "import time; time.sleep(0.3)"]
+    peak = []
+
+    def watch():
+        end = time.time() + 1.0
+        while time.time() < end:
+            peak.append(runner.running)
+            time.sleep(0.01)
+
+    watcher = threading.Thread(target=watch)
+    watcher.start()
+    workers = [
+        threading.Thread(target=lambda: runner.run_sync(sleep)) for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    results = asyncio.run(runner.run_all([sleep, sleep]))
+    for worker in workers:
+        worker.join()
+    watcher.join()
+
+    assert all(r.ok for r in results)
+    assert max(peak) == 2
+    assert runner.histogram.count(Path(PYTHON).name) == 4
+
+
+def test_cancellation():
+    runner = CommandRunner()
+    sleep = [PYTHON, "-c", "import time; time.sleep(10)"]
+
+    async def cancel_task():
+        task = asyncio.create_task(runner.run(sleep))
+        await asyncio.sleep(0.3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    async def cancel_all():
+        task = asyncio.create_task(runner.run(sleep))
+        while not runner.running:
+            await asyncio.sleep(0.01)
+        assert runner.cancel_all() == 1
+        return await task
+
+    start = time.perf_counter()
+    asyncio.run(cancel_task())
+    result = asyncio.run(cancel_all())
+    assert result.cancelled and not result.ok
+    assert time.perf_counter() - start < 3
+    assert runner.running == 0
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe("yabai", seconds)
+
+    assert histogram.percentile("yabai", 50) == 0.1
+    assert histogram.percentile("yabai", 75) == 1.0
+    assert histogram.percentile("yabai", 99) == float("inf")
+    assert histogram.percentile("missing", 50) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Unit tests for the background workspace-context sampler"""
+
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.context_sampler import (
+    ContextSampler,
+    SystemReader,
+    load_context_config,
+)
+from src.nexus.core.yabai import YabaiClient
+
+
+@pytest.fixture
+def make_sampler(yabai_server):
+    yabai_server.state["displays"] = [{"id": 1, "index": 1}, {"id": 2, "index": 2}]
+    samplers = []
+
+    def make(interval):
+        calls = []
+
+        def active_apps():
+            calls.append(time.monotonic())
+            return ["Cursor", "Slack"]
+
+        sampler = ContextSampler(
+            interval=interval,
+            client=YabaiClient(socket_path=yabai_server.socket_path),
+            active_apps=active_apps,
+        )
+        sampler.calls = calls
+        samplers.append(sampler)
+        return sampler
+
+    yield make
+    for sampler in samplers:
+        sampler.stop()
+
+
+def test_first_read_samples_then_starts_the_thread(make_sampler):
+    sampler = make_sampler(0.05)
+    sample = sampler.latest()
+
+    assert sample.active_apps == ("Cursor", "Slack")
+    assert [d["id"] for d in sample.displays] == [1, 2]
+    assert 0 <= sample.memory_percent <= 100 and sample.available_memory_gb > 0
+    assert sampler.running
+    time.sleep(0.3)
+    assert sampler.samples >= 3
+    assert sampler.latest() is not sample
+
+
+def test_reads_come_from_the_snapshot(make_sampler, yabai_server):
+    sampler = make_sampler(60)
+    first = sampler.latest()
+    messages, calls = len(yabai_server.messages), len(sampler.calls)
+
+    start = time.perf_counter()
+    for _ in range(10000):
+        assert sampler.latest() is first
+    assert time.perf_counter() - start < 0.5
+    assert len(yabai_server.messages) == messages and len(sampler.calls) == calls
+
+
+def test_max_staleness_forces_a_fresh_sample(make_sampler):
+    sampler = make_sampler(60)
+    first = sampler.latest()
+    time.sleep(0.02)
+
+    assert sampler.latest(max_staleness=10) is first
+    fresh = sampler.latest(max_staleness=0.01)
+    assert fresh is not first and fresh.age < 0.01
+    assert sampler.latest() is fresh
+
+
+def test_sample_survives_failing_sources(yabai_server):
+    def broken():
+        raise RuntimeError("no System Events")
+
+    client = YabaiClient(
+        socket_path=yabai_server.socket_path + ".missing", cli_fallback=False
+    )
+    sample = ContextSampler(client=client, active_apps=broken).sample()
+    assert sample.active_apps == () and sample.displays == ()
+    assert sample.fresh == {"apps": False, "system": True, "displays": False}
+    assert sample.stale_sources == ["apps", "displays"]
+
+
+def test_sources_run_concurrently_with_their_own_timeouts(make_sampler):
+    sampler = make_sampler(60)
+    first = sampler.sample()
+    release = threading.Event()
+    calls = []
+
+    def slow_apps():
+        calls.append(1)
+        release.wait(5)
+        return ["Xcode"]
+
+    sampler.sources[0].read = slow_apps
+    sampler.sources[0].timeout = 0.2
+
+    start = time.perf_counter()
+    partial = sampler.sample()
+    elapsed = time.perf_counter() - start
+    # Bounded by the apps timeout, with the previous apps kept and flagged stale
+    assert 0.2 <= elapsed < 0.5
+    assert partial.active_apps == first.active_apps
+    assert partial.fresh == {"apps": False, "system": True, "displays": True}
+
+    # The hung read is not started again while it is still running
+    sampler.sample()
+    assert len(calls) == 1
+    release.set()
+    time.sleep(0.05)
+    assert sampler.sample().active_apps == ("Xcode",)
+
+
+def test_first_system_read_measures_cpu_over_a_real_window():
+    reader = SystemReader(cpu_window=0.1)
+    start = time.perf_counter()
+    # Keep a core busy so the first reading has something to measure
+    while time.perf_counter() - start < 0.15:
+        pass
+    cpu, memory_percent, _ = reader()
+    assert cpu > 0 and 0 < memory_percent <= 100
+
+    # Only the first read waits for the window
+    start = time.perf_counter()
+    reader()
+    assert time.perf_counter() - start < 0.05
+
+    # Read straight after construction, it waits out the window rather than report 0.0
+    start = time.perf_counter()
+    SystemReader(cpu_window=0.1)()
+    assert time.perf_counter() - start >= 0.09
+
+
+def test_context_config(tmp_path):
+    config = tmp_path / "nexus.yaml"
+    config.write_text(
+        "context:\n  sample_interval: 0.5\n  source_timeouts:\n    apps: 2\n"
+    )
+    assert load_context_config(config) == {
+        "sample_interval": 0.5,
+        "source_timeouts": {"apps": 2},
+    }
+    assert load_context_config(tmp_path / "missing.yaml") == {}
+
+    sampler = ContextSampler(client=object(), timeouts={"apps": 2})
+    assert [s.timeout for s in sampler.sources] == [2, 0.5, 0.5]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
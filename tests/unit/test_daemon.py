@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Unit tests for nexusd and its JSON-RPC client"""
+
+import os
+import socket
+import shutil
+import stat
+import statistics
+import subprocess
+import tempfile
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.daemon.client import (
+    EXIT_UNAVAILABLE,
+    DaemonUnavailable,
+    NexusClient,
+    RemoteError,
+    main,
+)
+from src.nexus.daemon.server import NexusDaemon
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are length-limited, so keep the directory short
+    tmp_dir = tempfile.mkdtemp(prefix="nexusd")
+    yield str(Path(tmp_dir) / "nexusd.socket")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    manager = MagicMock()
+    manager.swap_tool.side_effect = lambda display, tool: tool == "terminal"
+    daemon = NexusDaemon(socket_path, manager_factory=lambda: manager)
+    daemon.start()
+    yield daemon
+    daemon.shutdown()
+
+
+def test_calls_reach_the_resident_manager(daemon, socket_path):
+    client = NexusClient(socket_path)
+    assert client.call("ping") == "pong"
+    assert client.call("swap", display="left", tool="terminal") is True
+    assert client.call("swap", "left", "vim") is False
+    daemon.manager.swap_tool.assert_called_with("left", "vim")
+
+
+def test_round_trip_is_fast(daemon, socket_path):
+    client = NexusClient(socket_path)
+    samples = []
+    for _ in range(50):
+        start = time.perf_counter()
+        client.call("ping")
+        samples.append(time.perf_counter() - start)
+    assert statistics.median(samples) < 0.005
+
+
+def test_json_rpc_errors(daemon, socket_path):
+    client = NexusClient(socket_path)
+    with pytest.raises(RemoteError) as error:
+        client.call("no_such_method")
+    assert error.value.code == -32601
+    with pytest.raises(RemoteError) as error:
+        client.call("swap", display="left")
+    assert error.value.code == -32602
+
+    assert daemon.dispatch(b"{not json")["error"]["code"] == -32700
+    assert (
+        daemon.dispatch(b'{"jsonrpc": "2.0", "method": "ping"}') is None
+    )  # notification
+
+
+def test_socket_lifecycle(daemon, socket_path):
+    with pytest.raises(RuntimeError):
+        NexusDaemon(socket_path, manager_factory=MagicMock).start()
+
+    assert NexusClient(socket_path).call("shutdown") is True
+    time.sleep(0.1)
+    assert not os.path.exists(socket_path)
+    with pytest.raises(DaemonUnavailable):
+        NexusClient(socket_path).call("ping")
+
+
+def test_socket_is_created_owner_only(socket_path):
+    previous = os.umask(0o022)
+    daemon = NexusDaemon(socket_path, manager_factory=MagicMock)
+    try:
+        daemon.start()
+        assert os.umask(0o022) == 0o022  # restored after bind
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) & 0o077 == 0
+    finally:
+        os.umask(previous)
+        daemon.shutdown()
+
+
+def test_cli_profile_switch_reports_the_daemon_result(daemon, socket_path):
+    switcher = MagicMock()
+    switcher.switch_profile.side_effect = lambda name, force=False: name == "work"
+    daemon._profile_switcher = switcher
+    env = dict(
+        os.environ, NEXUSD_SOCKET=socket_path, PYTHONPATH=str(project_root / "src")
+    )
+
+    def switch(profile):
+        return subprocess.run(
+            [sys.executable, "-m", "nexus.cli.main", "profile", "switch", profile],
+            capture_output=True,
+            text=True,
+            env=env,
+            cwd=project_root / "src",
+        )
+
+    result = switch("work")
+    assert result.returncode == 0 and "Successfully switched" in result.stdout
+    result = switch("missing")
+    assert result.returncode == 1 and "Failed to switch" in result.stdout
+
+
+def test_stale_socket_is_replaced(socket_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    daemon = NexusDaemon(socket_path, manager_factory=MagicMock)
+    daemon.start()
+    try:
+        assert NexusClient(socket_path).is_running()
+    finally:
+        daemon.shutdown()
+
+
+def test_client_script_fast_path(daemon, socket_path, monkeypatch):
+    script = project_root / "src" / "nexus" / "daemon" / "client.py"
+    env = dict(os.environ, NEXUSD_SOCKET=socket_path)
+    result = subprocess.run(
+        [sys.executable, "-S", str(script), "swap", "left", "terminal"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert result.returncode == 0 and "Success" in result.stdout
+
+    monkeypatch.setenv("NEXUSD_SOCKET", socket_path + ".missing")
+    assert main(["swap", "left", "terminal"]) == EXIT_UNAVAILABLE
+    assert main(["status"]) == EXIT_UNAVAILABLE
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
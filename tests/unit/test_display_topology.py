@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Unit tests for the cached display topology"""
+
+import os
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core import display_topology
+from src.nexus.core.yabai import YabaiClient
+from src.nexus.core.display_topology import DisplayTopologyService
+from src.nexus.core.workspace_model import SignalEvent, WorkspaceModel
+from src.nexus.core.dynamic_layout_manager import DynamicLayoutManager
+
+
+def display(index, x):
+    return {
+        "id": index,
+        "uuid": f"uuid-{index}",
+        "index": index,
+        "frame": {"x": x, "y": 0, "w": 1920, "h": 1080},
+    }
+
+
+@pytest.fixture
+def client(yabai_server):
+    yabai_server.state["displays"] = [display(1, 0), display(2, 1920)]
+    return YabaiClient(socket_path=yabai_server.socket_path, cli_fallback=False)
+
+
+@pytest.fixture
+def service(client, tmp_path):
+    return DisplayTopologyService(
+        client, count_file=tmp_path / "current_display_count.txt"
+    )
+
+
+def test_resolves_once(service, yabai_server):
+    for _ in range(50):
+        topology = service.current()
+    assert topology.count == 2 and topology.source == "yabai"
+    assert [d.frame["x"] for d in topology.displays] == [0, 1920]
+    assert service.resolutions == 1
+    assert len(yabai_server.messages) == 1
+
+
+def test_count_file_change_invalidates(service):
+    first = service.current()
+    service.count_file.write_text("1\n")
+    second = service.current()
+    assert second.count == 1 and second.source == "file"
+    assert second.fingerprint != first.fingerprint
+
+    service.count_file.write_text("7\n")  # out of range, ignored
+    os.utime(service.count_file, (1, 1))
+    assert service.current().count == 2
+    assert service.resolutions == 3
+
+
+def test_hotplug_event_invalidates(service, client, yabai_server):
+    model = WorkspaceModel(client)
+    service.attach(model)
+    service.attach(model)
+    service.current()
+
+    model.apply(SignalEvent("window_focused", payload={}))
+    assert service.resolutions == 1
+
+    yabai_server.state["displays"].append(display(3, 3840))
+    model.apply(SignalEvent("display_added", display=3))
+    assert service.current().count == 3
+    assert service.resolutions == 2
+
+
+def test_manager_resolves_display_count_once(service, monkeypatch):
+    monkeypatch.setattr(display_topology, "_shared_service", service)
+    manager = DynamicLayoutManager()
+    assert manager.display_count == 2
+    assert set(manager.displays) == {"left", "right"}
+    assert service.resolutions == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
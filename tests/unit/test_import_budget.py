@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Import-time budget for the nexus package and CLI"""
+
+import os
+import subprocess
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+SRC = project_root / "src"
+
+# Cumulative cold-import budget for the CLI entry point, in microseconds.
+# It is ~50ms locally (mostly argparse/logging); the eager version was ~125ms.
+CLI_BUDGET_US = 100_000
+
+# Nothing the CLI needs for `version` or `--help`
+HEAVY_MODULES = {
+    "yaml",
+    "psutil",
+    "asyncio",
+    "subprocess",
+    "nexus.core.dynamic_layout_manager",
+}
+
+
+def importtime(statement: str):
+    """Run ``statement`` under -X importtime; returns {module: cumulative_us}"""
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=SRC,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_package_import_is_lazy():
+    modules = importtime("import nexus, nexus.core, nexus.cli, nexus.daemon")
+    assert not HEAVY_MODULES & set(modules)
+
+
+def test_cli_cold_start_budget():
+    # Best of three to ride out a noisy machine
+    runs = [importtime("import nexus.cli.main") for _ in range(3)]
+    assert not HEAVY_MODULES & set(runs[0])
+    assert min(run["nexus.cli.main"] for run in runs) < CLI_BUDGET_US
+
+
+def test_lazy_attributes_still_resolve():
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    script = (
+        "import nexus, nexus.cli, sys\n"
+        "assert 'nexus.core.dynamic_layout_manager' not in sys.modules\n"
+        "assert nexus.DynamicLayoutManager.__name__ == 'DynamicLayoutManager'\n"
+        "assert nexus.cli.QuickMenu.__name__ == 'QuickMenu'\n"
+        "print(sorted(set(dir(nexus)) & {'DynamicLayoutManager', '__version__'}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, cwd=SRC
+    )
+    assert result.returncode == 0, result.stderr
+    assert "DynamicLayoutManager" in result.stdout
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
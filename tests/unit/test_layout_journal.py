@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Unit tests for the layout journal"""
+
+import gc
+import json
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.layout_journal import LayoutJournal
+from src.nexus.core.dynamic_layout_manager import DynamicLayoutManager, HISTORY_SIZE
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return LayoutJournal(tmp_path / "layout_state.json", fsync_batch=4, compact_every=5)
+
+
+def test_fsync_is_batched(journal):
+    with patch("os.fsync") as fsync:
+        for i in range(8):
+            journal.append({"event": "swap", "n": i})
+    assert fsync.call_count == 2
+    assert len(journal.journal_path.read_text().splitlines()) == 8
+
+
+def test_load_returns_checkpoint_plus_tail(journal):
+    for i in range(3):
+        journal.append({"n": i})
+    journal.checkpoint({"current_profile": "work"})
+    journal.append({"n": 3})
+    journal.close()
+
+    state, tail = LayoutJournal(journal.checkpoint_path).load()
+    assert state["current_profile"] == "work" and state["seq"] == 3
+    assert [r["n"] for r in tail] == [3]
+
+
+def test_records_folded_into_checkpoint_are_not_replayed(journal):
+    journal.append({"n": 0})
+    journal.append({"n": 1})
+    # Crash after the checkpoint was written but before the journal was emptied
+    with patch(
+        "builtins.open",
+        side_effect=[
+            open(journal.checkpoint_path.with_name("layout_state.json.tmp"), "w"),
+            OSError,
+        ],
+    ):
+        with pytest.raises(OSError):
+            journal.checkpoint({"current_profile": "work"})
+    with open(journal.journal_path, "a") as f:
+        f.write('{"n": 2, "seq"')  # torn write
+
+    state, tail = LayoutJournal(journal.checkpoint_path).load()
+    assert state["seq"] == 2
+    assert tail == []
+
+
+def test_checkpoint_keeps_records_after_its_seq(journal):
+    for i in range(3):
+        journal.append({"n": i})
+    # The state only reflects the first two records
+    journal.checkpoint({"current_profile": "work"}, seq=2)
+    assert journal.pending == 1
+    journal.append({"n": 3})
+    journal.close()
+
+    state, tail = LayoutJournal(journal.checkpoint_path).load()
+    assert state["seq"] == 2
+    assert [(r["seq"], r["n"]) for r in tail] == [(3, 2), (4, 3)]
+
+
+def test_new_journal_resumes_numbering_from_disk(journal):
+    for i in range(3):
+        journal.append({"n": i})
+    journal.checkpoint({"x": 1})
+    journal.append({"n": 3})
+    journal.close()
+
+    # A later process must not reuse sequence numbers the checkpoint folded in
+    later = LayoutJournal(journal.checkpoint_path)
+    assert later.seq == 4
+    later.append({"n": 4})
+    later.close()
+
+    state, tail = LayoutJournal(journal.checkpoint_path).load()
+    assert state["seq"] == 3
+    assert [r["n"] for r in tail] == [3, 4]
+
+
+def test_interval_fsync_runs_without_another_append(tmp_path):
+    journal = LayoutJournal(
+        tmp_path / "layout_state.json", fsync_batch=100, fsync_interval=0.05
+    )
+    with patch("os.fsync") as fsync:
+        journal.append({"n": 0})
+        assert fsync.call_count == 0
+        time.sleep(0.2)
+        assert fsync.call_count == 1
+    journal.close()
+
+
+def test_closed_journals_are_not_kept_alive(tmp_path):
+    from src.nexus.core import layout_journal
+
+    journal = LayoutJournal(tmp_path / "layout_state.json")
+    assert journal in layout_journal._open_journals
+    del journal
+    gc.collect()
+    assert (
+        len(
+            [
+                j
+                for j in layout_journal._open_journals
+                if j.checkpoint_path.parent == tmp_path
+            ]
+        )
+        == 0
+    )
+
+
+def test_manager_journals_swaps_and_restores(tmp_path):
+    manager = DynamicLayoutManager()
+    manager.journal = LayoutJournal(tmp_path / "layout_state.json", compact_every=4)
+    display_name = next(iter(manager.displays))
+
+    with patch.object(manager, "_execute_tool_swap", return_value=True):
+        for tool in ["terminal", "code_editor", "web_browser", "terminal", "ai_chat"]:
+            manager.swap_tool(display_name, tool)
+    manager.journal.close()
+
+    # Four swaps compacted into the checkpoint, one left in the journal
+    assert (
+        json.loads(manager.journal.checkpoint_path.read_text())["displays"][
+            display_name
+        ]["current_tool"]
+        == "terminal"
+    )
+    assert len(manager.journal.journal_path.read_text().splitlines()) == 1
+
+    restored = DynamicLayoutManager()
+    restored.journal = LayoutJournal(manager.journal.checkpoint_path)
+    restored.load_layout_state()
+    assert restored.displays[display_name].current_tool == "ai_chat"
+    assert [e["new_tool"] for e in restored.layout_history][-2:] == [
+        "terminal",
+        "ai_chat",
+    ]
+    assert restored.layout_history.maxlen == HISTORY_SIZE
+
+
+def test_stacked_swaps_survive_a_restart(tmp_path):
+    manager = DynamicLayoutManager()
+    manager.journal = LayoutJournal(tmp_path / "layout_state.json", compact_every=2)
+    display_name = next(iter(manager.displays))
+
+    with patch.object(manager, "_execute_tool_swap", return_value=True):
+        manager.swap_tool(display_name, "terminal")
+        manager.swap_tool(display_name, "code_editor", stack=True)
+        # Checkpointed after two swaps; this one stays in the journal
+        manager.swap_tool(display_name, "web_browser", stack=True)
+    manager.journal.close()
+    live = manager.displays[display_name]
+    assert (live.current_tool, live.stacked_tools) == (
+        "terminal",
+        ["code_editor", "web_browser"],
+    )
+
+    restored = DynamicLayoutManager()
+    restored.journal = LayoutJournal(manager.journal.checkpoint_path)
+    restored.load_layout_state()
+    display = restored.displays[display_name]
+    assert (display.current_tool, display.stacked_tools) == (
+        "terminal",
+        ["code_editor", "web_browser"],
+    )
+
+
+def test_checkpoint_uses_the_last_applied_swap(tmp_path):
+    manager = DynamicLayoutManager()
+    manager.journal = LayoutJournal(tmp_path / "layout_state.json")
+    display_name = next(iter(manager.displays))
+
+    with patch.object(manager, "_execute_tool_swap", return_value=True):
+        manager.swap_tool(display_name, "terminal")
+    # A swap journaled by another thread but not yet applied in memory
+    manager.journal.append(
+        {"event": "swap", "display": display_name, "new_tool": "ai_chat"}
+    )
+    manager._write_checkpoint()
+    manager.journal.close()
+
+    restored = DynamicLayoutManager()
+    restored.journal = LayoutJournal(manager.journal.checkpoint_path)
+    restored.load_layout_state()
+    assert restored.displays[display_name].current_tool == "ai_chat"
+    assert [e["new_tool"] for e in restored.layout_history][-2:] == [
+        "terminal",
+        "ai_chat",
+    ]
+    assert restored._applied_seq == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Unit tests for precompiled per-topology layout plans"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core import display_topology
+from src.nexus.core.yabai import YabaiClient
+from src.nexus.core.display_topology import DisplayTopologyService
+from src.nexus.core.layout_plans import LayoutPlanStore, app_pattern, count_fingerprint
+from src.nexus.core.workspace_model import SignalEvent, WorkspaceModel
+from src.nexus.core.dynamic_layout_manager import DynamicLayoutManager
+
+
+def display(index, x):
+    return {
+        "id": index,
+        "uuid": f"uuid-{index}",
+        "index": index,
+        "spaces": [index * 10],
+        "frame": {"x": x, "y": 0, "w": 1920, "h": 1080},
+    }
+
+
+@pytest.fixture
+def client(yabai_server):
+    yabai_server.state["displays"] = [display(1, 0), display(2, 1920)]
+    yabai_server.state["windows"] = [
+        {"id": 1, "pid": 1, "app": "Slack", "display": 1, "space": 10, "frame": {}},
+        {"id": 2, "pid": 2, "app": "Safari", "display": 2, "space": 20, "frame": {}},
+    ]
+    return YabaiClient(socket_path=yabai_server.socket_path, cli_fallback=False)
+
+
+@pytest.fixture
+def manager(client, tmp_path, monkeypatch):
+    service = DisplayTopologyService(
+        client, count_file=tmp_path / "current_display_count.txt"
+    )
+    monkeypatch.setattr(display_topology, "_shared_service", service)
+    model = WorkspaceModel(client)
+    model.load()
+    manager = DynamicLayoutManager(workspace_model=model)
+    manager.yabai = client
+    manager.plans = LayoutPlanStore(
+        tmp_path / "layout_plans.json", manager.plan_compiler.inputs()
+    )
+    return manager
+
+
+def test_compiles_every_profile_for_every_topology(manager):
+    assert manager.compile_layout_plans() == 4 * 3
+    plans = manager.plans.plans
+    assert set(plans) >= {count_fingerprint(n) for n in (1, 2, 3)}
+
+    current = manager.plans.get(manager.topology.current(), "work")
+    assert current.display_count == 2
+    assert current.displays["left"]["current_tool"] == "code_editor"
+    assert ["space", "10", "--layout", "bsp"] in current.commands
+    assert [
+        "rule",
+        "--add",
+        "label=nexus_Terminal",
+        "app=^Terminal$",
+        "display=2",
+    ] in current.commands
+    # Count-only plans take their spaces from the topology they are applied to
+    single = plans[count_fingerprint(1)]["work"]
+    assert list(single.displays) == ["main"]
+    assert not any(c[0] == "space" for c in single.commands)
+    assert ["space", "10", "--layout", "bsp"] in single.commands_for(
+        manager.topology.current()
+    )
+
+
+def test_store_round_trip_and_config_hash(manager, tmp_path):
+    manager.compile_layout_plans()
+    inputs = manager.plan_compiler.inputs()
+    reloaded = LayoutPlanStore(manager.plans.path, inputs)
+    assert reloaded.plans == manager.plans.plans
+
+    # Tool definitions are part of the hash, not just the yabai config
+    inputs["tools"][2]["terminal"]["apps"].append("Ghostty")
+    assert LayoutPlanStore(manager.plans.path, inputs).plans == {}
+    with patch("src.nexus.core.layout_plans.PLAN_FORMAT", 0):
+        assert (
+            LayoutPlanStore(manager.plans.path, manager.plan_compiler.inputs()).plans
+            == {}
+        )
+    assert app_pattern("Perplexity (Beta)") == r"^Perplexity \(Beta\)$"
+
+
+def test_hotplug_applies_stored_plan_without_recompiling(manager, client, yabai_server):
+    manager.current_profile = "personal"
+    manager.compile_layout_plans()
+    yabai_server.messages.clear()
+
+    yabai_server.state["displays"].append(display(3, 3840))
+    with patch.object(
+        manager.plan_compiler, "compile", side_effect=AssertionError("recompiled")
+    ):
+        manager.workspace_model.apply(SignalEvent("display_added", display=3))
+
+    assert manager.display_count == 3
+    assert list(manager.displays) == ["left", "center", "right"]
+    assert manager.displays["left"].current_tool == "entertainment"
+    # Slack belongs to the communication tool, which prefers the right display
+    assert manager.displays["right"].current_tool == "communication"
+    assert ["window", "1", "--display", "3"] in yabai_server.messages
+    # The stored plan was compiled for three displays, spaces come from yabai
+    assert ["space", "10", "--layout", "float"] in yabai_server.messages
+    assert any(m[:2] == ["rule", "--add"] for m in yabai_server.messages)
+
+
+def test_switching_plans_removes_the_previous_rules(manager, yabai_server):
+    manager.compile_layout_plans()
+    yabai_server.state["rules"] = [
+        {"index": 0, "label": "nexus_Slack"},
+        {"index": 1, "label": "user_rule"},
+    ]
+    yabai_server.messages.clear()
+
+    manager.apply_layout_plan(profile="personal")
+    removed = [m[2] for m in yabai_server.messages if m[:2] == ["rule", "--remove"]]
+    assert removed == ["nexus_Slack"]
+    first_add = next(
+        i for i, m in enumerate(yabai_server.messages) if m[:2] == ["rule", "--add"]
+    )
+    assert yabai_server.messages.index(["rule", "--remove", "nexus_Slack"]) < first_add
+
+    # Without a rule listing, the labels this manager applied are removed
+    del yabai_server.state["rules"]
+    yabai_server.failures["rule --list"] = "unknown command"
+    added = {
+        m[2][len("label=") :]
+        for m in yabai_server.messages
+        if m[:2] == ["rule", "--add"]
+    }
+    assert added
+    yabai_server.messages.clear()
+    manager.apply_layout_plan(profile="work")
+    assert {
+        m[2] for m in yabai_server.messages if m[:2] == ["rule", "--remove"]
+    } == added
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Unit tests for diff-based layout reconciliation"""
+
+import copy
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.yabai import YabaiClient
+from src.nexus.core.layout_reconciler import (
+    LayoutReconciler,
+    LayoutSnapshot,
+    load_layout,
+    save_layout,
+    PHASE_SPACE_LAYOUT,
+    PHASE_MOVE,
+    PHASE_FLOAT,
+    PHASE_FRAME,
+)
+
+
+@pytest.fixture
+def server(yabai_server):
+    yabai_server.state["displays"] = [{"id": 1, "index": 1}, {"id": 2, "index": 2}]
+    yabai_server.state["spaces"] = [
+        {"index": 1, "type": "bsp", "display": 1},
+        {"index": 2, "type": "stack", "display": 2},
+    ]
+    yabai_server.state["windows"] = [
+        {
+            "id": 1,
+            "pid": 1,
+            "app": "Code",
+            "title": "main.py",
+            "display": 1,
+            "space": 1,
+            "frame": {"x": 0, "y": 0, "w": 900, "h": 800},
+            "is-floating": False,
+        },
+        {
+            "id": 2,
+            "pid": 2,
+            "app": "Notes",
+            "title": "todo",
+            "display": 2,
+            "space": 2,
+            "frame": {"x": 100, "y": 100, "w": 400, "h": 300},
+            "is-floating": True,
+        },
+    ]
+    return yabai_server
+
+
+@pytest.fixture
+def reconciler(server):
+    return LayoutReconciler(
+        YabaiClient(socket_path=server.socket_path, cli_fallback=False)
+    )
+
+
+def test_identical_layout_needs_no_commands(reconciler):
+    snapshot = reconciler.capture("same")
+    assert reconciler.plan(snapshot) == []
+
+
+def test_plan_is_minimal_and_ordered(reconciler):
+    current = reconciler.capture("current")
+    target = copy.deepcopy(current)
+    target.spaces[2] = "bsp"
+    target.windows[0].space = 2
+    target.windows[0].floating = True
+    target.windows[0].frame = {"x": 10, "y": 10, "w": 900, "h": 800}
+    target.windows[1].frame["x"] = 101  # within tolerance
+
+    commands = reconciler.plan(target, current)
+    assert [c.phase for c in commands] == [
+        PHASE_SPACE_LAYOUT,
+        PHASE_MOVE,
+        PHASE_FLOAT,
+        PHASE_FRAME,
+    ]
+    assert commands[0].args == ["space", "2", "--layout", "bsp"]
+    assert commands[1].args == ["window", "1", "--space", "2"]
+    assert commands[3].args == ["window", "1", "--move", "abs:10:10"]
+
+
+def test_restored_windows_matched_by_app_when_ids_change(reconciler, server):
+    target = reconciler.capture("saved")
+    target.windows[1].display = 1
+    target.windows[1].space = 1
+    for window in target.windows:
+        window.id += 100
+
+    results = reconciler.restore(target)
+    assert [r.command for r in results] == [["window", "2", "--space", "1"]]
+    assert all(r.success for r in results)
+
+
+def test_save_and_load_round_trip(reconciler, tmp_path):
+    snapshot = reconciler.capture("work", profile="work")
+    save_layout(snapshot, tmp_path / "work.json")
+    loaded = load_layout(tmp_path / "work.json")
+    assert loaded == snapshot
+    assert LayoutSnapshot.from_dict({"name": "teste", "windows": []}).spaces == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Unit tests for the queued, rotating NEXUS logging setup"""
+
+import json
+import logging
+import logging.handlers
+import subprocess
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.utils import logger as nexus_logger
+
+
+@pytest.fixture
+def isolated_logging(tmp_path):
+    """Run setup_logging against a temp config and restore the root logger afterwards"""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    nexus_logger.shutdown_logging()
+    for handler in handlers:
+        root.removeHandler(handler)
+    config = tmp_path / "nexus.yaml"
+    config.write_text("logging:\n  level: DEBUG\n  max_size: 1KB\n  backup_count: 2\n")
+    yield tmp_path, config
+    nexus_logger.shutdown_logging()
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def _queue_handlers():
+    return [
+        h
+        for h in logging.getLogger().handlers
+        if isinstance(h, logging.handlers.QueueHandler)
+    ]
+
+
+def test_parse_size():
+    assert nexus_logger.parse_size("10MB") == 10 * 1024 * 1024
+    assert nexus_logger.parse_size("512 kb") == 512 * 1024
+    assert nexus_logger.parse_size(2048) == 2048
+    assert nexus_logger.parse_size("lots") == nexus_logger.DEFAULT_MAX_SIZE
+
+
+def test_setup_is_idempotent_and_reads_config(isolated_logging):
+    tmp_path, config = isolated_logging
+    log_file = tmp_path / "logs" / "nexus.log"
+    for _ in range(3):
+        nexus_logger.setup_logging(log_file=str(log_file), config_path=config)
+
+    assert len(_queue_handlers()) == 1
+    assert logging.getLogger().level == logging.DEBUG
+
+    logging.getLogger("nexus.test").debug("queued record")
+    nexus_logger.shutdown_logging()
+    assert "queued record" in log_file.read_text()
+
+
+def test_file_rotates_at_configured_size(isolated_logging):
+    tmp_path, config = isolated_logging
+    log_file = tmp_path / "nexus.log"
+    nexus_logger.setup_logging(log_file=str(log_file), config_path=config)
+
+    for i in range(100):
+        logging.getLogger("nexus.test").info("line %d %s", i, "x" * 40)
+    nexus_logger.shutdown_logging()
+
+    assert (tmp_path / "nexus.log.1").exists()
+    assert (tmp_path / "nexus.log.2").exists()
+    assert not (tmp_path / "nexus.log.3").exists()
+    assert log_file.stat().st_size <= 1024
+
+
+def test_log_to_file_reuses_one_handler(isolated_logging):
+    tmp_path, _ = isolated_logging
+    target = tmp_path / "custom.log"
+    for i in range(5):
+        nexus_logger.log_to_file(f"message {i}", "WARNING", str(target))
+
+    assert len(nexus_logger._file_loggers) == 1
+    assert len(nexus_logger._listeners) == 1
+    nexus_logger.shutdown_logging()
+    assert target.read_text().count("message") == 5
+
+
+def test_log_operation_times_and_reports_outcome(caplog):
+    with caplog.at_level("INFO", logger=nexus_logger.OPERATIONS_LOGGER):
+        with nexus_logger.log_operation(
+            "swap_tool", display="left", tool="coding"
+        ) as op:
+            op["outcome"] = "failure"
+        with pytest.raises(ValueError):
+            with nexus_logger.log_operation("model_scan"):
+                raise ValueError("boom")
+
+    first, second = [record.fields for record in caplog.records]
+    assert first["outcome"] == "failure" and first["duration_ms"] >= 0
+    assert second["outcome"] == "error" and second["error"] == "boom"
+
+
+def test_structured_file_is_json_lines(isolated_logging):
+    tmp_path, config = isolated_logging
+    log_file = tmp_path / "nexus.log"
+    nexus_logger.setup_logging(
+        log_file=str(log_file), config_path=config, structured=True
+    )
+
+    with nexus_logger.log_operation("switch_profile", profile="work"):
+        pass
+    logging.getLogger("nexus.test").info("plain message")
+    nexus_logger.shutdown_logging()
+
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    operation = next(r for r in records if r.get("operation") == "switch_profile")
+    assert set(nexus_logger.OPERATION_FIELDS) <= set(operation)
+    assert operation["profile"] == "work" and operation["outcome"] == "ok"
+    assert any(r.get("message") == "plain message" for r in records)
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["nexus.core.ai_model_manager", "nexus_enhanced_bridge", "discover_models"],
+)
+def test_importing_leaves_logging_to_setup_logging(module):
+    # Import-time basicConfig would add a console handler ahead of setup_logging's
+    code = f"import logging, {module}; print(len(logging.getLogger().handlers))"
+    paths = [str(project_root / "src"), str(project_root / "tools" / "ai")]
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": ":".join(paths)},
+        check=True,
+    )
+    assert result.stdout.strip() == "0"
+
+
+def test_console_stream_can_be_redirected(isolated_logging, capsys):
+    tmp_path, config = isolated_logging
+    nexus_logger.setup_logging(
+        log_file=str(tmp_path / "nexus.log"), config_path=config, stream=sys.stderr
+    )
+    logging.getLogger("nexus.test").warning("to stderr")
+    nexus_logger.shutdown_logging()
+    captured = capsys.readouterr()
+    assert "to stderr" in captured.err and "to stderr" not in captured.out
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
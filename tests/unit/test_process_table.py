@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Unit tests for the process-table snapshot"""
+
+import os
+import subprocess
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+import psutil
+
+from src.nexus.core.process_table import ProcessInfo, ProcessTable, bundle_name
+
+
+def test_bundle_name_from_executable_path():
+    assert (
+        bundle_name("/Applications/Visual Studio Code.app/Contents/MacOS/Electron")
+        == "Visual Studio Code"
+    )
+    assert bundle_name("/usr/bin/python3") is None
+    info = ProcessInfo(
+        1, "Electron", "/Applications/Slack.app/Contents/MacOS/Slack", "Slack"
+    )
+    assert info.keys == {"electron", "slack"}
+
+
+def test_answers_many_apps_in_one_pass():
+    table = ProcessTable()
+    me = psutil.Process().name()
+    with patch("subprocess.run") as run:
+        running = table.running([me, "surely-not-running-app", me.upper()])
+    run.assert_not_called()
+    assert running == {me: True, "surely-not-running-app": False, me.upper(): True}
+    assert os.getpid() in table.pids(me)
+
+
+def test_refresh_inspects_only_new_pids():
+    table = ProcessTable(ttl=0).refresh()
+    inspected = table.inspected
+
+    child = subprocess.Popen(["sleep", "30"])
+    try:
+        assert table.is_running("sleep")
+        # Only the new process (plus any other newcomers) was inspected
+        assert table.inspected - inspected < 10
+    finally:
+        child.kill()
+        child.wait()
+    assert child.pid not in table.refresh(force=True).pids("sleep")
+
+
+def test_reused_pid_is_a_new_process():
+    table = ProcessTable(ttl=60)
+    me = psutil.Process()
+    real_process = psutil.Process
+
+    class Reborn:
+        """This process's pid, handed by the OS to a different program"""
+
+        def __init__(self, pid):
+            self.pid = pid
+            self._process = real_process(pid)
+
+        def create_time(self):
+            return self._process.create_time() + (
+                1000 if self._process.pid == me.pid else 0
+            )
+
+        def name(self):
+            return "newcomer" if self._process.pid == me.pid else self._process.name()
+
+        def exe(self):
+            return "" if self._process.pid == me.pid else self._process.exe()
+
+    assert table.is_running(me.name())
+    with patch("psutil.Process", Reborn):
+        table.refresh(force=True)
+    assert table.pids("newcomer") == [me.pid]
+    assert me.pid not in table.pids(me.name())
+    assert table.processes()[me.pid].name == "newcomer"
+
+
+def test_ttl_reuses_snapshot():
+    table = ProcessTable(ttl=60).refresh()
+    with patch("psutil.pids") as pids:
+        table.running(["anything"])
+    pids.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Unit tests for concurrent per-display profile swaps"""
+
+import time
+import threading
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.dynamic_layout_manager import DynamicLayoutManager, Display, Tool
+
+
+@pytest.fixture
+def manager():
+    manager = DynamicLayoutManager()
+    manager.displays = {
+        name: Display(id=i, name=name.title(), purpose="test", apps=[])
+        for i, name in enumerate(["left", "center", "right"], 1)
+    }
+    manager.tools = {
+        key: Tool(
+            name=key.title(),
+            category="development",
+            apps=apps,
+            description="",
+            workspace_profile="work",
+            display_preference=[1, 2, 3],
+        )
+        for key, apps in [
+            ("editor", ["Code"]),
+            ("shell", ["Terminal"]),
+            ("browser", ["Safari"]),
+        ]
+    }
+    return manager
+
+
+def slow_swap(log, delay=0.2):
+    def execute(display, tool, **kwargs):
+        log.append(("start", display.id, threading.get_ident()))
+        time.sleep(delay)
+        log.append(("end", display.id))
+        return True
+
+    return execute
+
+
+def test_independent_displays_swap_concurrently(manager):
+    log = []
+    with patch.object(
+        manager, "_execute_tool_swap", side_effect=slow_swap(log)
+    ), patch.object(manager, "_save_layout_state"):
+        start = time.perf_counter()
+        timings = manager.swap_by_profile("work")
+        elapsed = time.perf_counter() - start
+
+    assert list(timings) == ["left", "center", "right"]
+    assert [t["tool"] for t in timings.values()] == ["editor", "shell", "browser"]
+    assert all(t["success"] and t["seconds"] >= 0.2 for t in timings.values())
+    # About as long as the slowest display, not the sum of all three
+    assert elapsed < 0.45
+    assert manager.displays["center"].current_tool == "shell"
+    assert len(manager.layout_history) == 3
+
+
+def test_displays_sharing_apps_keep_their_order(manager):
+    manager.tools["shell"].apps.append("Code")
+    log = []
+    with patch.object(
+        manager, "_execute_tool_swap", side_effect=slow_swap(log, 0.05)
+    ), patch.object(manager, "_save_layout_state"):
+        manager.swap_by_profile("work")
+
+    order = [entry[:2] for entry in log if entry[1] in (1, 2)]
+    assert order == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+
+def test_current_tool_apps_count_as_shared(manager):
+    manager.displays["right"].current_tool = "editor"
+    groups = manager._group_by_shared_apps(manager._plan_profile_swap("work"))
+    assert groups == [[("left", "editor"), ("right", "browser")], [("center", "shell")]]
+
+
+def test_serial_mode(manager):
+    with patch.object(manager, "_execute_tool_swap", return_value=True), patch.object(
+        manager, "_save_layout_state"
+    ):
+        timings = manager.swap_by_profile("work", concurrent=False)
+    assert all(t["success"] for t in timings.values())
+
+
+def test_swap_tool_emits_operation_record(manager, caplog):
+    with patch.object(manager, "_execute_tool_swap", return_value=False), patch.object(
+        manager, "_save_layout_state"
+    ), caplog.at_level("INFO", logger="nexus.ops"):
+        manager.swap_tool("left", "editor")
+        manager.swap_tool("nowhere", "editor")
+
+    fields = [record.fields for record in caplog.records if record.name == "nexus.ops"]
+    assert [(f["operation"], f["display"], f["outcome"]) for f in fields] == [
+        ("swap_tool", "left", "failure"),
+        ("swap_tool", "nowhere", "invalid_display"),
+    ]
+    assert fields[0]["tool"] == "editor" and fields[0]["duration_ms"] >= 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
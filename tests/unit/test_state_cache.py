@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Unit tests for the coalescing yabai state cache"""
+
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.state_cache import CachedYabaiClient
+
+
+@pytest.fixture
+def client(yabai_server):
+    yabai_server.state["displays"] = [{"id": 1, "index": 1, "frame": {}, "spaces": [1]}]
+    return CachedYabaiClient(
+        ttl=60, socket_path=yabai_server.socket_path, cli_fallback=False
+    )
+
+
+def test_repeated_queries_hit_cache(client, yabai_server):
+    for _ in range(5):
+        assert len(client.query_displays()) == 1
+    assert len(yabai_server.messages) == 1
+    assert client.stats["hits"] == 4
+    assert client.stats["misses"] == 1
+
+
+def test_mutating_command_invalidates(client, yabai_server):
+    client.query_displays()
+    client.send("space --layout bsp")
+    client.query_displays()
+    assert yabai_server.messages.count(["query", "--displays"]) == 2
+    assert client.stats["invalidations"] == 1
+
+
+def test_ttl_expiry(yabai_server):
+    client = CachedYabaiClient(
+        ttl=0, socket_path=yabai_server.socket_path, cli_fallback=False
+    )
+    client.query_displays()
+    client.query_displays()
+    assert client.stats["misses"] == 2
+
+
+def test_concurrent_queries_coalesce(client, yabai_server):
+    gate = threading.Event()
+    original = yabai_server._handle
+
+    def slow_handle(args):
+        gate.wait(2)
+        return original(args)
+
+    yabai_server._handle = slow_handle
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.query("displays")))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + 2
+    while client.stats["coalesced"] < 7 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    gate.set()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 8
+    assert client.stats["misses"] == 1
+    assert client.stats["saved"] == 7
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Unit tests for the tool suggestion index"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.suggestion_index import SuggestionIndex
+from src.nexus.core.dynamic_layout_manager import DynamicLayoutManager, Display, Tool
+
+
+def tool(key, preference, profile="work"):
+    return Tool(key, "development", [], "", profile, preference)
+
+
+def test_ordered_by_preference_rank():
+    index = SuggestionIndex()
+    tools = [
+        tool("a", [3, 1]),
+        tool("b", [1, 3]),
+        tool("c", [2, 1]),
+        tool("d", [1], "personal"),
+    ]
+    index.build(tools, [1, 2, 3])
+    assert [t.name for t in index.get("work", 1)] == ["b", "a", "c"]
+    assert [t.name for t in index.get("work", 3)] == ["a", "b"]
+    assert [t.name for t in index.get("personal", 1)] == ["d"]
+    assert index.get("work", 9) == []
+
+
+def test_manager_builds_index_once():
+    manager = DynamicLayoutManager()
+    manager.displays = {
+        "left": Display(1, "Left", "", []),
+        "right": Display(2, "Right", "", []),
+    }
+    manager.tools = {
+        "a": tool("A", [2, 1]),
+        "b": tool("B", [1, 2]),
+        "c": tool("C", [2]),
+    }
+
+    for _ in range(5):
+        menu = manager.create_quick_swap_menu()
+    assert manager.suggestions.builds == 1
+    assert [t.name for t in manager.get_layout_suggestions("left")] == ["B", "A"]
+    assert [t.name for t in manager.get_layout_suggestions("right")] == ["A", "C", "B"]
+    assert menu.index("- B") < menu.index("- A")
+
+    # Profile changes are served from the same index
+    manager.current_profile = "personal"
+    assert manager.get_layout_suggestions("left") == []
+    assert manager.suggestions.builds == 1
+
+    # New tools rebuild it
+    manager.tools = {"d": tool("D", [1], "personal")}
+    assert [t.name for t in manager.get_layout_suggestions("left")] == ["D"]
+    assert manager.suggestions.builds == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Unit tests for the tool-to-display assignment solver"""
+
+import itertools
+import random
+import pytest
+from collections import Counter
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.tool_assignment import assign_tools, hungarian
+from src.nexus.core.dynamic_layout_manager import DynamicLayoutManager, Display, Tool
+
+DISPLAYS = [("left", 1), ("center", 2), ("right", 3)]
+
+
+def test_hungarian_is_optimal():
+    rng = random.Random(7)
+    for _ in range(200):
+        n = rng.randint(1, 4)
+        m = rng.randint(n, 6)
+        cost = [[rng.randint(0, 9) for _ in range(m)] for _ in range(n)]
+        chosen = hungarian(cost)
+        best = min(
+            sum(cost[i][p[i]] for i in range(n))
+            for p in itertools.permutations(range(m), n)
+        )
+        assert len(set(chosen)) == n
+        assert sum(cost[i][chosen[i]] for i in range(n)) == best
+
+
+def test_preferences_are_honoured():
+    tools = [
+        ("chat", [3, 1], ["Slack"]),
+        ("code", [2, 1], ["Code"]),
+        ("web", [1, 2], ["Safari"]),
+    ]
+    assert assign_tools(tools, DISPLAYS) == [
+        ("left", "web"),
+        ("center", "code"),
+        ("right", "chat"),
+    ]
+
+
+def test_open_windows_avoid_moves():
+    tools = [("code", [1, 2], ["Code"]), ("web", [1, 2], ["Safari"])]
+    windows = Counter({("Safari", 1): 3, ("Code", 2): 1})
+    assert assign_tools(tools, DISPLAYS[:2], windows) == [
+        ("left", "web"),
+        ("center", "code"),
+    ]
+    # Without windows, ties keep the given order
+    assert assign_tools(tools, DISPLAYS[:2]) == [("left", "code"), ("center", "web")]
+
+
+def test_more_tools_than_displays_stack_evenly():
+    tools = [(f"t{i}", [1, 2], []) for i in range(5)]
+    placed = assign_tools(tools, DISPLAYS[:2])
+    assert len(placed) == 5
+    assert Counter(name for name, _ in placed) == {"left": 3, "center": 2}
+
+
+def test_swap_by_profile_stacks_extra_tools():
+    manager = DynamicLayoutManager()
+    manager.displays = {
+        "left": Display(1, "Left", "", []),
+        "right": Display(2, "Right", "", []),
+    }
+    manager.tools = {
+        key: Tool(key, "development", [key.title()], "", "work", preference)
+        for key, preference in [
+            ("editor", [2, 1]),
+            ("shell", [2, 1]),
+            ("browser", [1, 2]),
+        ]
+    }
+    with patch.object(manager, "_find_windows", return_value=[]), patch.object(
+        manager, "_execute_tool_swap", return_value=True
+    ) as execute, patch.object(manager, "_save_layout_state"):
+        timings = manager.swap_by_profile("work")
+
+    assert timings["left"]["tool"] == "browser"
+    assert (
+        timings["right"]["tool"] in ("editor", "shell")
+        and len(timings["right"]["stacked"]) == 1
+    )
+    assert manager.displays["right"].stacked_tools == timings["right"]["stacked"]
+    closes = [call.kwargs["close_current"] for call in execute.call_args_list]
+    assert closes.count(False) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
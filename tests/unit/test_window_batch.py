@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Unit tests for in-process batched window commands"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.yabai import YabaiClient
+from src.nexus.core.window_batch import WindowCommandBatch, select_windows
+from src.nexus.core.dynamic_layout_manager import DynamicLayoutManager
+
+
+@pytest.fixture
+def client(yabai_server):
+    yabai_server.state["windows"] = [
+        {
+            "id": i,
+            "pid": i,
+            "app": "Slack" if i % 2 else "Safari",
+            "display": 2 if i <= 20 else 1,
+            "space": 1,
+            "frame": {},
+        }
+        for i in range(1, 26)
+    ]
+    return YabaiClient(socket_path=yabai_server.socket_path, cli_fallback=False)
+
+
+def test_batch_reports_per_command_success(client, yabai_server):
+    yabai_server.failures["window 2 --close"] = "could not locate window"
+    windows = select_windows(client.query_windows(), display=2, apps=["Safari"])
+    results = WindowCommandBatch(client).close(windows).execute()
+    assert len(results) == 10
+    assert [r.success for r in results].count(False) == 1
+    assert results[0].command == ["window", "2", "--close"]
+    assert "could not locate" in results[0].error
+
+
+def test_move_skips_windows_already_on_display(client):
+    windows = client.query_windows()
+    batch = WindowCommandBatch(client).move_to_display(windows, 1)
+    assert len(batch) == 20
+
+
+def test_close_display_apps_without_processes(client, yabai_server):
+    manager = DynamicLayoutManager()
+    manager.yabai = client
+    display = next(d for d in manager.displays.values() if d.id == 2)
+    yabai_server.messages.clear()
+
+    with patch("subprocess.run") as run:
+        results = manager._close_display_apps(display)
+
+    run.assert_not_called()
+    assert len(results) == 20 and all(r.success for r in results)
+    assert yabai_server.messages[0] == ["query", "--windows", "--display", "2"]
+    assert len(yabai_server.messages) == 21
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Unit tests for the multi-key window index"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.yabai import YabaiWindow
+from src.nexus.core.window_index import WindowIndex
+
+
+def make_window(id, app, display, space=1, pid=None, focus=False, visible=True):
+    return YabaiWindow(
+        id=id,
+        pid=pid or id * 10,
+        app=app,
+        title=app,
+        display=display,
+        space=space,
+        frame={},
+        has_focus=focus,
+        is_visible=visible,
+    )
+
+
+@pytest.fixture
+def index():
+    return WindowIndex(
+        [
+            make_window(1, "Slack", 2, pid=100),
+            make_window(2, "Slack", 1, pid=100),
+            make_window(3, "Safari", 2, space=3, focus=True),
+            make_window(4, "Terminal", 1, visible=False),
+        ]
+    )
+
+
+def test_lookup_by_keys(index):
+    assert [w.id for w in index.windows(app="Slack", display=2)] == [1]
+    assert sorted(index.ids(pid=100)) == [1, 2]
+    assert sorted(index.ids(display=2, space=3)) == [3]
+    assert index.count(app="Slack") == 2
+    assert index.count(display=1) == 2
+    assert index.windows(app="Zoom") == []
+
+
+def test_move_updates_every_index(index):
+    index.add(make_window(1, "Slack", 1, pid=100))
+    assert index.count(app="Slack", display=2) == 0
+    assert index.count(app="Slack", display=1) == 2
+    assert index.count(display=2) == 1
+
+
+def test_remove_and_visibility(index):
+    assert not index.is_app_visible("Terminal")
+    index.remove(3)
+    assert not index.is_app_visible("Safari")
+    assert 3 not in index
+    assert index.focused is None
+
+
+def test_mru_focus_order(index):
+    assert index.focused.id == 3
+    index.focus(1)
+    index.focus(2)
+    assert [w.id for w in index.mru(limit=3)] == [2, 1, 3]
+    assert index.get(3).has_focus is False
+    index.remove(2)
+    assert [w.id for w in index.mru(limit=1)] == [1]
+
+
+def test_lookup_cost_independent_of_window_count():
+    big = WindowIndex(make_window(i, f"App{i % 50}", i % 3 + 1) for i in range(1, 1001))
+    big.add(make_window(5000, "Slack", 2))
+    assert [w.id for w in big.windows(app="Slack", display=2)] == [5000]
+    assert big.count(app="App7", display=big.get(7).display) >= 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
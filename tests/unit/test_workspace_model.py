@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Unit tests for the signal-fed workspace model"""
+
+import os
+import time
+import subprocess
+import tempfile
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core.yabai import YabaiClient
+from src.nexus.core import workspace_model
+from src.nexus.core.workspace_model import WorkspaceModel, SignalEvent
+
+
+def window(id, app, display, pid, visible=True, focus=False):
+    return {
+        "id": id,
+        "pid": pid,
+        "app": app,
+        "title": app,
+        "display": display,
+        "space": display,
+        "frame": {},
+        "is-visible": visible,
+        "has-focus": focus,
+    }
+
+
+@pytest.fixture
+def server(yabai_server):
+    yabai_server.state["displays"] = [{"id": 1, "index": 1}, {"id": 2, "index": 2}]
+    yabai_server.state["spaces"] = [
+        {"id": 10, "index": 1, "display": 1, "has-focus": True},
+        {"id": 20, "index": 2, "display": 2},
+    ]
+    yabai_server.state["windows"] = [
+        window(1, "Slack", 2, 100),
+        window(2, "Safari", 1, 200),
+    ]
+    return yabai_server
+
+
+@pytest.fixture
+def model(server, tmp_path):
+    client = YabaiClient(socket_path=server.socket_path, cli_fallback=False)
+    model = WorkspaceModel(client, log_path=str(tmp_path / "signals.jsonl"))
+    model.load()
+    return model
+
+
+def test_load_builds_counts(model):
+    assert model.display_count == 2
+    assert model.window_count(2) == 1
+    assert model.is_app_visible("Safari")
+    assert model.focused_space == 1
+
+
+def test_incremental_window_events(model, server):
+    server.state["windows"].append(window(3, "Terminal", 2, 300, focus=True))
+    model.apply(SignalEvent.parse("window_created window=3"))
+    assert model.window_count(2) == 2
+    assert model.focused_window == 3
+
+    server.state["windows"][0]["display"] = 1
+    model.apply(SignalEvent("window_moved", window=1))
+    assert model.window_count(1) == 2 and model.window_count(2) == 1
+
+    model.apply(SignalEvent("application_terminated", pid=300))
+    assert 3 not in model.windows
+    model.apply(SignalEvent("window_destroyed", window=2))
+    assert not model.is_app_visible("Safari")
+    # One targeted query per window refresh, nothing else
+    assert server.messages[-1] == ["query", "--windows", "--window", "1"]
+
+
+def test_replay_log_without_yabai(model, server, tmp_path):
+    server.state["windows"].append(window(4, "Notes", 1, 400))
+    model.apply(SignalEvent("window_created", window=4))
+    server.state["displays"].append({"id": 3, "index": 3})
+    model.apply(SignalEvent("display_added", display=3))
+
+    replayed = WorkspaceModel()
+    replayed.replay(WorkspaceModel.read_log(str(tmp_path / "signals.jsonl")))
+    assert sorted(replayed.windows) == [1, 2, 4]
+    assert replayed.display_count == 3
+    assert replayed.window_count(1) == model.window_count(1)
+
+
+def test_fifo_listener_applies_signals(model, server):
+    fifo = os.path.join(tempfile.mkdtemp(), "signals.fifo")
+    seen = []
+    model.subscribe(seen.append)
+    model.start(fifo)
+    try:
+        server.state["windows"].append(window(5, "Music", 1, 500))
+        with open(fifo, "w") as f:
+            f.write("window_created window=5\n")
+        deadline = time.monotonic() + 2
+        while not seen and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        model.stop(fifo)
+    assert 5 in model.windows
+
+
+def test_space_and_display_events_refresh_windows(model, server):
+    # Space 2 is switched away from: its windows are no longer visible
+    server.state["windows"][0]["is-visible"] = False
+    model.apply(SignalEvent("space_changed", space=1))
+    assert not model.is_app_visible("Slack")
+
+    # Display 2 is unplugged and yabai moves its windows to display 1
+    server.state["displays"].pop()
+    server.state["windows"][0].update({"display": 1, "is-visible": True})
+    model.apply(SignalEvent("display_removed", display=2))
+    assert model.display_count == 1
+    assert model.window_count(2) == 0 and model.window_count(1) == 2
+    assert model.is_app_visible("Slack")
+
+
+def test_register_signals(model, server):
+    model.register_signals("/tmp/nexus.fifo")
+    added = {m[2]: m for m in server.messages if m[:2] == ["signal", "--add"]}
+    message = added["event=window_created"]
+    assert message[3] == "label=nexus_window_created"
+    assert message[4].startswith("action=perl -MFcntl")
+    assert message[4].endswith(
+        ' /tmp/nexus.fifo "window_created window=$YABAI_WINDOW_ID"'
+    )
+
+
+def test_signal_action_does_not_block_without_a_listener(model, server, tmp_path):
+    fifo = str(tmp_path / "signals.fifo")
+    os.mkfifo(fifo)
+    model.register_signals(fifo)
+    action = next(
+        m[4]
+        for m in server.messages
+        if m[:3] == ["signal", "--add", "event=window_created"]
+    )[len("action=") :]
+
+    # Nobody reading: the action gives up immediately instead of hanging
+    subprocess.run(
+        ["sh", "-c", action],
+        env={"YABAI_WINDOW_ID": "7", "PATH": os.environ["PATH"]},
+        timeout=5,
+        check=False,
+    )
+
+    # With the listener attached the event arrives
+    seen = []
+    model.subscribe(seen.append)
+    model.start(fifo)
+    try:
+        server.state["windows"].append(window(7, "Notes", 1, 700))
+        deadline = time.monotonic() + 2
+        # Resend until the listener thread has the FIFO open
+        while not seen and time.monotonic() < deadline:
+            subprocess.run(
+                ["sh", "-c", action],
+                env={"YABAI_WINDOW_ID": "7", "PATH": os.environ["PATH"]},
+                timeout=5,
+                check=True,
+            )
+            time.sleep(0.05)
+    finally:
+        model.stop(fifo)
+    assert 7 in model.windows
+
+
+def test_shared_model_retries_until_yabai_answers(server, monkeypatch, tmp_path):
+    monkeypatch.setattr(workspace_model, "_shared_model", None)
+    monkeypatch.setattr(workspace_model, "_last_attempt", None)
+    monkeypatch.setattr(workspace_model, "LOAD_RETRY_INTERVAL", 0)
+    monkeypatch.setattr(
+        workspace_model, "default_fifo_path", lambda: str(tmp_path / "signals.fifo")
+    )
+    client = YabaiClient(
+        socket_path=server.socket_path + ".missing", cli_fallback=False
+    )
+
+    model = workspace_model.shared_model(client)
+    assert not model.listening and model.display_count == 0
+
+    client.socket_path = server.socket_path
+    try:
+        assert workspace_model.shared_model() is model
+        assert model.listening and model.display_count == 2
+    finally:
+        model.stop(str(tmp_path / "signals.fifo"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Unit tests for the yabai socket client"""
+
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.nexus.core import command_runner
+from src.nexus.core.yabai import (
+    YabaiClient,
+    YabaiError,
+    YabaiUnavailable,
+    YabaiWindow,
+)
+
+
+WINDOWS = [
+    {
+        "id": 101,
+        "pid": 501,
+        "app": "Slack",
+        "title": "general",
+        "display": 2,
+        "space": 3,
+        "frame": {"x": 0, "y": 0, "w": 800, "h": 600},
+        "has-focus": True,
+        "is-floating": False,
+    },
+    {
+        "id": 102,
+        "pid": 502,
+        "app": "Safari",
+        "title": "Docs",
+        "display": 1,
+        "space": 1,
+        "frame": {"x": 0, "y": 0, "w": 1200, "h": 900},
+        "has-focus": False,
+        "is-floating": True,
+    },
+]
+DISPLAYS = [
+    {
+        "id": 1,
+        "uuid": "A",
+        "index": 1,
+        "frame": {"x": 0, "y": 0, "w": 1920, "h": 1080},
+        "spaces": [1, 2],
+    },
+    {
+        "id": 2,
+        "uuid": "B",
+        "index": 2,
+        "frame": {"x": 1920, "y": 0, "w": 3440, "h": 1440},
+        "spaces": [3],
+    },
+]
+
+
+@pytest.fixture
+def client(yabai_server):
+    yabai_server.state["windows"] = WINDOWS
+    yabai_server.state["displays"] = DISPLAYS
+    return YabaiClient(socket_path=yabai_server.socket_path, cli_fallback=False)
+
+
+def test_encode_message_matches_yabai_wire_format():
+    message = YabaiClient.encode_message(["query", "--windows"])
+    assert message[:4] == (len(b"query\0--windows\0\0")).to_bytes(4, "little")
+    assert message[4:] == b"query\0--windows\0\0"
+
+
+def test_typed_queries(client):
+    windows = client.query_windows()
+    assert [w.id for w in windows] == [101, 102]
+    assert isinstance(windows[0], YabaiWindow)
+    assert windows[0].has_focus and windows[1].is_floating
+
+    displays = client.query_displays()
+    assert [d.index for d in displays] == [1, 2]
+    assert displays[1].frame["w"] == 3440
+
+
+def test_selectors_are_forwarded(client, yabai_server):
+    assert [w.app for w in client.query_windows(display=2)] == ["Slack"]
+    assert [w.id for w in client.query_windows(window=102)] == [102]
+    assert ["query", "--windows", "--display", "2"] in yabai_server.messages
+
+
+def test_send_command(client, yabai_server):
+    assert client.send("window 101 --close") == ""
+    assert yabai_server.messages[-1] == ["window", "101", "--close"]
+
+
+def test_failure_response_raises(client, yabai_server):
+    yabai_server.failures[
+        "window 999 --close"
+    ] = "could not locate window with the specified id '999'."
+    with pytest.raises(YabaiError, match="could not locate window"):
+        client.send(["window", "999", "--close"])
+
+
+def test_missing_socket_without_fallback(tmp_path):
+    client = YabaiClient(
+        socket_path=str(tmp_path / "missing.socket"), cli_fallback=False
+    )
+    with pytest.raises(YabaiError):
+        client.query_displays()
+    assert client.is_available() is False
+
+
+def test_cli_fallback_runs_through_the_shared_runner(tmp_path, monkeypatch):
+    calls = []
+
+    class RecordingRunner(command_runner.CommandRunner):
+        async def run(self, argv, **kwargs):
+            calls.append(list(argv))
+            return await super().run(argv, **kwargs)
+
+    monkeypatch.setattr(command_runner, "_shared_runner", RecordingRunner())
+    yabai = tmp_path / "yabai"
+    yabai.write_text(
+        "#!/bin/sh\n"
+        'if [ "$3" = "--spaces" ]; then echo "bad selector" >&2; exit 1; fi\n'
+        'if [ "$3" = "--windows" ]; then sleep 5; fi\n'
+        "echo '[]'\n"
+    )
+    yabai.chmod(0o755)
+    client = YabaiClient(
+        socket_path=str(tmp_path / "missing.socket"),
+        yabai_path=str(yabai),
+        timeout=0.5,
+    )
+
+    assert client.query_displays() == []
+    with pytest.raises(YabaiError, match="bad selector"):
+        client.query("spaces")
+    with pytest.raises(YabaiUnavailable, match="timed out"):
+        client.query("windows")
+    # Other clients' breaker probes may share the runner; count only ours
+    assert [argv[3] for argv in calls if argv[0] == str(yabai)] == [
+        "--displays",
+        "--spaces",
+        "--windows",
+    ]
+
+    client.yabai_path = str(tmp_path / "no-such-yabai")
+    with pytest.raises(YabaiUnavailable, match="not reachable"):
+        client.query_displays()
+
+
+def test_query_latency_is_sub_process(client):
+    """Socket queries should be far cheaper than forking yabai (tens of ms)"""
+    client.query_windows()
+    runs = 200
+    start = time.perf_counter()
+    for _ in range(runs):
+        client.query_windows()
+    per_query_ms = (time.perf_counter() - start) * 1000 / runs
+    print(f"⚡ yabai socket query: {per_query_ms:.3f}ms")
+    assert per_query_ms < 5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
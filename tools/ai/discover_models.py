@@ -10,6 +10,7 @@ License: MIT
 This script discovers and catalogs AI models in the LM Studio models directory.
 """
 
+import sys
 import json
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -17,11 +18,11 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Make the NEXUS package importable when run as a standalone script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src"))
+
+from nexus.utils.logger import log_operation, setup_logging
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,21 +61,25 @@ class ModelDiscovery:
         """Discover all models in the models directory."""
         logger.info(f"Starting model discovery in: {self.models_path}")
         
-        if not self.models_path.exists():
-            logger.error(f"Models directory does not exist: {self.models_path}")
-            return []
-        
-        for provider_dir in self.models_path.iterdir():
-            if provider_dir.is_dir():
-                provider_name = provider_dir.name
-                logger.info(f"Scanning provider: {provider_name}")
-                
-                for model_dir in provider_dir.iterdir():
-                    if model_dir.is_dir():
-                        model_info = self._analyze_model(model_dir, provider_name)
-                        if model_info:
-                            self.discovered_models.append(model_info)
-                            logger.info(f"Discovered: {model_info.name}")
+        with log_operation("model_scan", path=str(self.models_path)) as op:
+            if not self.models_path.exists():
+                logger.error(f"Models directory does not exist: {self.models_path}")
+                op["outcome"] = "missing_path"
+                return []
+            
+            for provider_dir in self.models_path.iterdir():
+                if provider_dir.is_dir():
+                    provider_name = provider_dir.name
+                    logger.info(f"Scanning provider: {provider_name}")
+                    
+                    for model_dir in provider_dir.iterdir():
+                        if model_dir.is_dir():
+                            model_info = self._analyze_model(model_dir, provider_name)
+                            if model_info:
+                                self.discovered_models.append(model_info)
+                                logger.info(f"Discovered: {model_info.name}")
+            
+            op["models"] = len(self.discovered_models)
         
         logger.info(f"Model discovery complete. Found {len(self.discovered_models)} models.")
         return self.discovered_models
@@ -385,8 +390,7 @@ def main():
     
     args = parser.parse_args()
     
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    setup_logging(level="DEBUG" if args.verbose else None)
     
     # Create model discovery instance
     discovery = ModelDiscovery(args.path)
@@ -15,20 +15,25 @@ import sys
 import json
 import yaml
 import argparse
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, time
 import psutil
 import platform
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Make the NEXUS package importable when run as a standalone script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src"))
+
+from nexus.core.yabai import YabaiError
+from nexus.core.state_cache import shared_client
+from nexus.core.app_readiness import run_blocking
+from nexus.core.command_runner import run_command, shared_runner
+from nexus.core.context_sampler import shared_sampler
+from nexus.core.app_classifier import shared_classifier
+from nexus.utils.logger import log_operation, setup_logging
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -41,6 +46,7 @@ class WorkspaceContext:
     system_load: float
     memory_usage: float
     user_activity: str
+    fresh: Dict[str, bool] = field(default_factory=dict)  # per source: read in the latest sample
 
 @dataclass
 class AIRecommendation:
@@ -67,6 +73,12 @@ class NEXUSEnhancedBridge:
         # Initialize AI components
         self.ai_enabled = self.config.get('ai_enabled', True)
         
+        # YABAI socket client
+        self.yabai = shared_client()
+        
+        # Background workspace sampler (apps, CPU, memory, displays)
+        self.sampler = shared_sampler()
+        
     def _load_config(self) -> Dict[str, Any]:
         """Load NEXUS configuration."""
         config_file = self.configs_dir / "models" / "model_config.yaml"
@@ -86,53 +98,45 @@ class NEXUSEnhancedBridge:
                 profiles.append(profile_file.stem)
         return sorted(profiles)
     
-    def get_workspace_context(self) -> WorkspaceContext:
-        """Get current workspace context."""
-        try:
-            # Get active applications
-            active_apps = self._get_active_apps()
-            
-            # Get current profile (if any)
-            current_profile = self._get_current_profile()
-            
-            # Get display configuration
-            display_config = self._get_display_config()
-            
-            # Get time of day
-            time_of_day = self._get_time_of_day()
-            
-            # Get system metrics
-            system_load = psutil.cpu_percent(interval=1)
-            memory_usage = psutil.virtual_memory().percent
-            
-            # Determine user activity
-            user_activity = self._determine_user_activity(active_apps)
-            
-            return WorkspaceContext(
-                active_apps=active_apps,
-                current_profile=current_profile,
-                display_config=display_config,
-                time_of_day=time_of_day,
-                system_load=system_load,
-                memory_usage=memory_usage,
-                user_activity=user_activity
-            )
-        except Exception as e:
-            logger.error(f"Error getting workspace context: {e}")
-            return WorkspaceContext([], "", {}, "unknown", 0.0, 0.0, "unknown")
-    
-    def _get_active_apps(self) -> List[str]:
-        """Get list of currently active applications."""
-        try:
-            # Use osascript to get frontmost applications
-            cmd = 'osascript -e "tell application \\"System Events\\" to get name of every process whose background only is false"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
-                apps = [app.strip() for app in result.stdout.split(',')]
-                return [app for app in apps if app and len(app) > 0]
-        except Exception as e:
-            logger.warning(f"Error getting active apps: {e}")
-        return []
+    def get_workspace_context(self, max_staleness: Optional[float] = None) -> WorkspaceContext:
+        """
+        Get current workspace context from the background sampler.
+        
+        Args:
+            max_staleness: Maximum acceptable sample age in seconds; by default
+                the latest sample is used however old it is
+        """
+        with log_operation("context_collection", source="bridge") as op:
+            try:
+                sample = self.sampler.latest(max_staleness)
+                active_apps = list(sample.active_apps)
+                
+                # Get current profile (if any)
+                current_profile = self._get_current_profile()
+                
+                # Determine user activity
+                user_activity = self._determine_user_activity(active_apps)
+                
+                op["profile"] = current_profile
+                op["apps"] = len(active_apps)
+                op["sample_age_ms"] = round(sample.age * 1000, 1)
+                op["stale"] = sample.stale_sources
+                
+                return WorkspaceContext(
+                    active_apps=active_apps,
+                    current_profile=current_profile,
+                    display_config={"displays": list(sample.displays), "count": len(sample.displays)},
+                    time_of_day=self._get_time_of_day(),
+                    system_load=sample.cpu_percent,
+                    memory_usage=sample.memory_percent,
+                    user_activity=user_activity,
+                    fresh=dict(sample.fresh)
+                )
+            except Exception as e:
+                logger.error(f"Error getting workspace context: {e}")
+                op["outcome"] = "error"
+                op["error"] = str(e)
+                return WorkspaceContext([], "", {}, "unknown", 0.0, 0.0, "unknown")
     
     def _get_current_profile(self) -> str:
         """Get current workspace profile."""
@@ -140,19 +144,6 @@ class NEXUSEnhancedBridge:
         # For now, return empty string
         return ""
     
-    def _get_display_config(self) -> Dict[str, Any]:
-        """Get current display configuration."""
-        try:
-            # Get YABAI display information
-            cmd = "yabai -m query --displays"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
-                displays = json.loads(result.stdout)
-                return {"displays": displays, "count": len(displays)}
-        except Exception as e:
-            logger.warning(f"Error getting display config: {e}")
-        return {"displays": [], "count": 0}
-    
     def _get_time_of_day(self) -> str:
         """Get time of day category."""
         current_hour = datetime.now().hour
@@ -170,24 +161,7 @@ class NEXUSEnhancedBridge:
         if not active_apps:
             return "idle"
         
-        # Define activity patterns
-        development_apps = {"Cursor", "VS Code", "Xcode", "Terminal", "iTerm"}
-        creative_apps = {"Final Cut Pro", "Logic Pro", "Photoshop", "Illustrator", "Figma"}
-        productivity_apps = {"Slack", "Teams", "Zoom", "Chrome", "Safari"}
-        entertainment_apps = {"Steam", "Discord", "Spotify", "Netflix", "YouTube"}
-        
-        app_set = set(active_apps)
-        
-        if app_set.intersection(development_apps):
-            return "development"
-        elif app_set.intersection(creative_apps):
-            return "creative"
-        elif app_set.intersection(productivity_apps):
-            return "productivity"
-        elif app_set.intersection(entertainment_apps):
-            return "entertainment"
-        else:
-            return "general"
+        return shared_classifier("activity").dominant(active_apps) or "general"
     
     def get_ai_recommendation(self, context: WorkspaceContext) -> AIRecommendation:
         """Get AI-powered workspace recommendation."""
@@ -291,18 +265,18 @@ class NEXUSEnhancedBridge:
     def _launch_productivity_apps(self):
         """Launch productivity applications."""
         apps = ["Cursor", "Chrome", "Slack"]
-        for app in apps:
-            try:
-                subprocess.run(["open", "-a", app], check=True)
+        results = run_blocking(lambda: shared_runner().run_all([["open", "-a", app] for app in apps]))
+        for app, result in zip(apps, results):
+            if result.ok:
                 logger.info(f"Launched {app}")
-            except Exception as e:
-                logger.warning(f"Failed to launch {app}: {e}")
+            else:
+                logger.warning(f"Failed to launch {app}: {result.error}")
     
     def _optimize_for_coding(self):
         """Optimize workspace for coding."""
         try:
             # Set YABAI layout to BSP for coding
-            subprocess.run(["yabai", "-m", "space", "--layout", "bsp"], check=True)
+            self.yabai.request("space", "--layout", "bsp")
             logger.info("Set layout to BSP for coding")
         except Exception as e:
             logger.warning(f"Failed to set layout: {e}")
@@ -311,29 +285,34 @@ class NEXUSEnhancedBridge:
         """Optimize workspace for creative work."""
         try:
             # Set YABAI layout to float for creative work
-            subprocess.run(["yabai", "-m", "space", "--layout", "float"], check=True)
+            self.yabai.request("space", "--layout", "float")
             logger.info("Set layout to float for creative work")
         except Exception as e:
             logger.warning(f"Failed to set layout: {e}")
     
     def _reduce_distractions(self):
         """Reduce workspace distractions."""
-        try:
-            # Hide non-essential apps
-            distracting_apps = ["Chrome", "Safari", "Slack"]
-            for app in distracting_apps:
-                subprocess.run(["osascript", "-e", f'tell application "{app}" to hide'], check=True)
+        # Hide non-essential apps, all at once
+        distracting_apps = ["Chrome", "Safari", "Slack"]
+        results = run_blocking(lambda: shared_runner().run_all(
+            [["osascript", "-e", f'tell application "{app}" to hide'] for app in distracting_apps],
+            name="osascript_hide"
+        ))
+        failed = [app for app, result in zip(distracting_apps, results) if not result.ok]
+        if failed:
+            logger.warning(f"Failed to hide apps: {', '.join(failed)}")
+        else:
             logger.info("Hidden distracting applications")
-        except Exception as e:
-            logger.warning(f"Failed to hide apps: {e}")
     
     def _load_profile(self, profile_name: str) -> bool:
         """Load a workspace profile."""
         try:
             profile_script = self.profiles_dir / f"{profile_name}.sh"
             if profile_script.exists():
-                subprocess.run(["bash", str(profile_script)], check=True)
-                return True
+                result = run_command(["bash", str(profile_script)], name="profile_script", timeout=60)
+                if not result.ok:
+                    logger.error(f"Error loading profile {profile_name}: {result.error}")
+                return result.ok
             else:
                 logger.warning(f"Profile script not found: {profile_script}")
                 return False
@@ -404,26 +383,13 @@ class NEXUSEnhancedBridge:
     def _get_yabai_state(self) -> Dict[str, Any]:
         """Get current YABAI state."""
         try:
-            state = {}
-            
-            # Get spaces
-            result = subprocess.run(["yabai", "-m", "query", "--spaces"], 
-                                  capture_output=True, text=True, check=True)
-            state["spaces"] = json.loads(result.stdout)
-            
-            # Get windows
-            result = subprocess.run(["yabai", "-m", "query", "--windows"], 
-                                  capture_output=True, text=True, check=True)
-            state["windows"] = json.loads(result.stdout)
-            
-            # Get displays
-            result = subprocess.run(["yabai", "-m", "query", "--displays"], 
-                                  capture_output=True, text=True, check=True)
-            state["displays"] = json.loads(result.stdout)
-            
-            return state
+            return {
+                "spaces": self.yabai.query("spaces"),
+                "windows": self.yabai.query("windows"),
+                "displays": self.yabai.query("displays")
+            }
             
-        except Exception as e:
+        except YabaiError as e:
             logger.warning(f"Error getting YABAI state: {e}")
             return {}
     
@@ -505,6 +471,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Log to stderr: several actions print JSON on stdout
+    setup_logging(stream=sys.stderr)
+    
     # Initialize bridge
     bridge = NEXUSEnhancedBridge()
     